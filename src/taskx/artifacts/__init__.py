@@ -1,10 +1,27 @@
 """Deterministic artifact utilities for TaskX orchestration."""
 
-from taskx.artifacts.canonical_json import canonical_dumps, sha256_file, sha256_text, write_json
+from taskx.artifacts.canonical_json import (
+    ascii_canonical_dumps_bytes,
+    ascii_indented_dumps_bytes,
+    canonical_dumps,
+    canonical_dumps_bytes,
+    contains_float,
+    json_loads,
+    sha256_bytes,
+    sha256_file,
+    sha256_text,
+    write_json,
+)
 from taskx.artifacts.writer import write_run_artifacts
 
 __all__ = [
+    "ascii_canonical_dumps_bytes",
+    "ascii_indented_dumps_bytes",
     "canonical_dumps",
+    "canonical_dumps_bytes",
+    "contains_float",
+    "json_loads",
+    "sha256_bytes",
     "sha256_file",
     "sha256_text",
     "write_json",
@@ -4,14 +4,23 @@ from __future__ import annotations
 
 import hashlib
 import json
+import re
 from typing import TYPE_CHECKING, Any
 
+try:
+    import orjson
+except ImportError:  # orjson is an optional accelerator (the ``fast`` extra)
+    orjson = None  # type: ignore[assignment]
+
 if TYPE_CHECKING:
     from pathlib import Path
 
+# orjson parses integers outside the 64-bit range as floats; any run of 19+
+# digits could be one, so such documents take the stdlib parser
+_LONG_DIGITS = re.compile(rb"\d{19}")
 
-def canonical_dumps(obj: Any) -> str:
-    """Serialize a JSON-compatible object with stable canonical formatting."""
+
+def _stdlib_dumps(obj: Any) -> str:
     return json.dumps(
         obj,
         sort_keys=True,
@@ -20,10 +29,113 @@ def canonical_dumps(obj: Any) -> str:
     )
 
 
+def contains_float(obj: Any) -> bool:
+    """Return True if a JSON-compatible object holds a float anywhere.
+
+    orjson writes exponent floats differently from the stdlib (``1e20`` vs
+    ``1e+20``) and turns NaN/Infinity into ``null``, so callers that must
+    produce stdlib-identical bytes only use orjson for float-free payloads.
+    """
+    stack = [obj]
+    while stack:
+        item = stack.pop()
+        if isinstance(item, float):
+            return True
+        if isinstance(item, dict):
+            stack.extend(item.values())
+        elif isinstance(item, list | tuple):
+            stack.extend(item)
+    return False
+
+
+def _matches_ascii_stdlib(raw: bytes) -> bool:
+    """Return True if orjson output equals the stdlib's ``ensure_ascii`` form.
+
+    The stdlib escapes every non-ASCII character and DEL (U+007F); orjson
+    escapes neither, but otherwise agrees byte for byte.
+    """
+    return raw.isascii() and b"\x7f" not in raw
+
+
+def canonical_dumps(obj: Any) -> str:
+    """Serialize a JSON-compatible object with stable canonical formatting."""
+    return canonical_dumps_bytes(obj).decode("utf-8")
+
+
+def canonical_dumps_bytes(obj: Any) -> bytes:
+    """Serialize canonical JSON straight to UTF-8 bytes.
+
+    Uses orjson when installed; its sorted compact output matches the stdlib
+    encoder for str/int/bool/None payloads. Payloads holding floats and objects
+    orjson rejects (non-str keys, oversized ints) use the stdlib path, so the
+    bytes never depend on whether orjson is installed.
+    """
+    if orjson is not None and not contains_float(obj):
+        try:
+            return orjson.dumps(obj, option=orjson.OPT_SORT_KEYS)
+        except TypeError:
+            pass
+    return _stdlib_dumps(obj).encode("utf-8")
+
+
+def ascii_canonical_dumps_bytes(obj: Any) -> bytes:
+    """Serialize exactly as ``json.dumps(obj, sort_keys=True, separators=(",", ":"))``.
+
+    Hashes recorded by older TaskX versions were taken over this ASCII-escaped
+    form. orjson's sorted output is byte-identical whenever it is pure ASCII
+    without DEL and the payload holds no floats, so it is used then; floats,
+    text the stdlib escapes and objects orjson rejects take the stdlib path.
+    """
+    if orjson is not None and not contains_float(obj):
+        try:
+            raw = orjson.dumps(obj, option=orjson.OPT_SORT_KEYS)
+        except TypeError:
+            pass
+        else:
+            if _matches_ascii_stdlib(raw):
+                return raw
+    return json.dumps(obj, sort_keys=True, separators=(",", ":")).encode("ascii")
+
+
+def ascii_indented_dumps_bytes(obj: Any) -> bytes:
+    """Serialize exactly as ``json.dumps(obj, indent=2)``, key order preserved.
+
+    Same orjson guards as ``ascii_canonical_dumps_bytes``, with two-space
+    indentation instead of sorted compact output.
+    """
+    if orjson is not None and not contains_float(obj):
+        try:
+            raw = orjson.dumps(obj, option=orjson.OPT_INDENT_2)
+        except TypeError:
+            pass
+        else:
+            if _matches_ascii_stdlib(raw):
+                return raw
+    return json.dumps(obj, indent=2).encode("ascii")
+
+
+def json_loads(data: str | bytes) -> Any:
+    """Parse JSON text or UTF-8 bytes, using orjson when installed.
+
+    Results match ``json.loads``: documents with 19+ digit runs (possible
+    integers beyond 64 bits) and documents orjson rejects (NaN/Infinity
+    literals) are parsed by the stdlib, which also raises
+    ``json.JSONDecodeError`` for genuinely invalid input.
+    """
+    if orjson is not None:
+        raw = data.encode("utf-8") if isinstance(data, str) else data
+        if not _LONG_DIGITS.search(raw):
+            try:
+                return orjson.loads(raw)
+            except orjson.JSONDecodeError:
+                pass
+    return json.loads(data)
+
+
 def write_json(path: Path, obj: Any) -> None:
     """Write canonical JSON as UTF-8."""
     path.parent.mkdir(parents=True, exist_ok=True)
-    path.write_text(canonical_dumps(obj), encoding="utf-8")
+    path.write_bytes(canonical_dumps_bytes(obj))
 
 
 def sha256_text(text: str) -> str:
@@ -31,6 +143,11 @@ def sha256_text(text: str) -> str:
     return hashlib.sha256(text.encode("utf-8")).hexdigest()
 
 
+def sha256_bytes(data: bytes) -> str:
+    """Compute SHA-256 for raw bytes, skipping the text encode step."""
+    return hashlib.sha256(data).hexdigest()
+
+
 def sha256_file(path: Path) -> str:
     """Compute SHA-256 for file bytes."""
     digest = hashlib.sha256()
@@ -4,7 +4,7 @@ from __future__ import annotations
 
 from typing import TYPE_CHECKING, Any
 
-from taskx.artifacts.canonical_json import sha256_file, write_json
+from taskx.artifacts.canonical_json import canonical_dumps_bytes, sha256_bytes, write_json
 
 if TYPE_CHECKING:
     from pathlib import Path
@@ -20,31 +20,27 @@ def write_run_artifacts(
     stdout_text: str | None,
     stderr_text: str | None,
 ) -> dict[str, Any]:
-    """Write deterministic orchestrator artifacts and return the index payload."""
-    run_dir.mkdir(parents=True, exist_ok=True)
+    """Write deterministic orchestrator artifacts and return the index payload.
 
-    route_plan_path = run_dir / "ROUTE_PLAN.json"
-    write_json(route_plan_path, route_plan)
+    Each artifact is serialized once; the same bytes are written and hashed
+    for the index, so nothing is read back from disk.
+    """
+    run_dir.mkdir(parents=True, exist_ok=True)
 
     report_status = str(report.get("status", "")).strip().lower()
     report_filename = "REFUSAL_REPORT.json" if report_status == "refused" else "RUN_REPORT.json"
-    report_path = run_dir / report_filename
-    write_json(report_path, report)
 
-    artifacts: list[tuple[str, Path]] = [
-        ("ROUTE_PLAN.json", route_plan_path),
-        (report_filename, report_path),
+    artifacts: list[tuple[str, bytes]] = [
+        ("ROUTE_PLAN.json", canonical_dumps_bytes(route_plan)),
+        (report_filename, canonical_dumps_bytes(report)),
     ]
-
     if stdout_text is not None:
-        stdout_path = run_dir / "STDOUT.log"
-        stdout_path.write_text(stdout_text, encoding="utf-8")
-        artifacts.append(("STDOUT.log", stdout_path))
-
+        artifacts.append(("STDOUT.log", stdout_text.encode("utf-8")))
     if stderr_text is not None:
-        stderr_path = run_dir / "STDERR.log"
-        stderr_path.write_text(stderr_text, encoding="utf-8")
-        artifacts.append(("STDERR.log", stderr_path))
+        artifacts.append(("STDERR.log", stderr_text.encode("utf-8")))
+
+    for artifact_name, data in artifacts:
+        (run_dir / artifact_name).write_bytes(data)
 
     index_payload: dict[str, Any] = {
         "schema_version": ARTIFACT_INDEX_SCHEMA_VERSION,
@@ -52,9 +48,9 @@ def write_run_artifacts(
             {
                 "name": artifact_name,
                 "path": artifact_name,
-                "sha256": sha256_file(artifact_path),
+                "sha256": sha256_bytes(data),
             }
-            for artifact_name, artifact_path in artifacts
+            for artifact_name, data in artifacts
         ],
     }
     write_json(run_dir / "ARTIFACT_INDEX.json", index_payload)
@@ -1853,7 +1853,11 @@ def loop(
         help="Timestamp mode: deterministic or wallclock",
     ),
 ) -> None:
-    """Run complete task packet lifecycle loop."""
+    """Run complete task packet lifecycle loop.
+
+    Deterministic stage outputs are cached in .taskx_cache/ beside --out;
+    set TASKX_NO_STAGE_CACHE=1 to disable the cache.
+    """
     _use_compat_options(project_root)
     if not LOOP_AVAILABLE:
         console.print("[bold red]Error:[/bold red] loop module not installed in this TaskX build")
@@ -3027,7 +3031,11 @@ def dopemux_loop(
         help="Timestamp mode: deterministic or wallclock",
     ),
 ) -> None:
-    """Run complete lifecycle loop with Dopemux path conventions."""
+    """Run complete lifecycle loop with Dopemux path conventions.
+
+    Deterministic stage outputs are cached in .taskx_cache/ beside the loop
+    output directory; set TASKX_NO_STAGE_CACHE=1 to disable the cache.
+    """
     _require_dopemux()
     _use_compat_options(project_root)
 
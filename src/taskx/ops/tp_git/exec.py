@@ -28,14 +28,35 @@ class ExecError(RuntimeError):
         self.result = result
 
 
+def _decode(stream: str | bytes | None) -> str:
+    if stream is None:
+        return ""
+    if isinstance(stream, bytes):
+        return stream.decode("utf-8", errors="replace")
+    return stream
+
+
 def run_command(
     argv: list[str],
     *,
     cwd: Path,
     check: bool = True,
+    timeout: float | None = None,
 ) -> ExecResult:
-    """Run command and return structured result."""
-    completed = subprocess.run(argv, cwd=cwd, capture_output=True, text=True, check=False)
+    """Run command and return structured result.
+
+    When ``timeout`` elapses the child is killed and a result with exit code 124
+    (matching coreutils ``timeout``) is returned instead of raising.
+    """
+    try:
+        completed = subprocess.run(argv, cwd=cwd, capture_output=True, text=True, check=False, timeout=timeout)
+    except subprocess.TimeoutExpired as exc:
+        completed = subprocess.CompletedProcess(
+            argv,
+            124,
+            stdout=_decode(exc.stdout),
+            stderr=_decode(exc.stderr) + f"timed out after {timeout}s\n",
+        )
     result = ExecResult(
         argv=tuple(argv),
         cwd=cwd.resolve(),
@@ -3,6 +3,7 @@
 from __future__ import annotations
 
 import json
+import re
 from pathlib import Path
 from typing import Any
 
@@ -10,6 +11,8 @@ from taskx.ops.tp_git.exec import ExecResult, run_command, run_git
 from taskx.ops.tp_git.guards import resolve_repo_root
 from taskx.ops.tp_git.naming import build_worktree_path
 
+_PR_URL_RE = re.compile(r"^https://[^/]+/(?P<owner>[^/]+)/(?P<name>[^/]+)/pull/(?P<number>\d+)")
+
 
 def _ensure_gh_auth(repo_root: Path) -> None:
     auth = run_command(["gh", "auth", "status"], cwd=repo_root, check=False)
@@ -54,6 +57,62 @@ def _gh_pr_view(worktree_path: Path, *, check: bool = True) -> dict[str, Any]:
         raise RuntimeError("gh pr view returned non-JSON output") from exc
 
 
+def _auto_merge_request_from_rest(auto_merge: Any) -> dict[str, Any] | None:
+    """Map the REST ``auto_merge`` object onto ``gh pr view``'s ``autoMergeRequest`` keys.
+
+    REST reports neither the enabling time nor the author email, so those
+    fields are null on this path.
+    """
+    if not isinstance(auto_merge, dict):
+        return None
+    enabled_by = auto_merge.get("enabled_by")
+    return {
+        "authorEmail": None,
+        "commitBody": auto_merge.get("commit_message"),
+        "commitHeadline": auto_merge.get("commit_title"),
+        "enabledAt": None,
+        "enabledBy": {"login": enabled_by.get("login")} if isinstance(enabled_by, dict) else None,
+        "mergeMethod": str(auto_merge.get("merge_method", "")).upper(),
+    }
+
+
+def _open_pr(
+    repo_root: Path,
+    worktree_path: Path,
+    branch: str,
+    *,
+    title: str,
+    body: str | None,
+    body_file: Path | None,
+) -> None:
+    run_git(["-C", str(worktree_path), "push", "-u", "origin", branch], repo_root=repo_root)
+
+    cmd = ["gh", "pr", "create", "--title", title]
+    if body_file is not None:
+        cmd.extend(["--body-file", str(body_file.resolve())])
+    elif body is not None:
+        cmd.extend(["--body", body])
+    created = run_command(cmd, cwd=worktree_path, check=False)
+    if created.returncode != 0:
+        detail = (created.stderr or created.stdout).strip()
+        if "already exists" not in detail.lower():
+            raise RuntimeError(f"gh pr create failed: {detail}")
+
+
+def _enable_auto_merge(worktree_path: Path, mode: str) -> None:
+    merge_cmd = ["gh", "pr", "merge", "--auto", "--delete-branch", f"--{mode}"]
+    merged = run_command(merge_cmd, cwd=worktree_path, check=False)
+    if merged.returncode != 0:
+        detail = (merged.stderr or merged.stdout).strip()
+        instructions = (
+            "Auto-merge could not be enabled. Manual steps:\n"
+            "1) Review repository auto-merge and branch protection settings.\n"
+            f"2) Re-run: gh pr merge --{mode} --delete-branch\n"
+            "3) Confirm with: gh pr view --json url,state,autoMergeRequest,mergeStateStatus"
+        )
+        raise RuntimeError(f"merge failed: {detail}\n{instructions}")
+
+
 def pr_create(
     *,
     tp_id: str,
@@ -69,18 +128,7 @@ def pr_create(
     worktree_path = _worktree_for_tp(repo_root, tp_id)
     branch = _branch_for_worktree(repo_root, worktree_path)
 
-    run_git(["-C", str(worktree_path), "push", "-u", "origin", branch], repo_root=repo_root)
-
-    cmd = ["gh", "pr", "create", "--title", title]
-    if body_file is not None:
-        cmd.extend(["--body-file", str(body_file.resolve())])
-    elif body is not None:
-        cmd.extend(["--body", body])
-    created = run_command(cmd, cwd=worktree_path, check=False)
-    if created.returncode != 0:
-        detail = (created.stderr or created.stdout).strip()
-        if "already exists" not in detail.lower():
-            raise RuntimeError(f"gh pr create failed: {detail}")
+    _open_pr(repo_root, worktree_path, branch, title=title, body=body, body_file=body_file)
 
     viewed = _gh_pr_view(worktree_path)
     viewed.update(
@@ -94,6 +142,48 @@ def pr_create(
     return viewed
 
 
+def pr_create_and_auto_merge(
+    *,
+    tp_id: str,
+    title: str,
+    body: str | None = None,
+    body_file: Path | None = None,
+    repo: Path | None = None,
+    mode: str = "squash",
+) -> dict[str, Any]:
+    """Open PR and enable auto-merge sharing one auth check and one final PR view.
+
+    Returns ``{"pr": ..., "merge": ...}`` shaped like ``pr_create``/``merge_pr``
+    output. When the PR opens but auto-merge cannot be enabled, ``merge`` is
+    replaced by ``merge_error``. Failure to open the PR raises RuntimeError.
+    """
+    if mode not in {"squash", "merge", "rebase"}:
+        raise RuntimeError(f"unsupported merge mode: {mode}")
+
+    repo_root = resolve_repo_root(repo)
+    _ensure_gh_auth(repo_root)
+
+    worktree_path = _worktree_for_tp(repo_root, tp_id)
+    branch = _branch_for_worktree(repo_root, worktree_path)
+
+    _open_pr(repo_root, worktree_path, branch, title=title, body=body, body_file=body_file)
+
+    merge_error: str | None = None
+    try:
+        _enable_auto_merge(worktree_path, mode)
+    except RuntimeError as exc:
+        merge_error = str(exc)
+
+    viewed = _gh_pr_view(worktree_path)
+    common = {"repo_root": str(repo_root), "tp_id": tp_id, "worktree_path": str(worktree_path)}
+    payload: dict[str, Any] = {"pr": {**viewed, **common, "branch": branch}}
+    if merge_error is None:
+        payload["merge"] = {**viewed, **common, "mode": mode}
+    else:
+        payload["merge_error"] = merge_error
+    return payload
+
+
 def pr_status(*, tp_id: str, repo: Path | None = None) -> dict[str, Any]:
     """Return local/worktree status plus PR metadata if available."""
     repo_root = resolve_repo_root(repo)
@@ -117,6 +207,80 @@ def pr_status(*, tp_id: str, repo: Path | None = None) -> dict[str, Any]:
     return payload
 
 
+def pr_poll(
+    *,
+    pr_url: str,
+    repo_root: Path,
+    etag: str | None = None,
+) -> tuple[dict[str, Any] | None, str | None]:
+    """Conditionally fetch PR state from the REST API using ``If-None-Match``.
+
+    Returns ``(None, etag)`` when GitHub answers 304 Not Modified, otherwise a
+    payload shaped like ``gh pr view`` output and the new ETag. Raises
+    RuntimeError when the URL is not a GitHub PR URL or the request fails.
+    """
+    match = _PR_URL_RE.match(pr_url)
+    if match is None:
+        raise RuntimeError(f"unrecognized PR url: {pr_url!r}")
+
+    cmd = ["gh", "api", "--include", f"repos/{match['owner']}/{match['name']}/pulls/{match['number']}"]
+    if etag:
+        cmd.extend(["-H", f"If-None-Match: {etag}"])
+    fetched = run_command(cmd, cwd=repo_root, check=False)
+
+    head, _, body = fetched.stdout.replace("\r\n", "\n").partition("\n\n")
+    head_lines = head.splitlines()
+    status_parts = head_lines[0].split() if head_lines else []
+    status = status_parts[1] if len(status_parts) > 1 else ""
+    new_etag = etag
+    for line in head_lines[1:]:
+        key, _, value = line.partition(":")
+        if key.strip().lower() == "etag":
+            new_etag = value.strip()
+
+    if status == "304":
+        return None, new_etag
+    if fetched.returncode != 0 or status != "200":
+        detail = (fetched.stderr or fetched.stdout).strip()
+        raise RuntimeError(f"gh api pulls failed: {detail}")
+    try:
+        raw = json.loads(body)
+    except json.JSONDecodeError as exc:
+        raise RuntimeError("gh api pulls returned non-JSON output") from exc
+
+    state = "MERGED" if raw.get("merged") else str(raw.get("state", "")).upper()
+    payload = {
+        "url": raw.get("html_url", pr_url),
+        "state": state,
+        "mergeStateStatus": str(raw.get("mergeable_state", "")).upper(),
+        "autoMergeRequest": _auto_merge_request_from_rest(raw.get("auto_merge")),
+    }
+    return payload, new_etag
+
+
+def pr_wait(*, tp_id: str, repo: Path | None = None, timeout_sec: int = 900) -> dict[str, Any]:
+    """Block on ``gh pr checks --watch`` until checks settle, then return PR metadata.
+
+    Raises RuntimeError when gh cannot watch (no checks reported, failing checks,
+    older gh without ``--watch``, or timeout) so callers can fall back to polling.
+    """
+    repo_root = resolve_repo_root(repo)
+    _ensure_gh_auth(repo_root)
+    worktree_path = _worktree_for_tp(repo_root, tp_id)
+
+    watched = run_command(
+        ["gh", "pr", "checks", "--watch", "--fail-fast"],
+        cwd=worktree_path,
+        check=False,
+        timeout=timeout_sec,
+    )
+    if watched.returncode != 0:
+        detail = (watched.stderr or watched.stdout).strip()
+        raise RuntimeError(f"gh pr checks --watch failed: {detail}")
+
+    return _gh_pr_view(worktree_path)
+
+
 def merge_pr(
     *,
     tp_id: str,
@@ -131,17 +295,7 @@ def merge_pr(
     _ensure_gh_auth(repo_root)
     worktree_path = _worktree_for_tp(repo_root, tp_id)
 
-    merge_cmd = ["gh", "pr", "merge", "--auto", "--delete-branch", f"--{mode}"]
-    merged = run_command(merge_cmd, cwd=worktree_path, check=False)
-    if merged.returncode != 0:
-        detail = (merged.stderr or merged.stdout).strip()
-        instructions = (
-            "Auto-merge could not be enabled. Manual steps:\n"
-            "1) Review repository auto-merge and branch protection settings.\n"
-            f"2) Re-run: gh pr merge --{mode} --delete-branch\n"
-            "3) Confirm with: gh pr view --json url,state,autoMergeRequest,mergeStateStatus"
-        )
-        raise RuntimeError(f"merge failed: {detail}\n{instructions}")
+    _enable_auto_merge(worktree_path, mode)
 
     viewed = _gh_pr_view(worktree_path)
     viewed.update(
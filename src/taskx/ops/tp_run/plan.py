@@ -8,17 +8,27 @@ import time
 from dataclasses import dataclass
 from datetime import UTC, datetime
 from pathlib import Path
-from typing import Literal
+from typing import Any, Literal
 
 from taskx.ops.tp_git.exec import run_git
 from taskx.ops.tp_git.git_worktree import cleanup_tp, start_tp, sync_main
-from taskx.ops.tp_git.github import merge_pr, pr_create, pr_status
+from taskx.ops.tp_git.github import (
+    merge_pr,
+    pr_create,
+    pr_create_and_auto_merge,
+    pr_poll,
+    pr_status,
+    pr_wait,
+)
 from taskx.ops.tp_git.guards import run_doctor
 from taskx.ops.tp_git.naming import build_worktree_path, normalize_slug, resolve_target
 from taskx.ops.tp_run.proof import ProofWriter
 
 StopAfter = Literal["doctor", "start", "test", "pr", "merge", "sync", "cleanup"]
 
+_FETCH_STAMP_NAME = "taskx_fetch_stamp"
+_FETCH_FRESH_SEC = 60
+
 
 @dataclass(frozen=True)
 class RunOptions:
@@ -50,42 +60,101 @@ class RunResult:
     merged_confirmed: bool = False
 
 
+def _now_iso() -> str:
+    return datetime.now(UTC).isoformat()
+
+
+def _fetch_stamp_path(repo_root: Path) -> Path | None:
+    git_dir = repo_root / ".git"
+    return git_dir / _FETCH_STAMP_NAME if git_dir.is_dir() else None
+
+
+def _fetch_is_fresh(stamp: Path | None) -> bool:
+    if stamp is None:
+        return False
+    try:
+        return time.time() - stamp.stat().st_mtime < _FETCH_FRESH_SEC
+    except OSError:
+        return False
+
+
 def _capture_precheck(repo_root: Path) -> str:
     lines: list[str] = []
-    checks = [
-        ["rev-parse", "--abbrev-ref", "HEAD"],
-        ["status", "--porcelain"],
-        ["stash", "list"],
-        ["fetch", "--all", "--prune"],
-        ["pull", "--ff-only"],
+    stamp = _fetch_stamp_path(repo_root)
+    # One config read answers both "is there a remote" and "is origin a partial clone".
+    remote_config = run_git(["config", "--get-regexp", r"^remote\."], repo_root=repo_root, check=False).stdout
+    remote_keys = dict(line.partition(" ")[::2] for line in remote_config.splitlines())
+    has_remote = any(key.endswith(".url") for key in remote_keys)
+    fetch_args = ["fetch", "--all", "--prune"]
+    if remote_keys.get("remote.origin.promisor", "").strip().lower() == "true":
+        # Refs are enough to decide ff-only; blobs arrive lazily on checkout.
+        fetch_args = ["-c", "protocol.version=2", *fetch_args, "--filter=blob:none"]
+    fetch_skip: str | None = None
+    pull_skip: str | None = None
+    if not has_remote:
+        fetch_skip = pull_skip = "no remote"
+    elif _fetch_is_fresh(stamp):
+        fetch_skip = f"fetched <{_FETCH_FRESH_SEC}s ago"
+
+    checks: list[tuple[list[str], str | None]] = [
+        (["rev-parse", "--abbrev-ref", "HEAD"], None),
+        (["status", "--porcelain"], None),
+        (["stash", "list"], None),
+        (fetch_args, fetch_skip),
+        (["pull", "--ff-only"], pull_skip),
     ]
-    for args in checks:
+    for args, skip_reason in checks:
         rendered = "git " + " ".join(args)
-        result = run_git(args, repo_root=repo_root, check=False)
         lines.append(f"$ {rendered}")
+        if skip_reason is not None:
+            lines.append(f"[skipped: {skip_reason}]")
+            lines.append("")
+            continue
+        result = run_git(args, repo_root=repo_root, check=False)
         lines.append(result.stdout.rstrip())
         if result.stderr.strip():
             lines.append(result.stderr.rstrip())
         lines.append(f"[exit={result.returncode}]")
         lines.append("")
+        if args is fetch_args and result.returncode == 0 and stamp is not None:
+            stamp.touch()
     return "\n".join(lines).rstrip() + "\n"
 
 
+def _run_test_cmd(argv: list[str], *, cwd: Path) -> subprocess.CompletedProcess[str]:
+    # env is left as None so the child inherits os.environ without rebuilding an
+    # environment block. close_fds=False skips the per-spawn descriptor sweep;
+    # tp run keeps no descriptors open that the test command could misuse.
+    with subprocess.Popen(
+        argv,
+        cwd=cwd,
+        stdout=subprocess.PIPE,
+        stderr=subprocess.PIPE,
+        text=True,
+        bufsize=-1,
+        close_fds=False,
+    ) as proc:
+        stdout, stderr = proc.communicate()
+    return subprocess.CompletedProcess(argv, proc.returncode, stdout, stderr)
+
+
+_BANNER_HEAD = "Task Packet work banner"
+_BANNER_TAIL = (
+    "Do work in this worktree. Commit per TP commit plan.",
+    "Then rerun `taskx tp run ... --continue` or use `taskx tp git pr/merge`.",
+    "",
+)
+
+
 def _render_banner(*, worktree_path: Path, branch: str) -> str:
-    return (
-        "Task Packet work banner\n"
-        f"- worktree: {worktree_path}\n"
-        f"- branch: {branch}\n"
-        "Do work in this worktree. Commit per TP commit plan.\n"
-        "Then rerun `taskx tp run ... --continue` or use `taskx tp git pr/merge`.\n"
-    )
+    return "\n".join((_BANNER_HEAD, f"- worktree: {worktree_path}", f"- branch: {branch}", *_BANNER_TAIL))
 
 
 def execute_run(options: RunOptions, writer: ProofWriter) -> RunResult:
     """Execute deterministic tp run stages up through start/banner."""
     repo_root = options.repo_root
     normalized_slug = normalize_slug(options.slug)
-    started_at = datetime.now(UTC).isoformat()
+    started_at = _now_iso()
 
     writer.write_text("PRECHECK.txt", _capture_precheck(repo_root))
 
@@ -93,62 +162,77 @@ def execute_run(options: RunOptions, writer: ProofWriter) -> RunResult:
         try:
             doctor = run_doctor(repo=repo_root)
         except RuntimeError as exc:
-            writer.write_json(
-                "EXIT.json",
-                {"exit_code": 1, "reason": str(exc), "stage": "doctor", "run_id": options.run_id},
-            )
-            writer.write_json(
-                "RUN.json",
-                {
-                    "tp_id": options.tp_id,
-                    "slug": normalized_slug,
-                    "run_id": options.run_id,
-                    "repo_root": str(repo_root),
-                    "branch": None,
-                    "worktree_path": None,
-                    "start_time": started_at,
-                    "end_time": datetime.now(UTC).isoformat(),
-                },
+            end_time = _now_iso()
+            writer.write_batch(
+                [
+                    (
+                        "EXIT.json",
+                        {"exit_code": 1, "reason": str(exc), "stage": "doctor", "run_id": options.run_id},
+                    ),
+                    (
+                        "RUN.json",
+                        {
+                            "tp_id": options.tp_id,
+                            "slug": normalized_slug,
+                            "run_id": options.run_id,
+                            "repo_root": str(repo_root),
+                            "branch": None,
+                            "worktree_path": None,
+                            "start_time": started_at,
+                            "end_time": end_time,
+                        },
+                    ),
+                ]
             )
             return RunResult(exit_code=1, message=str(exc), branch=None, worktree_path=None)
 
         if options.stop_after == "doctor":
-            writer.write_json("EXIT.json", {"exit_code": 0, "reason": "stopped after doctor", "run_id": options.run_id})
-            writer.write_json(
-                "RUN.json",
-                {
-                    "tp_id": options.tp_id,
-                    "slug": normalized_slug,
-                    "run_id": options.run_id,
-                    "repo_root": str(repo_root),
-                    "branch": None,
-                    "worktree_path": None,
-                    "start_time": started_at,
-                    "end_time": datetime.now(UTC).isoformat(),
-                    "doctor_branch": doctor.branch,
-                },
+            end_time = _now_iso()
+            writer.write_batch(
+                [
+                    ("EXIT.json", {"exit_code": 0, "reason": "stopped after doctor", "run_id": options.run_id}),
+                    (
+                        "RUN.json",
+                        {
+                            "tp_id": options.tp_id,
+                            "slug": normalized_slug,
+                            "run_id": options.run_id,
+                            "repo_root": str(repo_root),
+                            "branch": None,
+                            "worktree_path": None,
+                            "start_time": started_at,
+                            "end_time": end_time,
+                            "doctor_branch": doctor.branch,
+                        },
+                    ),
+                ]
             )
             return RunResult(exit_code=0, message="stopped after doctor", branch=None, worktree_path=None)
 
         try:
             started = start_tp(tp_id=options.tp_id, slug=normalized_slug, repo=repo_root, reuse=False)
         except RuntimeError as exc:
-            writer.write_json(
-                "EXIT.json",
-                {"exit_code": 1, "reason": str(exc), "stage": "start", "run_id": options.run_id},
-            )
-            writer.write_json(
-                "RUN.json",
-                {
-                    "tp_id": options.tp_id,
-                    "slug": normalized_slug,
-                    "run_id": options.run_id,
-                    "repo_root": str(repo_root),
-                    "branch": None,
-                    "worktree_path": None,
-                    "start_time": started_at,
-                    "end_time": datetime.now(UTC).isoformat(),
-                },
+            end_time = _now_iso()
+            writer.write_batch(
+                [
+                    (
+                        "EXIT.json",
+                        {"exit_code": 1, "reason": str(exc), "stage": "start", "run_id": options.run_id},
+                    ),
+                    (
+                        "RUN.json",
+                        {
+                            "tp_id": options.tp_id,
+                            "slug": normalized_slug,
+                            "run_id": options.run_id,
+                            "repo_root": str(repo_root),
+                            "branch": None,
+                            "worktree_path": None,
+                            "start_time": started_at,
+                            "end_time": end_time,
+                        },
+                    ),
+                ]
             )
             return RunResult(exit_code=1, message=str(exc), branch=None, worktree_path=None)
 
@@ -159,50 +243,63 @@ def execute_run(options: RunOptions, writer: ProofWriter) -> RunResult:
         worktree_path = build_worktree_path(repo_root, options.tp_id)
         branch = target.branch
 
-    worktree_listing = run_git(["worktree", "list"], repo_root=repo_root, check=False).stdout
-    writer.write_text("WORKTREE.txt", worktree_listing)
+    main_before = run_git(["rev-parse", "HEAD"], repo_root=repo_root).stdout.strip()
+    worktree_head = run_git(["-C", str(worktree_path), "rev-parse", "HEAD"], repo_root=repo_root).stdout.strip()
 
-    status_before = run_git(["-C", str(worktree_path), "status", "--porcelain"], repo_root=repo_root, check=False)
-    writer.write_text("STATUS_BEFORE.txt", status_before.stdout)
+    if options.stop_after == "start":
+        # Only this TP's worktree matters when stopping here; render its line directly.
+        worktree_listing = f"{worktree_path}  {worktree_head[:7]} [{branch}]\n"
+    else:
+        worktree_listing = run_git(["worktree", "list"], repo_root=repo_root, check=False).stdout
 
+    status_before = run_git(["-C", str(worktree_path), "status", "--porcelain"], repo_root=repo_root, check=False)
     banner = _render_banner(worktree_path=worktree_path, branch=branch)
-    writer.write_text("BANNER.txt", banner)
 
-    writer.write_json(
-        "RUN.json",
-        {
-            "tp_id": options.tp_id,
-            "slug": normalized_slug,
-            "run_id": options.run_id,
-            "repo_root": str(repo_root),
-            "branch": branch,
-            "worktree_path": str(worktree_path),
-            "start_time": started_at,
-            "end_time": datetime.now(UTC).isoformat(),
-            "git_shas": {
-                "main_before": run_git(["rev-parse", "HEAD"], repo_root=repo_root).stdout.strip(),
-                "worktree_head": run_git(["-C", str(worktree_path), "rev-parse", "HEAD"], repo_root=repo_root).stdout.strip(),
+    end_time = _now_iso()
+    start_artifacts: list[tuple[str, str | dict[str, Any]]] = [
+        ("WORKTREE.txt", worktree_listing),
+        ("STATUS_BEFORE.txt", status_before.stdout),
+        ("BANNER.txt", banner),
+        (
+            "RUN.json",
+            {
+                "tp_id": options.tp_id,
+                "slug": normalized_slug,
+                "run_id": options.run_id,
+                "repo_root": str(repo_root),
+                "branch": branch,
+                "worktree_path": str(worktree_path),
+                "start_time": started_at,
+                "end_time": end_time,
+                "git_shas": {
+                    "main_before": main_before,
+                    "worktree_head": worktree_head,
+                },
             },
-        },
-    )
+        ),
+    ]
+    if options.stop_after == "start":
+        start_artifacts.append(
+            ("EXIT.json", {"exit_code": 0, "reason": "stopped after start", "run_id": options.run_id})
+        )
+    writer.write_batch(start_artifacts)
 
     if options.stop_after == "start":
-        writer.write_json("EXIT.json", {"exit_code": 0, "reason": "stopped after start", "run_id": options.run_id})
         return RunResult(exit_code=0, message=banner, branch=branch, worktree_path=worktree_path)
 
     if options.test_cmd:
         argv = shlex.split(options.test_cmd)
-        completed = subprocess.run(argv, cwd=worktree_path, capture_output=True, text=True, check=False)
+        completed = _run_test_cmd(argv, cwd=worktree_path)
         tests_log = (
             f"$ {options.test_cmd}\n"
             f"{completed.stdout}"
             f"{completed.stderr}"
             f"\n[exit={completed.returncode}]\n"
         )
-        writer.write_text("TESTS.txt", tests_log)
         if completed.returncode != 0:
-            writer.write_json(
-                "EXIT.json",
+            writer.write_with_exit(
+                "TESTS.txt",
+                tests_log,
                 {
                     "exit_code": completed.returncode,
                     "reason": "test command failed",
@@ -217,8 +314,13 @@ def execute_run(options: RunOptions, writer: ProofWriter) -> RunResult:
                 worktree_path=worktree_path,
             )
         if options.stop_after == "test":
-            writer.write_json("EXIT.json", {"exit_code": 0, "reason": "stopped after test", "run_id": options.run_id})
+            writer.write_with_exit(
+                "TESTS.txt",
+                tests_log,
+                {"exit_code": 0, "reason": "stopped after test", "run_id": options.run_id},
+            )
             return RunResult(exit_code=0, message="stopped after test", branch=branch, worktree_path=worktree_path)
+        writer.write_text("TESTS.txt", tests_log)
 
     title = options.pr_title or f"{options.tp_id}: {normalized_slug}"
     body = options.pr_body or (
@@ -227,14 +329,27 @@ def execute_run(options: RunOptions, writer: ProofWriter) -> RunResult:
         f"- proof_dir: {writer.paths.run_dir}\n"
         "- checklist: tests passed, PR opened by taskx tp run\n"
     )
+    # Open the PR and enable auto-merge in one pass unless the run stops at the PR.
+    combined: dict[str, Any] | None = None
     try:
-        pr_payload = pr_create(
-            tp_id=options.tp_id,
-            title=title,
-            body=body if options.pr_body_file is None else None,
-            body_file=options.pr_body_file,
-            repo=repo_root,
-        )
+        if options.merge_enabled and options.stop_after != "pr":
+            combined = pr_create_and_auto_merge(
+                tp_id=options.tp_id,
+                title=title,
+                body=body if options.pr_body_file is None else None,
+                body_file=options.pr_body_file,
+                repo=repo_root,
+                mode="squash",
+            )
+            pr_payload = combined["pr"]
+        else:
+            pr_payload = pr_create(
+                tp_id=options.tp_id,
+                title=title,
+                body=body if options.pr_body_file is None else None,
+                body_file=options.pr_body_file,
+                repo=repo_root,
+            )
     except RuntimeError as exc:
         writer.write_json(
             "EXIT.json",
@@ -242,28 +357,40 @@ def execute_run(options: RunOptions, writer: ProofWriter) -> RunResult:
         )
         return RunResult(exit_code=1, message=str(exc), branch=branch, worktree_path=worktree_path)
 
-    writer.write_json("PR.json", pr_payload)
     if options.stop_after == "pr":
-        writer.write_json("EXIT.json", {"exit_code": 0, "reason": "stopped after pr", "run_id": options.run_id})
+        writer.write_with_exit(
+            "PR.json",
+            pr_payload,
+            {"exit_code": 0, "reason": "stopped after pr", "run_id": options.run_id},
+        )
         return RunResult(exit_code=0, message="stopped after pr", branch=branch, worktree_path=worktree_path)
+    writer.write_json("PR.json", pr_payload)
 
     merged_confirmed = str(pr_payload.get("state", "")).upper() == "MERGED"
-    merge_payload: dict[str, object] | None = None
     if options.merge_enabled:
+        merge_payload: dict[str, Any]
         try:
-            merge_payload = merge_pr(tp_id=options.tp_id, mode="squash", repo=repo_root)
+            if combined is None:
+                merge_payload = merge_pr(tp_id=options.tp_id, mode="squash", repo=repo_root)
+            elif "merge_error" in combined:
+                raise RuntimeError(combined["merge_error"])
+            else:
+                merge_payload = combined["merge"]
         except RuntimeError as exc:
-            writer.write_json(
-                "EXIT.json",
+            writer.write_with_exit(
+                "MERGE.json",
+                {"error": str(exc), "run_id": options.run_id},
                 {"exit_code": 1, "reason": str(exc), "stage": "merge", "run_id": options.run_id},
             )
-            writer.write_json("MERGE.json", {"error": str(exc), "run_id": options.run_id})
             return RunResult(exit_code=1, message=str(exc), branch=branch, worktree_path=worktree_path)
 
-        writer.write_json("MERGE.json", merge_payload)
         merged_confirmed = str(merge_payload.get("state", "")).upper() == "MERGED"
         if options.stop_after == "merge":
-            writer.write_json("EXIT.json", {"exit_code": 0, "reason": "stopped after merge", "run_id": options.run_id})
+            writer.write_with_exit(
+                "MERGE.json",
+                merge_payload,
+                {"exit_code": 0, "reason": "stopped after merge", "run_id": options.run_id},
+            )
             return RunResult(
                 exit_code=0,
                 message="stopped after merge",
@@ -271,12 +398,30 @@ def execute_run(options: RunOptions, writer: ProofWriter) -> RunResult:
                 worktree_path=worktree_path,
                 merged_confirmed=merged_confirmed,
             )
+        writer.write_json("MERGE.json", merge_payload)
 
     if options.wait_merge:
         deadline = time.time() + options.wait_timeout_sec
-        while time.time() < deadline:
-            status_payload = pr_status(tp_id=options.tp_id, repo=repo_root)
-            pr_obj = status_payload.get("pr")
+        watched_pr: dict[str, Any] | None = None
+        # A PR already reported merged has nothing left to watch.
+        if not merged_confirmed:
+            try:
+                watched_pr = pr_wait(tp_id=options.tp_id, repo=repo_root, timeout_sec=options.wait_timeout_sec)
+            except RuntimeError:
+                watched_pr = None
+        if watched_pr is not None:
+            writer.write_json("PR.json", watched_pr)
+            merged_confirmed = str(watched_pr.get("state", "")).upper() == "MERGED"
+
+        # Auto-merge lands shortly after checks settle; poll only for the remainder.
+        # Conditional requests answer 304 (pr_obj None) while nothing has changed.
+        pr_url = str((watched_pr or pr_payload).get("url", ""))
+        etag: str | None = None
+        while not merged_confirmed and time.time() < deadline:
+            try:
+                pr_obj, etag = pr_poll(pr_url=pr_url, repo_root=repo_root, etag=etag)
+            except RuntimeError:
+                pr_obj = pr_status(tp_id=options.tp_id, repo=repo_root).get("pr")
             if isinstance(pr_obj, dict):
                 state = str(pr_obj.get("state", "")).upper()
                 writer.write_json("PR.json", pr_obj)
@@ -322,16 +467,17 @@ def execute_run(options: RunOptions, writer: ProofWriter) -> RunResult:
         )
 
     sync_payload = sync_main(repo=repo_root)
-    writer.write_text(
-        "SYNC_MAIN.txt",
-        (
-            f"repo_root={sync_payload['repo_root']}\n"
-            f"fetch={sync_payload['fetch']}\n"
-            f"pull={sync_payload['pull']}\n"
-        ),
+    sync_text = (
+        f"repo_root={sync_payload['repo_root']}\n"
+        f"fetch={sync_payload['fetch']}\n"
+        f"pull={sync_payload['pull']}\n"
     )
     if options.stop_after == "sync":
-        writer.write_json("EXIT.json", {"exit_code": 0, "reason": "stopped after sync", "run_id": options.run_id})
+        writer.write_with_exit(
+            "SYNC_MAIN.txt",
+            sync_text,
+            {"exit_code": 0, "reason": "stopped after sync", "run_id": options.run_id},
+        )
         return RunResult(
             exit_code=0,
             message="stopped after sync",
@@ -339,19 +485,22 @@ def execute_run(options: RunOptions, writer: ProofWriter) -> RunResult:
             worktree_path=worktree_path,
             merged_confirmed=True,
         )
+    writer.write_text("SYNC_MAIN.txt", sync_text)
 
     cleanup_payload = cleanup_tp(tp_id=options.tp_id, repo=repo_root)
-    writer.write_text(
-        "CLEANUP.txt",
-        (
-            f"repo_root={cleanup_payload['repo_root']}\n"
-            f"worktree_path={cleanup_payload['worktree_path']}\n"
-            f"remove={cleanup_payload['remove']}\n"
-            f"prune={cleanup_payload['prune']}\n"
-        ),
+    cleanup_text = (
+        f"repo_root={cleanup_payload['repo_root']}\n"
+        f"worktree_path={cleanup_payload['worktree_path']}\n"
+        f"remove={cleanup_payload['remove']}\n"
+        f"prune={cleanup_payload['prune']}\n"
     )
+    # Cleanup is the last stage, so its receipt always pairs with the final EXIT.json.
     if options.stop_after == "cleanup":
-        writer.write_json("EXIT.json", {"exit_code": 0, "reason": "stopped after cleanup", "run_id": options.run_id})
+        writer.write_with_exit(
+            "CLEANUP.txt",
+            cleanup_text,
+            {"exit_code": 0, "reason": "stopped after cleanup", "run_id": options.run_id},
+        )
         return RunResult(
             exit_code=0,
             message="stopped after cleanup",
@@ -360,8 +509,9 @@ def execute_run(options: RunOptions, writer: ProofWriter) -> RunResult:
             merged_confirmed=True,
         )
 
-    writer.write_json(
-        "EXIT.json",
+    writer.write_with_exit(
+        "CLEANUP.txt",
+        cleanup_text,
         {
             "exit_code": 0,
             "reason": "run completed",
@@ -2,12 +2,13 @@
 
 from __future__ import annotations
 
+import os
 from dataclasses import dataclass
 from datetime import UTC, datetime
 from pathlib import Path
 from typing import Any
 
-from taskx.artifacts.canonical_json import write_json
+from taskx.artifacts.canonical_json import canonical_dumps_bytes, write_json
 from taskx.ops.tp_git.exec import run_git
 
 
@@ -61,3 +62,38 @@ class ProofWriter:
         target = self.paths.run_dir / name
         write_json(target, obj)
         return target
+
+    def write_batch(self, entries: list[tuple[str, str | dict[str, Any]]]) -> list[Path]:
+        """Write several top-level artifacts through one open directory handle.
+
+        ``str`` values are written as UTF-8 text and ``dict`` values as canonical
+        JSON. Names must be plain file names inside the run directory.
+        """
+        run_dir = self.paths.run_dir
+        payloads = [
+            (name, content.encode("utf-8") if isinstance(content, str) else canonical_dumps_bytes(content))
+            for name, content in entries
+        ]
+        if os.open not in os.supports_dir_fd:
+            for name, data in payloads:
+                (run_dir / name).write_bytes(data)
+            return [run_dir / name for name, _ in payloads]
+
+        dir_fd = os.open(run_dir, os.O_RDONLY | getattr(os, "O_DIRECTORY", 0))
+        try:
+            for name, data in payloads:
+                fd = os.open(name, os.O_WRONLY | os.O_CREAT | os.O_TRUNC, 0o666, dir_fd=dir_fd)
+                try:
+                    view = memoryview(data)
+                    while view:
+                        view = view[os.write(fd, view) :]
+                finally:
+                    os.close(fd)
+        finally:
+            os.close(dir_fd)
+        return [run_dir / name for name, _ in payloads]
+
+    def write_with_exit(self, name: str, content: str | dict[str, Any], exit_payload: dict[str, Any]) -> Path:
+        """Write a stage artifact together with ``EXIT.json`` in one batch."""
+        target, _ = self.write_batch([(name, content), ("EXIT.json", exit_payload)])
+        return target
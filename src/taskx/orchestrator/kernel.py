@@ -2,18 +2,47 @@
 
 from __future__ import annotations
 
+import functools
 import json
+import os
 import re
 from pathlib import Path
-from typing import Any
-
-from taskx.artifacts import canonical_dumps, sha256_text, write_run_artifacts
+from typing import TYPE_CHECKING, Any
+
+from taskx.artifacts import (
+    canonical_dumps_bytes,
+    json_loads,
+    sha256_bytes,
+    sha256_text,
+    write_run_artifacts,
+)
 from taskx.orchestrator.handoff import build_handoff_chunks, render_handoff_chunks
 from taskx.router import build_route_plan, route_plan_to_dict
 from taskx.router.availability import availability_path_for_repo, default_route_policy
 from taskx.runners import RUNNER_ADAPTERS
 from taskx.utils.repo import find_taskx_repo_root
 
+if TYPE_CHECKING:
+    from taskx.router.types import RoutePolicy
+
+_TASK_ID_UNSAFE_RE = re.compile(r"[^A-Za-z0-9._-]+")
+_STEP_TOKEN_UNSAFE_RE = re.compile(r"[^A-Za-z0-9]+")
+
+
+@functools.lru_cache(maxsize=256)
+def _cached_repo_root(packet_dir: Path) -> Path | None:
+    """Memoized repo root lookup keyed on the resolved packet directory.
+
+    Batch orchestration of packets under one repo walks upward once. Call
+    ``_cached_repo_root.cache_clear()`` to drop stale results.
+    """
+    return find_taskx_repo_root(packet_dir)
+
+
+@functools.lru_cache(maxsize=256)
+def _cached_availability_path(repo_root: Path) -> Path:
+    return availability_path_for_repo(repo_root)
+
 
 def orchestrate(packet_path: str) -> dict[str, Any]:
     """
@@ -25,10 +54,10 @@ def orchestrate(packet_path: str) -> dict[str, Any]:
       - artifacts: dict (from ARTIFACT_INDEX)
     """
     packet_file = Path(packet_path).expanduser().resolve()
-    repo_root = find_taskx_repo_root(packet_file.parent) or Path.cwd().resolve()
+    repo_root = _cached_repo_root(packet_file.parent) or Path.cwd().resolve()
 
     try:
-        raw_packet = _read_packet_text(packet_file)
+        raw_packet = _read_packet_bytes(packet_file)
     except OSError as exc:
         packet_sha16 = sha256_text(str(packet_file))[:16]
         run_dir = _deterministic_run_dir(
@@ -42,8 +71,8 @@ def orchestrate(packet_path: str) -> dict[str, Any]:
             reason=f"Packet read error: {exc}",
         )
         route_plan["run_dir"] = str(run_dir)
-        route_plan["handoff_chunks"] = build_handoff_chunks({}, route_plan)
-        report = {
+        route_plan["handoff_chunks"] = []  # refusal plans carry no steps to hand off
+        report: dict[str, Any] = {
             "status": "refused",
             "reason_code": "PACKET_READ_ERROR",
             "message": "Packet could not be read",
@@ -66,7 +95,8 @@ def orchestrate(packet_path: str) -> dict[str, Any]:
     packet, packet_error = _parse_packet_json(raw_packet)
 
     if packet is None:
-        packet_sha16 = sha256_text(raw_packet)[:16]
+        # Unparseable packets have no canonical form; key them on the on-disk bytes
+        packet_sha16 = sha256_bytes(raw_packet)[:16]
         run_dir = _deterministic_run_dir(
             repo_root=repo_root,
             task_id=_normalize_task_id(packet_file.stem),
@@ -78,7 +108,7 @@ def orchestrate(packet_path: str) -> dict[str, Any]:
             reason=f"Invalid packet JSON: {packet_error}",
         )
         route_plan["run_dir"] = str(run_dir)
-        route_plan["handoff_chunks"] = build_handoff_chunks({}, route_plan)
+        route_plan["handoff_chunks"] = []  # refusal plans carry no steps to hand off
         report = {
             "status": "refused",
             "reason_code": "INVALID_PACKET_JSON",
@@ -99,7 +129,9 @@ def orchestrate(packet_path: str) -> dict[str, Any]:
             "reason": "INVALID_PACKET_JSON",
         }
 
-    packet_sha16 = sha256_text(canonical_dumps(packet))[:16]
+    # Parsed packets are keyed on their canonical JSON, so whitespace and key
+    # order in the file do not move the run directory
+    packet_sha16 = sha256_bytes(canonical_dumps_bytes(packet))[:16]
     task_id = _normalize_task_id(_packet_task_id(packet, fallback=packet_file.stem))
 
     planned = build_route_plan(
@@ -108,6 +140,7 @@ def orchestrate(packet_path: str) -> dict[str, Any]:
         steps=_packet_steps(packet),
     )
     route_plan = route_plan_to_dict(planned)
+    steps = _route_steps(route_plan)
 
     run_dir = _deterministic_run_dir(repo_root=repo_root, task_id=task_id, packet_sha16=packet_sha16)
     route_plan["run_dir"] = str(run_dir)
@@ -158,7 +191,7 @@ def orchestrate(packet_path: str) -> dict[str, Any]:
         }
 
     if execution_mode == "manual":
-        next_step = _first_incomplete_step(route_plan, run_dir)
+        next_step = _first_incomplete_step(steps, run_dir)
         if next_step is not None:
             chunks = route_plan.get("handoff_chunks", [])
             handoff_stdout = render_handoff_chunks(chunks)
@@ -166,7 +199,7 @@ def orchestrate(packet_path: str) -> dict[str, Any]:
                 "status": "needs_handoff",
                 "next_step": next_step,
                 "message": "Manual handoff required",
-                "handoff_chunks_sha256": sha256_text(canonical_dumps(chunks)),
+                "handoff_chunks_sha256": sha256_bytes(canonical_dumps_bytes(chunks)),
             }
             artifacts = write_run_artifacts(
                 run_dir,
@@ -185,9 +218,9 @@ def orchestrate(packet_path: str) -> dict[str, Any]:
         report = {
             "status": "ok",
             "message": "Manual handoff complete",
-            "runner_id": None,  # type: ignore[dict-item]
-            "model_id": None,  # type: ignore[dict-item]
-            "step": None,  # type: ignore[dict-item]
+            "runner_id": None,
+            "model_id": None,
+            "step": None,
             "outputs": [],
         }
         artifacts = write_run_artifacts(
@@ -199,7 +232,7 @@ def orchestrate(packet_path: str) -> dict[str, Any]:
         )
         return {"status": "ok", "run_dir": str(run_dir), "artifacts": artifacts}
 
-    selected_step = _select_single_step(route_plan)
+    selected_step = _select_single_step(steps)
     if selected_step is None:
         report = {
             "status": "refused",
@@ -229,9 +262,9 @@ def orchestrate(packet_path: str) -> dict[str, Any]:
             "reason_code": "UNKNOWN_RUNNER",
             "message": f"Unknown runner: {runner_id}",
             "reasons": [f"Unknown runner: {runner_id}"],
-            "runner_id": runner_id,  # type: ignore[dict-item]
-            "model_id": selected_step.get("model"),  # type: ignore[dict-item]
-            "step": selected_step.get("step"),  # type: ignore[dict-item]
+            "runner_id": runner_id,
+            "model_id": selected_step.get("model"),
+            "step": selected_step.get("step"),
         }
         artifacts = write_run_artifacts(
             run_dir,
@@ -258,10 +291,10 @@ def orchestrate(packet_path: str) -> dict[str, Any]:
 
     report = {
         "status": status,
-        "runner_id": normalized.get("runner_id", runner_id),  # type: ignore[dict-item]
-        "model_id": normalized.get("model_id", selected_step.get("model")),  # type: ignore[dict-item]
-        "step": normalized.get("step", selected_step.get("step")),  # type: ignore[dict-item]
-        "reason_code": normalized.get("reason_code"),  # type: ignore[dict-item]
+        "runner_id": normalized.get("runner_id", runner_id),
+        "model_id": normalized.get("model_id", selected_step.get("model")),
+        "step": normalized.get("step", selected_step.get("step")),
+        "reason_code": normalized.get("reason_code"),
         "outputs": list(normalized.get("outputs", [])),
     }
 
@@ -284,14 +317,14 @@ def orchestrate(packet_path: str) -> dict[str, Any]:
     return outcome
 
 
-def _read_packet_text(packet_path: Path) -> str:
-    return packet_path.read_text(encoding="utf-8")
+def _read_packet_bytes(packet_path: Path) -> bytes:
+    return packet_path.read_bytes()
 
 
-def _parse_packet_json(raw_packet: str) -> tuple[dict[str, Any] | None, str | None]:
+def _parse_packet_json(raw_packet: bytes) -> tuple[dict[str, Any] | None, str | None]:
     try:
-        payload = json.loads(raw_packet)
-    except json.JSONDecodeError as exc:
+        payload = json_loads(raw_packet)
+    except (json.JSONDecodeError, UnicodeDecodeError) as exc:
         return None, str(exc)
 
     if not isinstance(payload, dict):
@@ -335,27 +368,32 @@ def _packet_steps(packet: dict[str, Any]) -> tuple[str, ...] | None:
     return tuple(parsed) if parsed else None
 
 
+@functools.lru_cache(maxsize=1024)
 def _normalize_task_id(value: str) -> str:
-    cleaned = re.sub(r"[^A-Za-z0-9._-]+", "_", value.strip())
+    cleaned = _TASK_ID_UNSAFE_RE.sub("_", value.strip())
     cleaned = cleaned.strip("_")
     return cleaned or "task"
 
 
+def _policy_dict(policy: RoutePolicy) -> dict[str, Any]:
+    return {
+        "require_explain": policy.require_explain,
+        "stop_on_ambiguity": policy.stop_on_ambiguity,
+        "max_cost_tier": policy.max_cost_tier,
+        "escalation_ladder": list(policy.escalation_ladder),
+        "max_escalations": policy.max_escalations,
+        "min_total_score": policy.min_total_score,
+    }
+
+
 def _packet_refusal_route_plan(*, repo_root: Path, packet_path: Path, reason: str) -> dict[str, Any]:
-    policy = default_route_policy()
     return {
         "status": "refused",
         "repo_root": str(repo_root),
         "packet_path": str(packet_path),
-        "availability_path": str(availability_path_for_repo(repo_root)),
-        "policy": {
-            "require_explain": policy.require_explain,
-            "stop_on_ambiguity": policy.stop_on_ambiguity,
-            "max_cost_tier": policy.max_cost_tier,
-            "escalation_ladder": list(policy.escalation_ladder),
-            "max_escalations": policy.max_escalations,
-            "min_total_score": policy.min_total_score,
-        },
+        "availability_path": str(_cached_availability_path(repo_root)),
+        # Built per plan: callers may mutate the returned escalation_ladder list
+        "policy": _policy_dict(default_route_policy()),
         "refusal_reasons": [reason],
         "steps": [],
     }
@@ -373,30 +411,35 @@ def _normalize_reasons(reasons: list[Any]) -> list[str]:
     return normalized
 
 
-def _select_single_step(route_plan: dict[str, Any]) -> dict[str, Any] | None:
-    for step in route_plan.get("steps", []):
-        if not isinstance(step, dict):
-            continue
-        if step.get("runner") and step.get("model"):
-            return step
-    return None
+def _route_steps(route_plan: dict[str, Any]) -> tuple[dict[str, Any], ...]:
+    """Filter the route plan's steps to well-formed entries once per orchestrate call."""
+    return tuple(step for step in route_plan.get("steps", []) if isinstance(step, dict))
 
 
-def _first_incomplete_step(route_plan: dict[str, Any], run_dir: Path) -> str | None:
-    for step in route_plan.get("steps", []):
-        if not isinstance(step, dict):
-            continue
+def _select_single_step(steps: tuple[dict[str, Any], ...]) -> dict[str, Any] | None:
+    return next((step for step in steps if step.get("runner") and step.get("model")), None)
+
+
+def _first_incomplete_step(steps: tuple[dict[str, Any], ...], run_dir: Path) -> str | None:
+    # One readdir instead of a stat() per step sentinel
+    try:
+        with os.scandir(run_dir) as it:
+            existing = {entry.name for entry in it}
+    except OSError:
+        existing = set()
+
+    for step in steps:
         step_name = str(step.get("step", "")).strip()
         if not step_name:
             continue
-        sentinel = run_dir / f"STEP_{_normalize_step_token(step_name)}.DONE"
-        if not sentinel.exists():
+        if f"STEP_{_normalize_step_token(step_name)}.DONE" not in existing:
             return step_name
     return None
 
 
+@functools.lru_cache(maxsize=1024)
 def _normalize_step_token(step: str) -> str:
-    normalized = re.sub(r"[^A-Za-z0-9]+", "_", step.strip().upper())
+    normalized = _STEP_TOKEN_UNSAFE_RE.sub("_", step.strip().upper())
     return normalized.strip("_") or "STEP"
 
 
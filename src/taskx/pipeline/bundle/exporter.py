@@ -1,16 +1,164 @@
+# yaml, rich, zipfile and the thread pool are imported where they are used, so
+# importing this module (the CLI does on every start) stays cheap.
+from __future__ import annotations
+
+import copy
+import functools
 import hashlib
-import json
 import os
+import re
 import shutil
-import zipfile
+import time
 from datetime import UTC, datetime
 from pathlib import Path
-from typing import Any
+from typing import IO, TYPE_CHECKING, Any
+
+from taskx.artifacts.canonical_json import ascii_indented_dumps_bytes
+
+if TYPE_CHECKING:
+    import zipfile
+    from collections.abc import Iterator
+
+    from rich.console import Console
 
-import yaml  # type: ignore[import-untyped]
-from rich.console import Console
+_console: Console | None = None
+
+
+def _get_console() -> Console:
+    global _console
+    if _console is None:
+        from rich.console import Console
+
+        _console = Console()
+    return _console
+
+
+_STREAM_CHUNK = 1024 * 1024
+
+# Buffers in flight between the read, hash and write stages of the export pipeline
+_PIPELINE_DEPTH = 4
+_PIPELINE_END = object()
+
+# Level 1 keeps most of the ratio on text logs at a fraction of level 6's CPU
+_DEFLATE_LEVEL = 1
+
+# Payloads that are already compressed are stored as-is rather than deflated again
+_COMPRESSED_MAGIC = (
+    b"\x1f\x8b",  # gzip
+    b"\x28\xb5\x2f\xfd",  # zstd
+    b"PK\x03\x04",  # zip
+    b"BZh",  # bzip2
+    b"\xfd7zXZ\x00",  # xz
+    b"\x89PNG",  # png
+    b"\xff\xd8\xff",  # jpeg
+)
+
+
+def _dumps_indented(payload: dict[str, Any]) -> bytes:
+    """Serialize a bundle JSON artifact exactly as ``json.dumps(payload, indent=2)``.
+
+    Recorded hashes cover these bytes, so they must not depend on whether
+    orjson is installed.
+    """
+    return ascii_indented_dumps_bytes(payload)
+
+
+# (bundle path, source file, stat of the source taken when it was selected)
+_Source = tuple[str, Path, os.stat_result]
+
+
+def _stat_key(path: Path) -> tuple[int, int]:
+    st = path.stat()
+    return st.st_mtime_ns, st.st_size
+
+
+@functools.lru_cache(maxsize=16)
+def _parse_config_cached(path: str, mtime_ns: int, size: int) -> Any:
+    """Parse a bundle config once per (path, mtime, size); callers must not mutate the result."""
+    del mtime_ns, size  # cache key only
+    import yaml  # type: ignore[import-untyped]
+
+    # libyaml's C loader when PyYAML was built with it
+    loader = getattr(yaml, "CSafeLoader", yaml.SafeLoader)
+    with open(path, "rb") as f:
+        return yaml.load(f, Loader=loader)
+
+
+def _deep_merge(base: dict[str, Any], override: dict[str, Any]) -> dict[str, Any]:
+    """Overlay override onto base recursively, returning fresh dicts.
+
+    Nested mappings merge key by key, so overriding ``logs.caps`` keeps the
+    default ``logs.globs``; any other value replaces the default (deep-copied so
+    the cached parse stays untouched).
+    """
+    merged = dict(base)
+    for key, value in override.items():
+        if isinstance(value, dict) and isinstance(merged.get(key), dict):
+            merged[key] = _deep_merge(merged[key], value)
+        else:
+            merged[key] = copy.deepcopy(value)
+    return merged
+
+
+def _read_git_head(git_dir: Path) -> tuple[str, str] | None:
+    """Resolve (HEAD sha, branch) from the on-disk refs; None means ask git instead."""
+    if not git_dir.is_dir():
+        return None
+    head = (git_dir / "HEAD").read_text().strip()
+    if not head.startswith("ref: "):
+        return head, "HEAD"  # detached, matching rev-parse --abbrev-ref
+    ref = head[5:]
+    if not ref.startswith("refs/heads/"):
+        return None
+    branch = ref[len("refs/heads/"):]
+    loose = git_dir / ref
+    if loose.is_file():
+        return loose.read_text().strip(), branch
+    packed = git_dir / "packed-refs"
+    if packed.is_file():
+        for line in packed.read_text().splitlines():
+            sha, _, name = line.partition(" ")
+            if name == ref:
+                return sha, branch
+    return None
+
+
+def _glob_to_regex(pattern: str) -> str:
+    """Translate a gitignore-style glob (``**``, ``*``, ``?``) into a regex fragment."""
+    pattern = pattern.strip("/")
+    if "/" not in pattern:
+        # Like .gitignore: a bare name matches at any depth
+        pattern = f"**/{pattern}"
+    out: list[str] = []
+    i = 0
+    while i < len(pattern):
+        if pattern.startswith("**/", i):
+            out.append("(?:.*/)?")
+            i += 3
+        elif pattern.startswith("/**", i) and i + 3 == len(pattern):
+            out.append("/.*")
+            i += 3
+        elif pattern.startswith("**", i):
+            out.append(".*")
+            i += 2
+        elif pattern[i] == "*":
+            out.append("[^/]*")
+            i += 1
+        elif pattern[i] == "?":
+            out.append("[^/]")
+            i += 1
+        else:
+            out.append(re.escape(pattern[i]))
+            i += 1
+    return "".join(out)
+
+
+def _compile_globs(patterns: list[str]) -> re.Pattern[str] | None:
+    """Compile all globs into one alternation, matched with fullmatch on POSIX paths."""
+    if not patterns:
+        return None
+    return re.compile("|".join(f"(?:{_glob_to_regex(p)})" for p in patterns))
 
-console = Console()
 
 class BundleExporter:
     """Handles deterministic export of case bundles."""
@@ -18,6 +166,10 @@ class BundleExporter:
     def __init__(self, repo_root: Path, config_path: Path | None = None):
         self.repo_root = repo_root.resolve()
         self.config = self._load_config(config_path)
+        self._log_include = _compile_globs(self.config["logs"].get("globs", []))
+        self._log_exclude = _compile_globs(self.config["logs"].get("excludes", []))
+        # Directory form: "build" and "**/build/**" both prune "build/" in one match
+        self._log_exclude_dir = re.compile(f"(?:{self._log_exclude.pattern})/?") if self._log_exclude else None
 
     def _load_config(self, config_path: Path | None) -> dict[str, Any]:
         """Load config from file or use defaults."""
@@ -32,53 +184,65 @@ class BundleExporter:
         path = config_path or (self.repo_root / "taskx_bundle.yaml")
         if path.exists():
             try:
-                with open(path) as f:
-                    user_config = yaml.safe_load(f)
-                    # Deep merge would be better, but simple overlay is fine for now
-                    if user_config:
-                        defaults.update(user_config)
+                user_config = _parse_config_cached(str(path), *_stat_key(path))
+                if user_config:
+                    return _deep_merge(defaults, user_config)
             except Exception as e:
-                console.print(f"[yellow]Warning: Failed to load config {path}: {e}[/yellow]")
+                _get_console().print(f"[yellow]Warning: Failed to load config {path}: {e}[/yellow]")
 
         return defaults
 
-    def collect_taskx_artifacts(self, last_n: int, temp_dir: Path) -> list[str]:
-        """Collect last N runs and task packets."""
-        taskx_dir = temp_dir / "taskx"
-        taskx_dir.mkdir(parents=True, exist_ok=True)
+    def _scan_tree(self, src: str, arc_prefix: str, sources: list[_Source]) -> None:
+        """Record every file under src in one scandir pass, reusing DirEntry stat data."""
+        with os.scandir(src) as it:
+            for entry in it:
+                if entry.is_dir(follow_symlinks=False):
+                    self._scan_tree(entry.path, f"{arc_prefix}/{entry.name}", sources)
+                elif entry.is_file():
+                    sources.append((f"{arc_prefix}/{entry.name}", Path(entry.path), entry.stat()))
 
-        manifest_entries = []
+    def _taskx_artifact_sources(self, last_n: int) -> list[_Source]:
+        """List (bundle path, source file, stat) for the task queue and last N runs."""
+        sources: list[_Source] = []
 
         # 1. Task Queue
         queue_path = self.repo_root / "out" / "tasks" / "task_queue.json"
         if queue_path.exists():
-            dest = taskx_dir / "task_queue.json"
-            shutil.copy2(queue_path, dest)
-            manifest_entries.append("taskx/task_queue.json")
+            sources.append(("taskx/task_queue.json", queue_path, queue_path.stat()))
 
         # 2. Packets (simplified: verify existence, but complex logic omitted for brevity)
-        # 3. Runs (simplified: copy last N folders)
+        # 3. Runs (simplified: last N folders)
         runs_dir = self.repo_root / "out" / "runs"
         if runs_dir.exists():
-            all_runs = sorted(runs_dir.iterdir(), key=lambda p: p.stat().st_mtime, reverse=True)
-            for run in all_runs[:last_n]:
-                if not run.is_dir():
-                    continue
-                dest_run = taskx_dir / "runs" / run.name
-                shutil.copytree(run, dest_run)
-                # Walk and add to manifest
-                for root, _, files in os.walk(dest_run):
-                    for file in files:
-                        rel_path = Path(root).relative_to(temp_dir) / file
-                        manifest_entries.append(str(rel_path))
+            # Only run directories are stat-ed for the mtime sort; stray files never count toward last_n
+            with os.scandir(runs_dir) as it:
+                runs = [entry for entry in it if entry.is_dir(follow_symlinks=False)]
+            runs.sort(key=lambda entry: entry.stat(follow_symlinks=False).st_mtime, reverse=True)
+            for run in runs[:last_n]:
+                self._scan_tree(run.path, f"taskx/runs/{run.name}", sources)
 
+        return sources
+
+    def _copy_sources(self, sources: list[_Source], temp_dir: Path) -> list[str]:
+        """Copy sources into temp_dir, preserving timestamps from the recorded stat."""
+        manifest_entries = []
+        for arcname, src, st in sources:
+            dest = temp_dir / arcname
+            dest.parent.mkdir(parents=True, exist_ok=True)
+            shutil.copyfile(src, dest)
+            os.utime(dest, ns=(st.st_atime_ns, st.st_mtime_ns))
+            manifest_entries.append(arcname)
         return manifest_entries
 
-    def collect_repo_snapshot(self, temp_dir: Path) -> str:
-        """Generate REPO_SNAPSHOT.json."""
-        repo_dir = temp_dir / "repo"
-        repo_dir.mkdir(parents=True, exist_ok=True)
+    def collect_taskx_artifacts(self, last_n: int, temp_dir: Path) -> list[str]:
+        """Collect last N runs and task packets."""
+        taskx_dir = temp_dir / "taskx"
+        taskx_dir.mkdir(parents=True, exist_ok=True)
 
+        return self._copy_sources(self._taskx_artifact_sources(last_n), temp_dir)
+
+    def _repo_snapshot(self) -> dict[str, Any]:
+        """Build the REPO_SNAPSHOT.json payload."""
         snapshot = {
             "timestamp": datetime.now(UTC).isoformat(),
             "git_available": False,
@@ -87,89 +251,109 @@ class BundleExporter:
         }
 
         # Try git
-        if (self.repo_root / ".git").exists():
+        git_dir = self.repo_root / ".git"
+        if git_dir.exists():
             try:
-                import subprocess
-                head = subprocess.check_output(["git", "rev-parse", "HEAD"], cwd=self.repo_root).decode().strip()
-                branch = subprocess.check_output(["git", "rev-parse", "--abbrev-ref", "HEAD"], cwd=self.repo_root).decode().strip()
+                resolved = _read_git_head(git_dir)
+                if resolved is None:
+                    # Worktrees, submodules and unusual layouts: one rev-parse for both values
+                    import subprocess
+                    out = subprocess.check_output(
+                        ["git", "rev-parse", "HEAD", "--abbrev-ref", "HEAD"], cwd=self.repo_root
+                    ).decode().split()
+                    resolved = (out[0], out[1])
                 snapshot["git_available"] = True
-                snapshot["head_sha"] = head
-                snapshot["branch"] = branch
+                snapshot["head_sha"], snapshot["branch"] = resolved
             except Exception:
                 pass
 
+        return snapshot
+
+    def collect_repo_snapshot(self, temp_dir: Path) -> str:
+        """Generate REPO_SNAPSHOT.json."""
+        repo_dir = temp_dir / "repo"
+        repo_dir.mkdir(parents=True, exist_ok=True)
+
         snapshot_path = repo_dir / "REPO_SNAPSHOT.json"
-        with open(snapshot_path, "w") as f:
-            json.dump(snapshot, f, indent=2)
+        snapshot_path.write_bytes(_dumps_indented(self._repo_snapshot()))
 
         return "repo/REPO_SNAPSHOT.json"
 
-    def collect_repo_logs(self, temp_dir: Path) -> list[str]:
-        """Collect logs based on config capabilities."""
-        logs_out_dir = temp_dir / "repo" / "logs"
-        logs_out_dir.mkdir(parents=True, exist_ok=True)
-
+    def _iter_log_candidates(self) -> Iterator[tuple[str, os.DirEntry[str]]]:
+        """Walk the repo once, pruning excluded directories before descending."""
+        include, exclude, exclude_dir = self._log_include, self._log_exclude, self._log_exclude_dir
+        if include is None:
+            return
+        stack = [("", str(self.repo_root))]
+        while stack:
+            prefix, directory = stack.pop()
+            try:
+                it = os.scandir(directory)
+            except OSError:
+                continue
+            with it:
+                for entry in it:
+                    rel = prefix + entry.name
+                    if entry.is_dir(follow_symlinks=False):
+                        rel_dir = rel + "/"
+                        if exclude_dir is None or not exclude_dir.fullmatch(rel_dir):
+                            stack.append((rel_dir, entry.path))
+                    elif (
+                        entry.is_file()
+                        and include.fullmatch(rel)
+                        and (exclude is None or not exclude.fullmatch(rel))
+                    ):
+                        yield rel, entry
+
+    def _select_repo_logs(self) -> tuple[list[_Source], dict[str, list[dict[str, Any]]]]:
+        """Select log files under the configured caps; return sources and LOG_INDEX payload."""
         log_index: dict[str, list[dict[str, Any]]] = {
             "included": [],
             "skipped": []
         }
 
-        manifest_entries = []
+        sources: list[_Source] = []
 
-        # Simple glob implementation
-        globs = self.config["logs"].get("globs", [])
-        excludes = self.config["logs"].get("excludes", [])
-
-        # Gather candidates
-        candidates = set()
-        for g in globs:
-            for path in self.repo_root.glob(g):
-                if path.is_file():
-                    candidates.add(path)
-
-        # Filter excludes
-        final_list = []
-        for path in candidates:
-            rel = path.relative_to(self.repo_root)
-            # Check excludes (naive)
-            is_excluded = False
-            for ex in excludes:
-                # Basic match check
-                if ex.strip("/") in str(rel): # Simplification
-                    is_excluded = True
-                    break
-            if not is_excluded:
-                final_list.append(path)
-
-        # Copy with caps logic
+        # Apply caps
+        caps = self.config["logs"]["caps"]
+        per_file_max = caps["per_file_max_mb"] * 1024 * 1024
+        max_total = caps["total_logs_max_mb"] * 1024 * 1024
+        max_files = caps.get("max_files")
         total_size = 0
-        max_total = self.config["logs"]["caps"]["total_logs_max_mb"] * 1024 * 1024
 
-        for path in final_list:
-            size = path.stat().st_size
-            rel_path = path.relative_to(self.repo_root)
+        for rel_path, entry in sorted(self._iter_log_candidates(), key=lambda item: item[0]):
+            st = entry.stat()
+            size = st.st_size
 
-            if size > self.config["logs"]["caps"]["per_file_max_mb"] * 1024 * 1024:
-                log_index["skipped"].append({"path": str(rel_path), "reason": "size_limit"})
+            if size > per_file_max:
+                log_index["skipped"].append({"path": rel_path, "reason": "size_limit"})
                 continue
 
             if total_size + size > max_total:
-                 log_index["skipped"].append({"path": str(rel_path), "reason": "total_cap_hit"})
+                 log_index["skipped"].append({"path": rel_path, "reason": "total_cap_hit"})
                  continue
 
-            # Copy
-            dest = logs_out_dir / rel_path
-            dest.parent.mkdir(parents=True, exist_ok=True)
-            shutil.copy2(path, dest)
+            if max_files is not None and len(sources) >= max_files:
+                log_index["skipped"].append({"path": rel_path, "reason": "file_cap_hit"})
+                continue
 
             total_size += size
-            log_index["included"].append({"path": str(rel_path), "size": size})
-            manifest_entries.append(f"repo/logs/{rel_path}")
+            log_index["included"].append({"path": rel_path, "size": size})
+            sources.append((f"repo/logs/{rel_path}", Path(entry.path), st))
+
+        return sources, log_index
+
+    def collect_repo_logs(self, temp_dir: Path) -> list[str]:
+        """Collect logs based on config capabilities."""
+        logs_out_dir = temp_dir / "repo" / "logs"
+        logs_out_dir.mkdir(parents=True, exist_ok=True)
+
+        sources, log_index = self._select_repo_logs()
+        manifest_entries = self._copy_sources(sources, temp_dir)
 
         # Write index
         index_path = temp_dir / "repo" / "LOG_INDEX.json"
-        with open(index_path, "w") as f:
-            json.dump(log_index, f, indent=2)
+        index_path.write_bytes(_dumps_indented(log_index))
         manifest_entries.append("repo/LOG_INDEX.json")
 
         return manifest_entries
@@ -218,17 +402,23 @@ class BundleExporter:
             )
         return entries
 
-    def build_case_manifest(self, temp_dir: Path, case_id: str) -> None:
-        """Generate manifest for the entire bundle."""
-        case_dir = temp_dir / "case"
-        case_dir.mkdir(parents=True, exist_ok=True)
-        files = self._collect_file_entries(temp_dir)
+    def _file_entry(self, rel: str, sha256: str, size_bytes: int) -> dict[str, Any]:
+        return {
+            "path": rel,
+            "sha256": sha256,
+            "size_bytes": size_bytes,
+            "category": self._classify_path(rel),
+        }
+
+    def _case_manifest(self, files: list[dict[str, Any]], case_id: str) -> dict[str, Any]:
+        """Build CASE_MANIFEST.json from file entries ordered like sorted Paths."""
+        files = sorted(files, key=lambda entry: entry["path"].split("/"))
         manifest_hash_input = "\n".join(
             f"{entry['path']}|{entry['sha256']}|{entry['size_bytes']}" for entry in files
         )
         manifest_hash = hashlib.sha256(manifest_hash_input.encode("utf-8")).hexdigest()
 
-        manifest = {
+        return {
             "schema_version": "1.0",
             "case_id": case_id,
             "generated_at": datetime.now(UTC).isoformat(),
@@ -245,44 +435,178 @@ class BundleExporter:
             "files": files,
         }
 
-        with open(case_dir / "CASE_MANIFEST.json", "w") as f:
-            json.dump(manifest, f, indent=2)
+    def build_case_manifest(self, temp_dir: Path, case_id: str) -> None:
+        """Generate manifest for the entire bundle."""
+        case_dir = temp_dir / "case"
+        case_dir.mkdir(parents=True, exist_ok=True)
+        manifest = self._case_manifest(self._collect_file_entries(temp_dir), case_id)
+
+        (case_dir / "CASE_MANIFEST.json").write_bytes(_dumps_indented(manifest))
+
+    def _open_zip_entry(self, zf: zipfile.ZipFile, source: _Source, head: bytes) -> IO[bytes]:
+        """Open a streaming zip entry for source, choosing compression from its first bytes."""
+        import zipfile
+
+        arcname, _, st = source
+        # Same header ZipInfo.from_file builds, without another stat()
+        zinfo = zipfile.ZipInfo(arcname, time.localtime(st.st_mtime)[:6])
+        zinfo.external_attr = (st.st_mode & 0xFFFF) << 16
+        zinfo.file_size = st.st_size
+        if head.startswith(_COMPRESSED_MAGIC):
+            zinfo.compress_type = zipfile.ZIP_STORED
+        else:
+            zinfo.compress_type = zipfile.ZIP_DEFLATED
+            # ZipFile.open(zinfo, "w") ignores the archive's compresslevel; the
+            # per-entry level is only public API from Python 3.13 on, so older
+            # interpreters deflate streamed entries at zlib's default level.
+            if hasattr(zinfo, "compress_level"):
+                zinfo.compress_level = _DEFLATE_LEVEL
+        return zf.open(zinfo, "w")
+
+    def _zip_sources(self, zf: zipfile.ZipFile, sources: list[_Source]) -> list[dict[str, Any]]:
+        """Read, hash and deflate sources into the archive as three overlapping stages.
+
+        A reader thread fills recycled buffers, a hasher thread folds them into
+        per-file SHA256 digests, and the calling thread compresses and writes
+        them (zipfile allows a single writer). hashlib and zlib release the GIL
+        on large buffers, so disk reads, hashing and DEFLATE run concurrently.
+        """
+        import queue
+        import threading
+        from concurrent.futures import ThreadPoolExecutor
+
+        free: queue.Queue[bytearray] = queue.Queue()
+        for _ in range(2 * _PIPELINE_DEPTH + 2):
+            free.put(bytearray(_STREAM_CHUNK))
+        # Items are (source index, buffer, length, None) for data and
+        # (source index, None, 0, hexdigest) once a file is complete.
+        to_hash: queue.Queue[Any] = queue.Queue(maxsize=_PIPELINE_DEPTH)
+        to_write: queue.Queue[Any] = queue.Queue(maxsize=_PIPELINE_DEPTH)
+        stop = threading.Event()
+
+        def read() -> None:
+            try:
+                for index, (_, src, _) in enumerate(sources):
+                    if stop.is_set():
+                        break
+                    with open(src, "rb", buffering=0) as fin:
+                        while not stop.is_set():
+                            buf = free.get()
+                            n = fin.readinto(buf)
+                            if not n:
+                                free.put(buf)
+                                break
+                            to_hash.put((index, buf, n, None))
+                    to_hash.put((index, None, 0, None))
+            finally:
+                to_hash.put(_PIPELINE_END)
+
+        def hash_chunks() -> None:
+            item = None
+            try:
+                digest = hashlib.sha256()
+                while (item := to_hash.get()) is not _PIPELINE_END:
+                    index, buf, n, _ = item
+                    if buf is None:
+                        to_write.put((index, None, 0, digest.hexdigest()))
+                        digest = hashlib.sha256()
+                    else:
+                        digest.update(memoryview(buf)[:n])
+                        to_write.put(item)
+            except BaseException:
+                stop.set()
+                while item is not _PIPELINE_END:
+                    if item is not None and item[1] is not None:
+                        free.put(item[1])
+                    item = to_hash.get()
+                raise
+            finally:
+                to_write.put(_PIPELINE_END)
+
+        files: list[dict[str, Any]] = []
+        fout: IO[bytes] | None = None
+        size = 0
+        with ThreadPoolExecutor(max_workers=2, thread_name_prefix="bundle-export") as pool:
+            reader = pool.submit(read)
+            hasher = pool.submit(hash_chunks)
+            item = None
+            try:
+                while (item := to_write.get()) is not _PIPELINE_END:
+                    index, buf, n, hexdigest = item
+                    if fout is None:
+                        head = bytes(memoryview(buf)[: min(n, 8)]) if buf is not None else b""
+                        fout = self._open_zip_entry(zf, sources[index], head)
+                        size = 0
+                    if buf is not None:
+                        fout.write(memoryview(buf)[:n])
+                        size += n
+                        free.put(buf)
+                    else:
+                        fout.close()
+                        fout = None
+                        files.append(self._file_entry(sources[index][0], hexdigest, size))
+            except BaseException:
+                stop.set()
+                while item is not _PIPELINE_END:
+                    if item is not None and item[1] is not None:
+                        free.put(item[1])
+                    item = to_write.get()
+                raise
+            finally:
+                if fout is not None:
+                    fout.close()
+            reader.result()
+            hasher.result()
+        return files
+
+    def _zip_json(self, zf: zipfile.ZipFile, arcname: str, payload: dict[str, Any]) -> dict[str, Any]:
+        """Write an in-memory JSON artifact into the archive."""
+        import zipfile
+
+        data = _dumps_indented(payload)
+        zf.writestr(arcname, data, compress_type=zipfile.ZIP_DEFLATED, compresslevel=_DEFLATE_LEVEL)
+        return self._file_entry(arcname, hashlib.sha256(data).hexdigest(), len(data))
 
     def export(self, last_n: int, out_dir: Path, case_id: str | None = None) -> Path:
-        """Main export flow."""
-        import tempfile
+        """Main export flow.
 
+        Every source file is read exactly once: streamed through the
+        read/hash/compress pipeline into the zip, with no staging directory.
+        """
         if not case_id:
             ts = datetime.now(UTC).strftime("%Y%m%d_%H%M%S")
             case_id = f"CASE_{ts}"
 
-        console.print(f"[cyan]Exporting Case Bundle: {case_id}[/cyan]")
+        import zipfile
 
-        with tempfile.TemporaryDirectory() as td:
-            temp_path = Path(td)
+        _get_console().print(f"[cyan]Exporting Case Bundle: {case_id}[/cyan]")
 
-            # 1. Artifacts
-            self.collect_taskx_artifacts(last_n, temp_path)
+        out_dir.mkdir(parents=True, exist_ok=True)
+        zip_path = out_dir / f"{case_id}.zip"
+        # Build under a temporary name so a failed export never leaves a truncated bundle
+        temp_path = zip_path.with_name(zip_path.name + ".tmp")
 
-            # 2. Snapshot
-            self.collect_repo_snapshot(temp_path)
+        try:
+            with zipfile.ZipFile(temp_path, "w", zipfile.ZIP_DEFLATED, compresslevel=_DEFLATE_LEVEL) as zf:
+                files: list[dict[str, Any]] = []
 
-            # 3. Logs
-            self.collect_repo_logs(temp_path)
+                # 1. Artifacts
+                files.extend(self._zip_sources(zf, self._taskx_artifact_sources(last_n)))
 
-            # 4. Manifest
-            self.build_case_manifest(temp_path, case_id)
+                # 2. Snapshot
+                files.append(self._zip_json(zf, "repo/REPO_SNAPSHOT.json", self._repo_snapshot()))
 
-            # 5. Zip
-            out_dir.mkdir(parents=True, exist_ok=True)
-            zip_path = out_dir / f"{case_id}.zip"
+                # 3. Logs
+                log_sources, log_index = self._select_repo_logs()
+                files.extend(self._zip_sources(zf, log_sources))
+                files.append(self._zip_json(zf, "repo/LOG_INDEX.json", log_index))
 
-            with zipfile.ZipFile(zip_path, "w", zipfile.ZIP_DEFLATED) as zf:
-                for root, _, files in os.walk(temp_path):
-                    for file in files:
-                        abs_path = Path(root) / file
-                        rel_path = abs_path.relative_to(temp_path)
-                        zf.write(abs_path, rel_path)
+                # 4. Manifest
+                self._zip_json(zf, "case/CASE_MANIFEST.json", self._case_manifest(files, case_id))
+            os.replace(temp_path, zip_path)
+        except BaseException:
+            temp_path.unlink(missing_ok=True)
+            raise
 
-            console.print(f"[green]Bundle exported to: {zip_path}[/green]")
-            return zip_path
+        _get_console().print(f"[green]Bundle exported to: {zip_path}[/green]")
+        return zip_path
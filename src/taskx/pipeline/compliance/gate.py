@@ -1,18 +1,33 @@
 """Allowlist compliance gate implementation."""
 
+import fnmatch
 import hashlib
-import json
+import os
+import re
 import shutil
 import subprocess
-from datetime import datetime
-from fnmatch import fnmatch
+from collections.abc import Iterator
+from datetime import UTC, datetime
 from pathlib import Path
 
+from taskx.artifacts.canonical_json import json_loads
 from taskx.pipeline.compliance.types import AllowlistDiff, Violation
 from taskx.utils.json_output import write_json_strict
 
 CHATX_VERSION = "0.1.0"
 
+# Generated trees never reviewed as task changes; never descended in fs diff mode
+# (hidden ones such as .git and .venv are pruned by name already)
+FS_SKIP_DIRS = frozenset({"__pycache__", "node_modules"})
+
+_EPOCH = datetime(1970, 1, 1, tzinfo=UTC)
+
+# generated_at written (and recognized) in deterministic timestamp mode
+_DETERMINISTIC_TIMESTAMP = "1970-01-01T00:00:00Z"
+
+# _compute_diff_hash([], []) -- the clean-tree hash, reused without re-hashing
+_EMPTY_DIFF_HASH = hashlib.sha256(b"---").hexdigest()
+
 
 def run_allowlist_gate(
     run_dir: Path,
@@ -47,11 +62,11 @@ def run_allowlist_gate(
 
     # 1. Load and validate RUN_ENVELOPE
     envelope_path = run_dir / "RUN_ENVELOPE.json"
-    if not envelope_path.exists():
-        raise FileNotFoundError(f"RUN_ENVELOPE.json not found in {run_dir}")
-
-    with open(envelope_path) as f:
-        envelope = json.load(f)
+    try:
+        # Parse the raw bytes directly; no text-mode decode pass
+        envelope = json_loads(envelope_path.read_bytes())
+    except FileNotFoundError:
+        raise FileNotFoundError(f"RUN_ENVELOPE.json not found in {run_dir}") from None
 
     run_id = envelope["run_id"]
     task_packet = envelope["task_packet"]
@@ -68,8 +83,14 @@ def run_allowlist_gate(
     # 3. Detect changed files
     changed_files = _detect_changed_files(actual_diff_mode, repo_root, envelope)
 
-    # 4. Classify files as allowed vs disallowed
-    allowed, disallowed = _classify_files(changed_files, allowlist, repo_root)
+    # 4. Classify files as allowed vs disallowed (a clean tree has nothing to match)
+    if changed_files:
+        allowed, disallowed = _classify_files(changed_files, _compile_allowlist(allowlist), repo_root)
+        # Sort once; the result, violation and diff hash all reuse this order
+        allowed.sort()
+        disallowed.sort()
+    else:
+        allowed, disallowed = [], []
 
     # 5. Detect violations
     violations = []
@@ -79,7 +100,7 @@ def run_allowlist_gate(
         violations.append(Violation(
             type="allowlist_violation",
             message=f"Found {len(disallowed)} file(s) changed outside allowlist",
-            files=sorted(disallowed)
+            files=list(disallowed)
         ))
 
     # Check for verification evidence
@@ -101,7 +122,7 @@ def run_allowlist_gate(
         ))
 
     # 6. Compute diff hash
-    diff_hash = _compute_diff_hash(allowed, disallowed)
+    diff_hash = _compute_diff_hash(allowed, disallowed) if changed_files else _EMPTY_DIFF_HASH
 
     # 7. Build result
     result = AllowlistDiff(
@@ -110,8 +131,8 @@ def run_allowlist_gate(
         task_title=task_title,
         allowlist=allowlist,
         diff_mode_used=actual_diff_mode,
-        allowed_files=sorted(allowed),
-        disallowed_files=sorted(disallowed),
+        allowed_files=allowed,
+        disallowed_files=disallowed,
         violations=violations,
         diff_hash=diff_hash
     )
@@ -145,36 +166,38 @@ def _detect_changed_files(diff_mode: str, repo_root: Path, envelope: dict) -> se
         return _detect_changed_files_fs(repo_root, envelope)
 
 
+_GIT_FAST_READ = ["git", "--no-optional-locks", "-c", "core.preloadIndex=true", "-c", "core.untrackedCache=true"]
+
+
+def _git_paths_z(args: list[str], repo_root: Path) -> list[str]:
+    """Run a read-only git command with -z output and return the listed paths."""
+    result = subprocess.run(
+        [*_GIT_FAST_READ, *args],
+        cwd=repo_root,
+        capture_output=True,
+        check=True
+    )
+    return [os.fsdecode(raw) for raw in result.stdout.split(b"\0") if raw]
+
+
 def _detect_changed_files_git(repo_root: Path) -> set[str]:
-    """Detect changed files using git status."""
+    """
+    Detect changed files: tracked changes against HEAD plus untracked files.
+
+    NUL-delimited plumbing output needs no status-code or rename-arrow parsing.
+    """
     try:
-        result = subprocess.run(
-            ["git", "status", "--porcelain"],
-            cwd=repo_root,
-            capture_output=True,
-            text=True,
-            check=True
-        )
-
-        changed = set()
-        for line in result.stdout.strip().split("\n"):
-            if not line:
-                continue
-            # Format: "XY filename" where XY are status codes
-            # Extract filename (handle renames, etc.)
-            parts = line.strip().split(maxsplit=1)
-            if len(parts) >= 2:
-                filename = parts[1]
-                # Handle renames "old -> new"
-                if " -> " in filename:
-                    filename = filename.split(" -> ")[1]
-                # Normalize to POSIX path
-                changed.add(Path(filename).as_posix())
-
-        return changed
+        try:
+            tracked = _git_paths_z(["diff", "--name-only", "--find-renames", "-z", "HEAD"], repo_root)
+        except subprocess.CalledProcessError:
+            # No HEAD yet (fresh repo): everything in the index is new
+            tracked = _git_paths_z(["ls-files", "--cached", "-z"], repo_root)
+        untracked = _git_paths_z(["ls-files", "--others", "--exclude-standard", "-z"], repo_root)
     except subprocess.CalledProcessError as e:
         raise RuntimeError(f"Git command failed: {e}") from e
 
+    return {*tracked, *untracked}
+
 
 def _detect_changed_files_fs(repo_root: Path, envelope: dict) -> set[str]:
     """
@@ -184,41 +207,90 @@ def _detect_changed_files_fs(repo_root: Path, envelope: dict) -> set[str]:
     Files with mtime newer than envelope generated_at are considered changed.
     """
     # Parse envelope timestamp
-    generated_at_str = envelope.get("generated_at", "1970-01-01T00:00:00Z")
+    generated_at_str = envelope.get("generated_at", _DETERMINISTIC_TIMESTAMP)
     try:
-        if generated_at_str == "1970-01-01T00:00:00Z":
+        if generated_at_str == _DETERMINISTIC_TIMESTAMP:
             # Deterministic mode - can't reliably use mtime
             # Return empty set and rely on violations to catch this
             return set()
         else:
-            envelope_time = datetime.fromisoformat(generated_at_str.replace("Z", "+00:00"))
-            envelope_timestamp = envelope_time.timestamp()
-    except (ValueError, AttributeError):
+            # Python 3.11+ parses the trailing "Z" itself
+            envelope_time = datetime.fromisoformat(generated_at_str)
+            envelope_ns = _datetime_ns(envelope_time)
+    except (ValueError, TypeError):
         # Can't parse timestamp, return empty
         return set()
 
-    changed = set()
+    return {
+        rel_path
+        for rel_path, mtime_ns in _scandir_rel(str(repo_root))
+        if mtime_ns > envelope_ns
+    }
 
-    # Walk repo tree
-    for path in repo_root.rglob("*"):
-        if not path.is_file():
-            continue
 
-        # Skip hidden files and directories
-        if any(part.startswith(".") for part in path.relative_to(repo_root).parts):
-            continue
+def _datetime_ns(moment: datetime) -> int:
+    """
+    Convert a datetime to integer nanoseconds since the epoch without floats.
 
-        # Check mtime
-        if path.stat().st_mtime > envelope_timestamp:
-            rel_path = path.relative_to(repo_root).as_posix()
-            changed.add(rel_path)
+    Naive datetimes are taken as local time, matching datetime.timestamp().
+    """
+    delta = (moment if moment.tzinfo else moment.astimezone()) - _EPOCH
+    return (delta.days * 86_400 + delta.seconds) * 1_000_000_000 + delta.microseconds * 1_000
 
-    return changed
+
+def _scandir_rel(
+    root: str,
+    rel: str = "",
+    skip_dirs: frozenset[str] = FS_SKIP_DIRS,
+) -> Iterator[tuple[str, int]]:
+    """
+    Yield (POSIX relative path, mtime in ns) for every non-hidden file under root.
+
+    Hidden directories and those named in skip_dirs are pruned before
+    descending. Uses DirEntry type and stat data from the directory read
+    instead of a Path object and fresh stat() per entry.
+    """
+    try:
+        it = os.scandir(os.path.join(root, rel) if rel else root)
+    except PermissionError:
+        return
+
+    with it:
+        for entry in it:
+            # Skip hidden files and directories
+            if entry.name.startswith("."):
+                continue
+            entry_rel = f"{rel}/{entry.name}" if rel else entry.name
+            if entry.is_dir(follow_symlinks=False):
+                if entry.name not in skip_dirs:
+                    yield from _scandir_rel(root, entry_rel, skip_dirs)
+            elif entry.is_file():
+                yield entry_rel, entry.stat().st_mtime_ns
+
+
+def _compile_allowlist(allowlist: list[str]) -> tuple[frozenset[str], re.Pattern[str] | None]:
+    """
+    Compile allowlist patterns once for matching every changed file.
+
+    Returns:
+        (exact_patterns, unioned_glob_regex) - the regex is None without globs
+    """
+    literals = set()
+    globs = []
+    for pattern in allowlist:
+        # Normalize pattern (strip backticks, whitespace)
+        clean_pattern = pattern.strip().strip("`")
+        literals.add(clean_pattern)
+        if any(ch in clean_pattern for ch in "*?["):
+            globs.append(fnmatch.translate(clean_pattern))
+
+    regex = re.compile("|".join(f"(?:{g})" for g in globs)) if globs else None
+    return frozenset(literals), regex
 
 
 def _classify_files(
     changed_files: set[str],
-    allowlist: list[str],
+    compiled_allowlist: tuple[frozenset[str], re.Pattern[str] | None],
     repo_root: Path
 ) -> tuple[list[str], list[str]]:
     """
@@ -228,81 +300,56 @@ def _classify_files(
         (allowed_files, disallowed_files)
     """
     _ = repo_root
+    literals, regex = compiled_allowlist
     allowed = []
     disallowed = []
 
+    # Both detectors already emit POSIX relative paths (git plumbing and the
+    # "/"-joined scandir walk), so no Path round-trip is needed per file
     for filepath in changed_files:
-        # Normalize to POSIX
-        normalized = Path(filepath).as_posix()
+        candidate = filepath.strip()
 
-        # Check against allowlist
-        if _matches_allowlist(normalized, allowlist):
-            allowed.append(normalized)
+        # Exact match, then any glob in one regex test
+        if candidate in literals or (regex is not None and regex.match(candidate)):
+            allowed.append(filepath)
         else:
-            disallowed.append(normalized)
+            disallowed.append(filepath)
 
     return allowed, disallowed
 
 
-def _matches_allowlist(filepath: str, allowlist: list[str]) -> bool:
-    """Check if filepath matches any allowlist pattern."""
-    # Normalize filepath
-    normalized = filepath.strip()
-
-    for pattern in allowlist:
-        # Normalize pattern (strip backticks, whitespace)
-        clean_pattern = pattern.strip().strip("`")
-
-        # Exact match
-        if normalized == clean_pattern:
-            return True
-
-        # Glob match
-        if fnmatch(normalized, clean_pattern):
-            return True
-
-    return False
-
-
 def _has_verification_evidence(evidence_path: Path) -> bool:
     """Check if EVIDENCE.md contains verification outputs."""
-    if not evidence_path.exists():
-        return False
-
-    content = evidence_path.read_text()
-
-    # Look for command outputs section
-    if "## Command outputs pasted" not in content:
+    # Stream lines and stop at the first answer instead of reading the whole file
+    try:
+        with evidence_path.open(encoding="utf-8") as f:
+            for line in f:
+                if "## Command outputs pasted" in line:
+                    break
+            else:
+                return False
+
+            # Check for non-empty content after the heading
+            for line in f:
+                # A repeated heading restarts the section
+                if "## Command outputs pasted" in line:
+                    continue
+                # If we hit another heading, stop
+                if line.startswith("##"):
+                    return False
+                # Check for non-empty, non-whitespace line
+                if line.strip():
+                    return True
+    except FileNotFoundError:
         return False
 
-    # Check for non-empty content after the heading
-    lines = content.split("\n")
-    in_section = False
-    has_content = False
-
-    for line in lines:
-        if "## Command outputs pasted" in line:
-            in_section = True
-            continue
-
-        if in_section:
-            # If we hit another heading, stop
-            if line.startswith("##"):
-                break
-            # Check for non-empty, non-whitespace line
-            if line.strip():
-                has_content = True
-                break
-
-    return has_content
+    return False
 
 
 def _compute_diff_hash(allowed: list[str], disallowed: list[str]) -> str:
-    """Compute deterministic hash of file lists."""
-    # Create canonical string
-    canonical = "\n".join(
-        sorted(allowed) + ["---"] + sorted(disallowed)
-    )
+    """Compute deterministic hash of already-sorted file lists."""
+    # Create canonical string (one join beats per-path sha256.update calls)
+    canonical = "\n".join([*allowed, "---", *disallowed])
     return hashlib.sha256(canonical.encode()).hexdigest()
 
 
@@ -314,8 +361,8 @@ def _write_allowlist_diff_json(
 ) -> None:
     """Write ALLOWLIST_DIFF.json."""
     timestamp = (
-        "1970-01-01T00:00:00Z" if timestamp_mode == "deterministic"
-        else datetime.utcnow().strftime("%Y-%m-%dT%H:%M:%SZ")
+        _DETERMINISTIC_TIMESTAMP if timestamp_mode == "deterministic"
+        else datetime.now(UTC).strftime("%Y-%m-%dT%H:%M:%SZ")
     )
 
     data = {
@@ -365,53 +412,54 @@ def _write_violations_md(
     diff_mode: str
 ) -> None:
     """Write VIOLATIONS.md."""
-    status = "PASS ✓" if not result.violations else f"FAIL ✗ ({len(result.violations)} violations)"
+    # Stream lines newline-separated instead of joining them in memory
+    lines = _violations_md_lines(result, diff_mode)
+    output_path = out_dir / "VIOLATIONS.md"
+    with output_path.open("w") as f:
+        f.write(next(lines))
+        for line in lines:
+            f.write("\n")
+            f.write(line)
 
-    lines = [
-        "# Allowlist Compliance Report",
-        "",
-        f"**Status:** {status}",
-        f"**Run ID:** {result.run_id}",
-        f"**Task:** {result.task_id} — {result.task_title}",
-        f"**Diff Mode:** {diff_mode}",
-        "",
-        "## Allowed Changed Files",
-        ""
-    ]
 
+def _violations_md_lines(result: AllowlistDiff, diff_mode: str) -> Iterator[str]:
+    """Yield VIOLATIONS.md lines (file lists as one block each) in order."""
+    status = "PASS ✓" if not result.violations else f"FAIL ✗ ({len(result.violations)} violations)"
+
+    yield "# Allowlist Compliance Report"
+    yield ""
+    yield f"**Status:** {status}"
+    yield f"**Run ID:** {result.run_id}"
+    yield f"**Task:** {result.task_id} — {result.task_title}"
+    yield f"**Diff Mode:** {diff_mode}"
+    yield ""
+    yield "## Allowed Changed Files"
+    yield ""
+
+    # One joined block per file list instead of a write pair per file
     if result.allowed_files:
-        for filepath in result.allowed_files:
-            lines.append(f"- ✓ `{filepath}`")
+        yield "\n".join([f"- ✓ `{filepath}`" for filepath in result.allowed_files])
     else:
-        lines.append("*(none)*")
+        yield "*(none)*"
 
-    lines.extend([
-        "",
-        "## Disallowed Changed Files",
-        ""
-    ])
+    yield ""
+    yield "## Disallowed Changed Files"
+    yield ""
 
     if result.disallowed_files:
-        for filepath in result.disallowed_files:
-            lines.append(f"- ✗ `{filepath}`")
+        yield "\n".join([f"- ✗ `{filepath}`" for filepath in result.disallowed_files])
     else:
-        lines.append("*(none)*")
+        yield "*(none)*"
 
     if result.violations:
-        lines.extend([
-            "",
-            "## Violations",
-            ""
-        ])
+        yield ""
+        yield "## Violations"
+        yield ""
 
         for i, violation in enumerate(result.violations, 1):
-            lines.append(f"### {i}. {violation.type}")
-            lines.append(f"**Message:** {violation.message}")
+            yield f"### {i}. {violation.type}"
+            yield f"**Message:** {violation.message}"
             if violation.files:
-                lines.append("**Files:**")
-                for filepath in violation.files:
-                    lines.append(f"- `{filepath}`")
-            lines.append("")
-
-    output_path = out_dir / "VIOLATIONS.md"
-    output_path.write_text("\n".join(lines))
+                yield "**Files:**"
+                yield "\n".join([f"- `{filepath}`" for filepath in violation.files])
+            yield ""
@@ -2,15 +2,23 @@
 
 from __future__ import annotations
 
-import csv
 import hashlib
-import json
+import os
 from datetime import UTC, datetime
-from pathlib import Path
+from typing import TYPE_CHECKING
 
+from taskx.artifacts.canonical_json import (
+    ascii_canonical_dumps_bytes,
+    ascii_indented_dumps_bytes,
+    json_loads,
+)
 from taskx.pipeline.evidence.types import Claim, RunStatus
 from taskx.utils.json_output import write_json_strict
 
+if TYPE_CHECKING:
+    from collections.abc import Iterator
+    from pathlib import Path
+
 
 def collect_evidence(
     *,
@@ -41,11 +49,11 @@ def collect_evidence(
 
     # Load RUN_ENVELOPE.json (hard-fail if missing)
     envelope_path = run_dir / "RUN_ENVELOPE.json"
-    if not envelope_path.exists():
-        raise ValueError(f"RUN_ENVELOPE.json not found in {run_dir}")
-
-    with envelope_path.open() as f:
-        envelope = json.load(f)
+    try:
+        # Parse the raw bytes directly; no text-mode decode pass
+        envelope = json_loads(envelope_path.read_bytes())
+    except FileNotFoundError:
+        raise ValueError(f"RUN_ENVELOPE.json not found in {run_dir}") from None
 
     # Extract task packet info
     task_packet = envelope["task_packet"]
@@ -151,40 +159,47 @@ def collect_evidence(
     }
 
 
+# (files_present key, filename) for every run file the collector knows about
+_KNOWN_FILES: tuple[tuple[str, str], ...] = (
+    ("RUNLOG", "RUNLOG.md"),
+    ("EVIDENCE", "EVIDENCE.md"),
+    ("CHECKLIST", "CHECKLIST.md"),
+    ("PLAN", "PLAN.md"),
+    ("COMMANDS", "COMMANDS.sh"),
+    ("RUN_ENVELOPE", "RUN_ENVELOPE.json"),
+    ("TASK_PACKET", "TASK_PACKET.md"),
+)
+_KNOWN_FILENAMES: dict[str, str] = dict(_KNOWN_FILES)
+
+# Files at least this large make a thread pool worth its startup cost when hashing
+_PARALLEL_HASH_MIN_BYTES = 8 * 1024 * 1024
+
+# Known files whose text feeds claims, status and the evidence bundle
+_CONTENT_KEYS: tuple[str, ...] = ("RUNLOG", "EVIDENCE", "CHECKLIST", "PLAN", "COMMANDS")
+
+
+def run_input_hash(run_dir: Path) -> str:
+    """Hash exactly the run files collect_evidence reads.
+
+    Files the collector writes into the run folder (RUN_SUMMARY.json, the
+    claims ledger, the evidence bundle) are not covered, so a re-collection
+    over an unchanged run produces the same hash.
+    """
+    return _compute_run_folder_hash(run_dir, _check_files_present(run_dir))
+
+
 def _check_files_present(run_dir: Path) -> dict[str, bool]:
     """Check which known files are present in run directory."""
-    known_files = [
-        "RUNLOG.md",
-        "EVIDENCE.md",
-        "CHECKLIST.md",
-        "PLAN.md",
-        "COMMANDS.sh",
-        "RUN_ENVELOPE.json",
-        "TASK_PACKET.md",
-    ]
-
-    return {
-        Path(f).stem if f.endswith(".json") or f.endswith(".sh") else Path(f).stem:
-        (run_dir / f).exists()
-        for f in known_files
-    }
+    return {key: (run_dir / filename).exists() for key, filename in _KNOWN_FILES}
 
 
 def _load_file_contents(run_dir: Path, files_present: dict[str, bool]) -> dict[str, str]:
     """Load contents of present files."""
     contents = {}
 
-    file_map = {
-        "RUNLOG": "RUNLOG.md",
-        "EVIDENCE": "EVIDENCE.md",
-        "CHECKLIST": "CHECKLIST.md",
-        "PLAN": "PLAN.md",
-        "COMMANDS": "COMMANDS.sh",
-    }
-
-    for key, filename in file_map.items():
+    for key in _CONTENT_KEYS:
         if files_present.get(key, False):
-            path = run_dir / filename
+            path = run_dir / _KNOWN_FILENAMES[key]
             try:
                 contents[key] = path.read_text(encoding="utf-8")
             except Exception:
@@ -195,6 +210,14 @@ def _load_file_contents(run_dir: Path, files_present: dict[str, bool]) -> dict[s
     return contents
 
 
+# (source file, ((line prefix, claim type, confidence), ...)) in claim-id order
+_CLAIM_RULES: tuple[tuple[str, tuple[tuple[str, str, float], ...]], ...] = (
+    ("CHECKLIST", (("- [x]", "constraint_respected", 0.8), ("* [x]", "constraint_respected", 0.8))),
+    ("EVIDENCE", (("PASSED:", "test_passed", 0.9), ("FAILED:", "test_failed", 0.9))),
+    ("RUNLOG", (("DONE:", "change_made", 0.7),)),
+)
+
+
 def _extract_claims(
     *,
     file_contents: dict[str, str],
@@ -209,78 +232,50 @@ def _extract_claims(
     3. FAILED: in EVIDENCE → test_failed (0.9)
     4. DONE: in RUNLOG → change_made (0.7)
     """
-    claims = []
-    claim_counter = 1
-
-    # Rule 1: Checklist completed items
-    if file_contents.get("CHECKLIST"):
-        for line in file_contents["CHECKLIST"].split("\n"):
-            if claim_counter > max_claims:
-                break
-
-            line = line.strip()
-            if line.startswith("- [x]") or line.startswith("* [x]"):
-                text = line[5:].strip()[:280]  # Max 280 chars
-                if text:
-                    claims.append(Claim(
-                        claim_id=f"{task_id}_C{claim_counter:03d}",
-                        claim_type="constraint_respected",
-                        text=text,
-                        evidence_source="CHECKLIST",
-                        confidence=0.8,
-                    ))
-                    claim_counter += 1
-
-    # Rule 2 & 3: PASSED/FAILED in EVIDENCE
-    if file_contents.get("EVIDENCE"):
-        for line in file_contents["EVIDENCE"].split("\n"):
-            if claim_counter > max_claims:
-                break
-
-            line = line.strip()
-            if line.startswith("PASSED:"):
-                text = line[7:].strip()[:280]
-                if text:
-                    claims.append(Claim(
-                        claim_id=f"{task_id}_C{claim_counter:03d}",
-                        claim_type="test_passed",
-                        text=text,
-                        evidence_source="EVIDENCE",
-                        confidence=0.9,
-                    ))
-                    claim_counter += 1
-            elif line.startswith("FAILED:"):
-                text = line[7:].strip()[:280]
-                if text:
-                    claims.append(Claim(
-                        claim_id=f"{task_id}_C{claim_counter:03d}",
-                        claim_type="test_failed",
-                        text=text,
-                        evidence_source="EVIDENCE",
-                        confidence=0.9,
-                    ))
-                    claim_counter += 1
-
-    # Rule 4: DONE in RUNLOG
-    if file_contents.get("RUNLOG"):
-        for line in file_contents["RUNLOG"].split("\n"):
-            if claim_counter > max_claims:
-                break
-
-            line = line.strip()
-            if line.startswith("DONE:"):
-                text = line[5:].strip()[:280]
-                if text:
-                    claims.append(Claim(
-                        claim_id=f"{task_id}_C{claim_counter:03d}",
-                        claim_type="change_made",
-                        text=text,
-                        evidence_source="RUNLOG",
-                        confidence=0.7,
-                    ))
-                    claim_counter += 1
-
-    return claims[:max_claims]
+    claims: list[Claim] = []
+    for source, rules in _CLAIM_RULES:
+        if len(claims) >= max_claims:
+            break
+        if file_contents.get(source):
+            _scan_claims(file_contents[source], source, rules, task_id, max_claims, claims)
+    return claims
+
+
+def _scan_claims(
+    text: str,
+    source: str,
+    rules: tuple[tuple[str, str, float], ...],
+    task_id: str,
+    max_claims: int,
+    claims: list[Claim],
+) -> None:
+    """Append claims for lines of ``text`` starting with one of ``rules``' prefixes."""
+    prefixes = tuple(prefix for prefix, _, _ in rules)
+
+    # Claim lines contain a prefix verbatim, so a C-level find() can skip files
+    # without any, and lines before the first occurrence never need splitting
+    first = min((index for index in map(text.find, prefixes) if index >= 0), default=-1)
+    if first < 0:
+        return
+    start = text.rfind("\n", 0, first) + 1
+
+    for line in text[start:].split("\n"):
+        line = line.strip()
+        # One C-level prefix test rejects the common non-claim line
+        if not line.startswith(prefixes):
+            continue
+        prefix, claim_type, confidence = next(rule for rule in rules if line.startswith(rule[0]))
+        claim_text = line[len(prefix):].strip()[:280]  # Max 280 chars
+        if claim_text:
+            claims.append(Claim(
+                claim_id=f"{task_id}_C{len(claims) + 1:03d}",
+                claim_type=claim_type,
+                text=claim_text,
+                evidence_source=source,
+                confidence=confidence,
+            ))
+            if len(claims) >= max_claims:
+                return
 
 
 def _analyze_status(file_contents: dict[str, str]) -> RunStatus:
@@ -322,63 +317,100 @@ def _analyze_status(file_contents: dict[str, str]) -> RunStatus:
 
 def _compute_run_folder_hash(run_dir: Path, files_present: dict[str, bool]) -> str:
     """Compute hash of run folder contents."""
-    file_map = {
-        "RUNLOG": "RUNLOG.md",
-        "EVIDENCE": "EVIDENCE.md",
-        "CHECKLIST": "CHECKLIST.md",
-        "PLAN": "PLAN.md",
-        "COMMANDS": "COMMANDS.sh",
-        "RUN_ENVELOPE": "RUN_ENVELOPE.json",
-        "TASK_PACKET": "TASK_PACKET.md",
-    }
+    filenames = [_KNOWN_FILENAMES.get(key, f"{key}.md") for key in sorted(files_present) if files_present[key]]
+    paths = [run_dir / filename for filename in filenames]
 
-    file_hashes = []
+    if _hash_in_parallel(paths):
+        from concurrent.futures import ThreadPoolExecutor
 
-    for key in sorted(files_present.keys()):
-        if files_present[key]:
-            filename = file_map.get(key, f"{key}.md")
-            filepath = run_dir / filename
+        # hashlib releases the GIL on large updates; map() keeps the key order
+        with ThreadPoolExecutor(max_workers=min(len(paths), 4), thread_name_prefix="evidence-hash") as pool:
+            digests = list(pool.map(_hash_file, paths))
+    else:
+        digests = [_hash_file(path) for path in paths]
 
-            if filepath.exists():
-                file_bytes = filepath.read_bytes()
-                file_hash = hashlib.sha256(file_bytes).hexdigest()
-                file_hashes.append(f"{filename}:{file_hash}")
+    file_hashes = [
+        f"{filename}:{digest}" for filename, digest in zip(filenames, digests, strict=True) if digest is not None
+    ]
 
     # Concatenate and hash
     combined = "\n".join(file_hashes)
     return hashlib.sha256(combined.encode()).hexdigest()
 
 
+def _hash_in_parallel(paths: list[Path]) -> bool:
+    """Use a thread pool only when several large files can hash on separate cores."""
+    if (os.cpu_count() or 1) < 2:
+        return False
+    large = 0
+    for path in paths:
+        try:
+            if path.stat().st_size >= _PARALLEL_HASH_MIN_BYTES:
+                large += 1
+        except OSError:
+            continue
+    return large >= 2
+
+
+def _hash_file(path: Path) -> str | None:
+    """Return the sha256 hex digest of a file, or None if it is missing."""
+    # Stream in 1MiB chunks so large EVIDENCE/RUNLOG files stay out of memory
+    digest = hashlib.sha256()
+    try:
+        with path.open("rb") as handle:
+            for chunk in iter(lambda: handle.read(1024 * 1024), b""):
+                digest.update(chunk)
+    except FileNotFoundError:
+        return None
+    return digest.hexdigest()
+
+
 def _compute_summary_hash(summary_dict: dict) -> str:
     """Compute hash of summary excluding summary_hash field."""
-    # Make a copy and remove summary_hash
-    summary_copy = json.loads(json.dumps(summary_dict))  # Deep copy
-    summary_copy["hashes"]["summary_hash"] = ""
+    # Blank summary_hash in place for the one canonical pass, then restore it
+    hashes = summary_dict["hashes"]
+    previous = hashes["summary_hash"]
+    hashes["summary_hash"] = ""
+    try:
+        canonical = _summary_hash_bytes(summary_dict)
+    finally:
+        hashes["summary_hash"] = previous
+    return hashlib.sha256(canonical).hexdigest()
+
 
-    # Canonical JSON
-    canonical = json.dumps(summary_copy, sort_keys=True, separators=(',', ':'))
-    return hashlib.sha256(canonical.encode()).hexdigest()
+def _summary_hash_bytes(summary_dict: dict) -> bytes:
+    """Serialize the summary exactly as the stdlib compact sorted form."""
+    return ascii_canonical_dumps_bytes(summary_dict)
 
 
 def _write_claims_ledger(path: Path, claims: list[Claim], run_id: str, task_id: str) -> None:
-    """Write claims to CSV ledger."""
+    """Write claims to CSV ledger.
+
+    Rows are formatted directly in csv.writer's default (excel) dialect, which
+    is cheaper than its per-cell dialect dispatch for these fixed columns.
+    """
+    prefix = f"{_csv_field(run_id)},{_csv_field(task_id)},"
+    rows = ["run_id,task_id,claim_id,claim_type,text,evidence_source,confidence\r\n"]
+    rows.extend(
+        f"{prefix}{_csv_field(claim.claim_id)},{_csv_field(claim.claim_type)},{_csv_field(claim.text)},"
+        f"{_csv_field(claim.evidence_source)},{claim.confidence}\r\n"
+        for claim in claims
+    )
     with path.open("w", newline="", encoding="utf-8") as f:
-        writer = csv.writer(f)
+        f.writelines(rows)
 
-        # Write header
-        writer.writerow(["run_id", "task_id", "claim_id", "claim_type", "text", "evidence_source", "confidence"])
 
-        # Write claims
-        for claim in claims:
-            writer.writerow([
-                run_id,
-                task_id,
-                claim.claim_id,
-                claim.claim_type,
-                claim.text,
-                claim.evidence_source,
-                claim.confidence,
-            ])
+def _csv_field(value: object) -> str:
+    """Quote a CSV field the way csv.QUOTE_MINIMAL does for the excel dialect."""
+    text = "" if value is None else str(value)
+    if "," in text or '"' in text or "\n" in text or "\r" in text:
+        return '"' + text.replace('"', '""') + '"'
+    return text
+
+
+def _dumps_envelope(envelope: dict) -> str:
+    """Pretty-print the run envelope exactly as ``json.dumps(envelope, indent=2)``."""
+    return ascii_indented_dumps_bytes(envelope).decode("ascii")
 
 
 def _write_evidence_bundle(
@@ -389,64 +421,67 @@ def _write_evidence_bundle(
     max_chars: int,
 ) -> None:
     """Write evidence bundle markdown."""
-    sections = []
+    # Stream sections newline-separated instead of joining them in memory
+    sections = _evidence_bundle_sections(envelope, file_contents, claims, max_chars)
+    with path.open("w", encoding="utf-8") as f:
+        f.write(next(sections))
+        for section in sections:
+            f.write("\n")
+            f.write(section)
+
+
+def _evidence_bundle_sections(
+    envelope: dict,
+    file_contents: dict[str, str],
+    claims: list[Claim],
+    max_chars: int,
+) -> Iterator[str]:
+    """Yield evidence bundle sections in order, truncating EVIDENCE to fit."""
+    # Running section length (separators excluded) for the truncation budget
+    length = 0
 
     # Header
-    sections.append("# Evidence Bundle\n")
+    yield "# Evidence Bundle\n"
 
     # Run Envelope
-    sections.append("## Run Envelope\n")
-    sections.append("```json\n")
-    sections.append(json.dumps(envelope, indent=2))
-    sections.append("\n```\n")
-
-    # Checklist
-    if file_contents.get("CHECKLIST"):
-        sections.append("## Checklist\n")
-        sections.append(file_contents["CHECKLIST"])
-        sections.append("\n")
-
-    # Plan
-    if file_contents.get("PLAN"):
-        sections.append("## Plan\n")
-        sections.append(file_contents["PLAN"])
-        sections.append("\n")
-
-    # Runlog
-    if file_contents.get("RUNLOG"):
-        sections.append("## Runlog\n")
-        sections.append(file_contents["RUNLOG"])
-        sections.append("\n")
+    envelope_json = _dumps_envelope(envelope)
+    yield "## Run Envelope\n"
+    yield "```json\n"
+    yield envelope_json
+    yield "\n```\n"
+    length += len("# Evidence Bundle\n## Run Envelope\n```json\n\n```\n") + len(envelope_json)
+
+    # Checklist, Plan, Runlog
+    for key, heading in (("CHECKLIST", "## Checklist\n"), ("PLAN", "## Plan\n"), ("RUNLOG", "## Runlog\n")):
+        if file_contents.get(key):
+            yield heading
+            yield file_contents[key]
+            yield "\n"
+            length += len(heading) + len(file_contents[key]) + 1
 
     # Evidence (may be truncated)
     if file_contents.get("EVIDENCE"):
-        sections.append("## Evidence\n")
+        yield "## Evidence\n"
+        length += len("## Evidence\n")
         evidence_section = file_contents["EVIDENCE"]
 
-        # Check if we need to truncate
-        current_length = sum(len(s) for s in sections)
-        available_chars = max_chars - current_length - 500  # Reserve for claims section
+        available_chars = max_chars - length - 500  # Reserve for claims section
 
         if len(evidence_section) > available_chars:
-            truncated = evidence_section[:available_chars]
-            sections.append(truncated)
-            sections.append("\n\n[... Evidence section truncated due to length ...]\n")
+            yield evidence_section[:available_chars]
+            yield "\n\n[... Evidence section truncated due to length ...]\n"
         else:
-            sections.append(evidence_section)
-            sections.append("\n")
+            yield evidence_section
+            yield "\n"
 
     # Commands
     if file_contents.get("COMMANDS"):
-        sections.append("## Commands\n")
-        sections.append("```bash\n")
-        sections.append(file_contents["COMMANDS"])
-        sections.append("\n```\n")
+        yield "## Commands\n"
+        yield "```bash\n"
+        yield file_contents["COMMANDS"]
+        yield "\n```\n"
 
     # Claims Extracted
-    sections.append("## Claims Extracted\n")
+    yield "## Claims Extracted\n"
     for claim in claims:
-        sections.append(f"- **{claim.claim_id}** ({claim.claim_type}, confidence={claim.confidence}): {claim.text}\n")
-
-    # Write bundle
-    bundle_content = "\n".join(sections)
-    path.write_text(bundle_content, encoding="utf-8")
+        yield f"- **{claim.claim_id}** ({claim.claim_type}, confidence={claim.confidence}): {claim.text}\n"
@@ -0,0 +1,125 @@
+"""Content-addressed cache for deterministic loop stage outputs.
+
+Entries live under ``<loop_dir>/../.taskx_cache/stages/<stage>/<key>/`` and
+hold a copy of each output file plus a ``MANIFEST.json``. The key is a causal
+hash of everything the stage reads: the installed TaskX version, the cache
+format, pipeline version, stage name, the stage's recorded inputs and a hash
+of its upstream input.
+
+Cached files are copied back into the loop directory rather than symlinked,
+so later edits to loop outputs can never reach into the cache. Entries are
+never evicted; delete the ``.taskx_cache`` directory to reclaim the space, or
+set ``TASKX_NO_STAGE_CACHE`` to any non-empty value to neither read nor write
+the cache.
+"""
+
+from __future__ import annotations
+
+import hashlib
+import os
+import re
+import shutil
+import tempfile
+from pathlib import Path
+from typing import Any
+
+from taskx import __version__
+from taskx.artifacts.canonical_json import canonical_dumps, json_loads, write_json
+
+MANIFEST_NAME = "MANIFEST.json"
+# Bump when entry layout or what a key covers changes, so old entries stop matching
+CACHE_FORMAT_VERSION = "2"
+_SHA256_HEX = re.compile(r"[0-9a-f]{64}")
+# Set to any non-empty value to bypass the stage cache entirely
+TASKX_NO_STAGE_CACHE_ENV = "TASKX_NO_STAGE_CACHE"
+
+
+def stage_cache_enabled() -> bool:
+    """Return False when the user opted out of the stage cache."""
+    return not os.getenv(TASKX_NO_STAGE_CACHE_ENV)
+
+
+def stage_cache_root(loop_dir: Path) -> Path:
+    """Return the stage cache directory shared by loops under the same parent."""
+    return loop_dir.parent / ".taskx_cache" / "stages"
+
+
+def stage_cache_key(
+    *,
+    pipeline_version: str,
+    stage_name: str,
+    stage_inputs: dict[str, Any],
+    upstream_hash: str,
+) -> str:
+    """Compute the causal hash identifying one stage execution.
+
+    The installed TaskX version is part of the key, so upgrading TaskX never
+    replays outputs produced by older stage implementations.
+    """
+    material = (
+        f"{CACHE_FORMAT_VERSION}|{__version__}|{pipeline_version}|{stage_name}|"
+        f"{canonical_dumps(stage_inputs)}|{upstream_hash}"
+    )
+    return hashlib.sha256(material.encode("utf-8")).hexdigest()
+
+
+def restore_stage(cache_root: Path, stage_name: str, key: str, loop_dir: Path) -> tuple[list[str], str] | None:
+    """Copy a cached stage's outputs into loop_dir.
+
+    Returns:
+        (outputs, stage_output_hash) on a hit, None on a miss or unreadable entry
+    """
+    entry = cache_root / stage_name / key
+    try:
+        manifest = json_loads((entry / MANIFEST_NAME).read_bytes())
+        outputs: list[str] = manifest["outputs"]
+        stage_hash: str = manifest["stage_output_hash"]
+        # A replayed hash lands in the loop envelope, which the schema pins to sha256 hex
+        if not isinstance(stage_hash, str) or not _SHA256_HEX.fullmatch(stage_hash):
+            return None
+        for relpath in outputs:
+            target = loop_dir / relpath
+            target.parent.mkdir(parents=True, exist_ok=True)
+            shutil.copyfile(entry / "files" / relpath, target)
+    except (OSError, ValueError, KeyError, TypeError):
+        return None
+    return outputs, stage_hash
+
+
+def store_stage(
+    cache_root: Path,
+    stage_name: str,
+    key: str,
+    loop_dir: Path,
+    outputs: list[str],
+    stage_hash: str,
+) -> None:
+    """Record a stage's outputs under its key; best effort, never raises OSError.
+
+    The entry is assembled in a temporary sibling directory and renamed into
+    place, so readers only ever see complete entries.
+    """
+    stage_dir = cache_root / stage_name
+    entry = stage_dir / key
+    if entry.exists():
+        return
+
+    try:
+        stage_dir.mkdir(parents=True, exist_ok=True)
+        staging = Path(tempfile.mkdtemp(prefix=f".{key[:16]}-", dir=stage_dir))
+    except OSError:
+        return
+
+    try:
+        for relpath in outputs:
+            target = staging / "files" / relpath
+            target.parent.mkdir(parents=True, exist_ok=True)
+            shutil.copyfile(loop_dir / relpath, target)
+        write_json(
+            staging / MANIFEST_NAME,
+            {"stage": stage_name, "key": key, "outputs": outputs, "stage_output_hash": stage_hash},
+        )
+        staging.rename(entry)
+    except OSError:
+        # Lost a race with another writer, or the disk refused; either way skip
+        shutil.rmtree(staging, ignore_errors=True)
@@ -1,26 +1,44 @@
 """Loop orchestrator - runs lifecycle stages A5→A6→A7→A8→A9."""
 
 import hashlib
+import os
 from datetime import UTC, datetime
+from functools import cache
+from importlib.util import find_spec
 from pathlib import Path
 from typing import Any
 
 from taskx import __version__
-from taskx.pipeline.evidence.collector import collect_evidence
+from taskx.artifacts import canonical_json
+from taskx.artifacts.canonical_json import sha256_file
+from taskx.pipeline.loop.cache import (
+    restore_stage,
+    stage_cache_enabled,
+    stage_cache_key,
+    stage_cache_root,
+    store_stage,
+)
 from taskx.pipeline.loop.types import LoopInputs, StageResult
-from taskx.pipeline.spec_feedback.feedback import generate_feedback
 
 try:
     from taskx.spec_mining.miner import mine_spec  # type: ignore[import-untyped]
 except ImportError:
     mine_spec = None  # type: ignore[assignment]
 from taskx.pipeline.task_compiler.compiler import compile_task_queue
-from taskx.pipeline.task_runner.parser import parse_task_packet
-from taskx.pipeline.task_runner.runner import create_run_workspace
 from taskx.utils.json_output import write_json_strict
 
 TASKX_VERSION = "0.1.0"
 STAGE_ORDER = ["mine_spec", "compile_tasks", "run_task", "collect_evidence", "spec_feedback"]
+_EMPTY_SHA256 = hashlib.sha256(b"").hexdigest()
+_DETERMINISTIC_TIMESTAMP = "1970-01-01T00:00:00Z"
+_EVIDENCE_LIMITS = {"max_claims": 200, "max_evidence_chars": 200000}
+# Below this many output bytes a hashing thread pool costs more than it saves
+_PARALLEL_HASH_MIN_BYTES = 8 * 1024 * 1024
+_STATUS_ICONS = {"ok": "✓", "failed": "✗", "skipped": "—"}
+# Set to any non-empty value to validate every loop envelope against its schema
+TASKX_STRICT_ENV = "TASKX_STRICT"
+_LOOP_MODES = frozenset({"mvp", "hardening", "full"})
+_TIMESTAMP_MODES = frozenset({"deterministic", "wallclock"})
 
 
 def run_loop(
@@ -38,6 +56,11 @@ def run_loop(
         inputs: Loop configuration inputs
         timestamp_mode: "deterministic" or "wallclock"
         runs_path: Optional external runs directory for feedback
+
+    Deterministic A6/A8 outputs are cached under
+    ``loop_dir.parent / ".taskx_cache" / "stages"`` and replayed when the
+    same inputs and stage code meet again; set ``TASKX_NO_STAGE_CACHE`` to
+    any non-empty value to bypass the cache.
     """
     loop_dir.mkdir(parents=True, exist_ok=True)
 
@@ -67,15 +90,30 @@ def run_loop(
         # Don't stop - optional stages can fail without blocking feedback
         pass
 
-    # Stage 4: Collect evidence (A8) - optional
-    stages["collect_evidence"] = _run_collect_evidence(
-        loop_dir, inputs, timestamp_mode, stop_execution, stages["run_task"]
-    )
+    if _evidence_and_feedback_independent(loop_dir, inputs, stages["run_task"], runs_path):
+        # Stages 4 and 5 touch disjoint trees here, so overlap them
+        from concurrent.futures import ThreadPoolExecutor
+
+        with ThreadPoolExecutor(max_workers=2, thread_name_prefix="loop-stage") as pool:
+            evidence_future = pool.submit(
+                _run_collect_evidence, loop_dir, inputs, timestamp_mode, stop_execution, stages["run_task"]
+            )
+            feedback_future = pool.submit(
+                _run_spec_feedback,
+                loop_dir, inputs, timestamp_mode, stop_execution, stages["compile_tasks"], runs_path,
+            )
+            stages["collect_evidence"] = evidence_future.result()
+            stages["spec_feedback"] = feedback_future.result()
+    else:
+        # Stage 4: Collect evidence (A8) - optional
+        stages["collect_evidence"] = _run_collect_evidence(
+            loop_dir, inputs, timestamp_mode, stop_execution, stages["run_task"]
+        )
 
-    # Stage 5: Spec feedback (A9) - optional
-    stages["spec_feedback"] = _run_spec_feedback(
-        loop_dir, inputs, timestamp_mode, stop_execution, stages["compile_tasks"], runs_path
-    )
+        # Stage 5: Spec feedback (A9) - optional; may read the RUN_SUMMARY.json A8 just wrote
+        stages["spec_feedback"] = _run_spec_feedback(
+            loop_dir, inputs, timestamp_mode, stop_execution, stages["compile_tasks"], runs_path
+        )
 
     # Compute aggregate hash
     loop_hash = _compute_loop_hash(stages)
@@ -95,11 +133,54 @@ def run_loop(
         data=envelope,
         output_path=envelope_path,
         schema_name="loop_envelope",
+        skip_validation=_envelope_is_trusted(loop_id, inputs, timestamp_mode) and not os.getenv(TASKX_STRICT_ENV),
     )
 
     _write_stage_log(loop_dir, loop_id, inputs, stages)
 
 
+def _envelope_is_trusted(loop_id: str, inputs: LoopInputs, timestamp_mode: str) -> bool:
+    """Check every caller-supplied envelope field the loop_envelope schema constrains.
+
+    Everything else in the envelope is produced by this module in the shape the
+    schema describes, so once these hold, validation cannot fail.
+    """
+    return (
+        type(loop_id) is str
+        and type(inputs.mode) is str
+        and inputs.mode in _LOOP_MODES
+        and type(timestamp_mode) is str
+        and timestamp_mode in _TIMESTAMP_MODES
+        and type(inputs.max_packets) is int
+        and inputs.max_packets >= 1
+        and type(inputs.seed) is int
+        and (inputs.run_task is None or type(inputs.run_task) is str)
+        and (inputs.run_id is None or type(inputs.run_id) is str)
+        and type(inputs.collect_evidence) is bool
+        and type(inputs.feedback) is bool
+    )
+
+
+def _evidence_and_feedback_independent(
+    loop_dir: Path,
+    inputs: LoopInputs,
+    run_result: StageResult,
+    runs_path: Path | None,
+) -> bool:
+    """Check whether A8 and A9 can run concurrently.
+
+    A9 reads every RUN_SUMMARY.json under its runs directory and A8 writes one
+    into this loop's run folder, so they only overlap when A9 reads an external
+    runs_path that does not contain that folder.
+    """
+    if runs_path is None or not (inputs.collect_evidence and inputs.feedback):
+        return False
+    if run_result.status != "ok" or not run_result.out_dir:
+        return False
+    run_dir = (loop_dir / run_result.out_dir).resolve()
+    return not run_dir.is_relative_to(runs_path.resolve())
+
+
 def _run_mine_spec(
     loop_dir: Path,
     inputs: LoopInputs,
@@ -128,39 +209,15 @@ def _run_mine_spec(
         )
 
         # Collect outputs
-        if out_dir.exists():
-            for f in sorted(out_dir.rglob("*")):
-                if f.is_file():
-                    outputs.append(str(f.relative_to(loop_dir)))
+        outputs.extend(_collect_output_files(out_dir, loop_dir))
 
-        ended_at = _get_timestamp(timestamp_mode)
         stage_hash = _compute_stage_hash(loop_dir, outputs)
-
-        return StageResult(
-            enabled=True,
-            status="ok",
-            started_at=started_at,
-            ended_at=ended_at,
-            out_dir=str(out_dir.relative_to(loop_dir)),
-            inputs={"repo_root": str(inputs.root)},
-            outputs=outputs,
-            hashes={"stage_output_hash": stage_hash},
-            error=None,
+        return _ok_stage(
+            started_at, timestamp_mode, "spec_mine", {"repo_root": str(inputs.root)}, outputs, stage_hash
         )
 
     except Exception as e:
-        ended_at = _get_timestamp(timestamp_mode)
-        return StageResult(
-            enabled=True,
-            status="failed",
-            started_at=started_at,
-            ended_at=ended_at,
-            out_dir=str(out_dir.relative_to(loop_dir)) if out_dir else None,
-            inputs={"repo_root": str(inputs.root)},
-            outputs=outputs,
-            hashes={},
-            error=str(e),
-        )
+        return _failed_stage(started_at, timestamp_mode, "spec_mine", {"repo_root": str(inputs.root)}, outputs, e)
 
 
 def _run_compile_tasks(
@@ -171,13 +228,12 @@ def _run_compile_tasks(
     mine_result: StageResult,
 ) -> StageResult:
     """Run A6 task compilation stage."""
-    _ = mine_result
     if stop:
         return _skipped_stage()
 
     started_at = _get_timestamp(timestamp_mode)
     out_dir = loop_dir / "task_queue"
-    outputs = []
+    outputs: list[str] = []
 
     try:
         # Find spec and source index from A5
@@ -190,62 +246,50 @@ def _run_compile_tasks(
         if not source_index_path.exists():
             raise FileNotFoundError(f"Source index not found: {source_index_path}")
 
-        # Call A6 compiler
-        compile_task_queue(
-            spec_path=spec_path,
-            source_index_path=source_index_path,
-            output_dir=out_dir,
-            mode=inputs.mode,
-            max_packets=inputs.max_packets,
-            seed=inputs.seed,
-            pipeline_version=TASKX_VERSION,
-            timestamp_mode=timestamp_mode,
-        )
-
-        # Collect outputs
-        if out_dir.exists():
-            for f in sorted(out_dir.rglob("*")):
-                if f.is_file():
-                    outputs.append(str(f.relative_to(loop_dir)))
-
-        ended_at = _get_timestamp(timestamp_mode)
-        stage_hash = _compute_stage_hash(loop_dir, outputs)
+        stage_inputs = {
+            "spec_path": str(spec_path),
+            "source_index_path": str(source_index_path),
+            "mode": inputs.mode,
+            "max_packets": inputs.max_packets,
+            "seed": inputs.seed,
+        }
 
-        return StageResult(
-            enabled=True,
-            status="ok",
-            started_at=started_at,
-            ended_at=ended_at,
-            out_dir=str(out_dir.relative_to(loop_dir)),
-            inputs={
-                "spec_path": str(spec_path),
-                "source_index_path": str(source_index_path),
-                "mode": inputs.mode,
-                "max_packets": inputs.max_packets,
-                "seed": inputs.seed,
-            },
-            outputs=outputs,
-            hashes={"stage_output_hash": stage_hash},
-            error=None,
+        # Deterministic compiles are a pure function of the mined spec and the
+        # inputs above, so an identical earlier compile can be replayed
+        cache_key = _stage_cache_key_for(
+            timestamp_mode, "compile_tasks", "taskx.pipeline.task_compiler", stage_inputs, _ok_stage_hash(mine_result)
         )
+        cached = None
+        if cache_key is not None:
+            cached = restore_stage(stage_cache_root(loop_dir), "compile_tasks", cache_key, loop_dir)
+
+        if cached is not None:
+            outputs, stage_hash = cached
+        else:
+            # Call A6 compiler
+            compile_task_queue(
+                spec_path=spec_path,
+                source_index_path=source_index_path,
+                output_dir=out_dir,
+                mode=inputs.mode,
+                max_packets=inputs.max_packets,
+                seed=inputs.seed,
+                pipeline_version=TASKX_VERSION,
+                timestamp_mode=timestamp_mode,
+            )
+
+            # Collect outputs
+            outputs.extend(_collect_output_files(out_dir, loop_dir))
+
+            stage_hash = _compute_stage_hash(loop_dir, outputs)
+            if cache_key is not None:
+                store_stage(stage_cache_root(loop_dir), "compile_tasks", cache_key, loop_dir, outputs, stage_hash)
+
+        return _ok_stage(started_at, timestamp_mode, "task_queue", stage_inputs, outputs, stage_hash)
 
     except Exception as e:
-        ended_at = _get_timestamp(timestamp_mode)
-        return StageResult(
-            enabled=True,
-            status="failed",
-            started_at=started_at,
-            ended_at=ended_at,
-            out_dir=str(out_dir.relative_to(loop_dir)) if out_dir else None,
-            inputs={
-                "mode": inputs.mode,
-                "max_packets": inputs.max_packets,
-                "seed": inputs.seed,
-            },
-            outputs=outputs,
-            hashes={},
-            error=str(e),
-        )
+        failed_inputs = {"mode": inputs.mode, "max_packets": inputs.max_packets, "seed": inputs.seed}
+        return _failed_stage(started_at, timestamp_mode, "task_queue", failed_inputs, outputs, e)
 
 
 def _run_task_workspace(
@@ -260,11 +304,16 @@ def _run_task_workspace(
     if not inputs.run_task or stop:
         return _skipped_stage()
 
+    # Optional stages import their implementations only when they run
+    from taskx.pipeline.task_runner.parser import parse_task_packet
+    from taskx.pipeline.task_runner.runner import create_run_workspace
+
     started_at = _get_timestamp(timestamp_mode)
     run_id = inputs.run_id if inputs.run_id else f"RUN_{inputs.run_task}"
     runs_dir = loop_dir / "runs"
     run_dir = runs_dir / run_id
-    outputs = []
+    run_out_dir = str(run_dir.relative_to(loop_dir))
+    outputs: list[str] = []
 
     try:
         # Find task packet
@@ -294,43 +343,15 @@ def _run_task_workspace(
         )
 
         # Collect outputs
-        if run_dir.exists():
-            for f in sorted(run_dir.rglob("*")):
-                if f.is_file():
-                    outputs.append(str(f.relative_to(loop_dir)))
+        outputs.extend(_collect_output_files(run_dir, loop_dir))
 
-        ended_at = _get_timestamp(timestamp_mode)
         stage_hash = _compute_stage_hash(loop_dir, outputs)
-
-        return StageResult(
-            enabled=True,
-            status="ok",
-            started_at=started_at,
-            ended_at=ended_at,
-            out_dir=str(run_dir.relative_to(loop_dir)),
-            inputs={
-                "task_id": inputs.run_task,
-                "run_id": run_id,
-                "packet_file": str(packet_file),
-            },
-            outputs=outputs,
-            hashes={"stage_output_hash": stage_hash},
-            error=None,
-        )
+        stage_inputs = {"task_id": inputs.run_task, "run_id": run_id, "packet_file": str(packet_file)}
+        return _ok_stage(started_at, timestamp_mode, run_out_dir, stage_inputs, outputs, stage_hash)
 
     except Exception as e:
-        ended_at = _get_timestamp(timestamp_mode)
-        return StageResult(
-            enabled=True,
-            status="failed",
-            started_at=started_at,
-            ended_at=ended_at,
-            out_dir=str(run_dir.relative_to(loop_dir)) if run_dir else None,
-            inputs={"task_id": inputs.run_task, "run_id": run_id},
-            outputs=outputs,
-            hashes={},
-            error=str(e),
-        )
+        failed_inputs = {"task_id": inputs.run_task, "run_id": run_id}
+        return _failed_stage(started_at, timestamp_mode, run_out_dir, failed_inputs, outputs, e)
 
 
 def _run_collect_evidence(
@@ -350,66 +371,59 @@ def _run_collect_evidence(
 
     started_at = _get_timestamp(timestamp_mode)
     run_dir = loop_dir / run_result.out_dir if run_result.out_dir else None
-    outputs = []
+    outputs: list[str] = []
 
     if not run_dir or not run_dir.exists():
-        return StageResult(
-            enabled=True,
-            status="failed",
-            started_at=started_at,
-            ended_at=_get_timestamp(timestamp_mode),
-            out_dir=None,
-            inputs={},
-            outputs=[],
-            hashes={},
-            error="Run directory not found",
-        )
+        return _failed_stage(started_at, timestamp_mode, None, {}, [], "Run directory not found")
 
     try:
-        # Call A8 collector
-        artifacts = collect_evidence(
-            run_dir=run_dir,
-            timestamp_mode=timestamp_mode,
-            max_claims=200,
-            max_evidence_chars=200000,
-            pipeline_version=TASKX_VERSION,
-        )
-
-        # Collect outputs (from artifacts dict)
-        for key in ["summary", "ledger", "bundle"]:
-            if key in artifacts:
-                artifact_path = Path(artifacts[key])
-                if artifact_path.exists():
-                    outputs.append(str(artifact_path.relative_to(loop_dir)))
-
-        ended_at = _get_timestamp(timestamp_mode)
-        stage_hash = _compute_stage_hash(loop_dir, outputs)
-
-        return StageResult(
-            enabled=True,
-            status="ok",
-            started_at=started_at,
-            ended_at=ended_at,
-            out_dir=str(run_dir.relative_to(loop_dir)),
-            inputs={"run_dir": str(run_dir)},
-            outputs=outputs,
-            hashes={"stage_output_hash": stage_hash},
-            error=None,
+        # Key on the run files the collector reads, not on A7's hash: A7 also
+        # hashes the summary, ledger and bundle an earlier A8 left in the run folder
+        cache_key = None
+        if timestamp_mode == "deterministic" and stage_cache_enabled():
+            from taskx.pipeline.evidence.collector import run_input_hash
+
+            cache_key = _stage_cache_key_for(
+                timestamp_mode,
+                "collect_evidence",
+                "taskx.pipeline.evidence",
+                {**_EVIDENCE_LIMITS, "run_dir": run_result.out_dir},
+                run_input_hash(run_dir),
+            )
+        cached = None
+        if cache_key is not None:
+            cached = restore_stage(stage_cache_root(loop_dir), "collect_evidence", cache_key, loop_dir)
+
+        if cached is not None:
+            outputs, stage_hash = cached
+        else:
+            from taskx.pipeline.evidence.collector import collect_evidence
+
+            # Call A8 collector
+            artifacts = collect_evidence(
+                run_dir=run_dir,
+                timestamp_mode=timestamp_mode,
+                pipeline_version=TASKX_VERSION,
+                **_EVIDENCE_LIMITS,
+            )
+
+            # Collect outputs (from artifacts dict)
+            for key in ["summary", "ledger", "bundle"]:
+                if key in artifacts:
+                    artifact_path = Path(artifacts[key])
+                    if artifact_path.exists():
+                        outputs.append(str(artifact_path.relative_to(loop_dir)))
+
+            stage_hash = _compute_stage_hash(loop_dir, outputs)
+            if cache_key is not None:
+                store_stage(stage_cache_root(loop_dir), "collect_evidence", cache_key, loop_dir, outputs, stage_hash)
+
+        return _ok_stage(
+            started_at, timestamp_mode, run_result.out_dir, {"run_dir": str(run_dir)}, outputs, stage_hash
         )
 
     except Exception as e:
-        ended_at = _get_timestamp(timestamp_mode)
-        return StageResult(
-            enabled=True,
-            status="failed",
-            started_at=started_at,
-            ended_at=ended_at,
-            out_dir=str(run_dir.relative_to(loop_dir)) if run_dir else None,
-            inputs={"run_dir": str(run_dir) if run_dir else None},
-            outputs=outputs,
-            hashes={},
-            error=str(e),
-        )
+        return _failed_stage(started_at, timestamp_mode, run_result.out_dir, {"run_dir": str(run_dir)}, outputs, e)
 
 
 def _run_spec_feedback(
@@ -425,6 +439,8 @@ def _run_spec_feedback(
     if not inputs.feedback or stop:
         return _skipped_stage()
 
+    from taskx.pipeline.spec_feedback.feedback import generate_feedback
+
     started_at = _get_timestamp(timestamp_mode)
     out_dir = loop_dir / "spec_feedback"
     outputs = []
@@ -465,43 +481,59 @@ def _run_spec_feedback(
         )
 
         # Collect outputs
-        if out_dir.exists():
-            for f in sorted(out_dir.rglob("*")):
-                if f.is_file():
-                    outputs.append(str(f.relative_to(loop_dir)))
+        outputs.extend(_collect_output_files(out_dir, loop_dir))
 
-        ended_at = _get_timestamp(timestamp_mode)
         stage_hash = _compute_stage_hash(loop_dir, outputs)
-
-        return StageResult(
-            enabled=True,
-            status="ok",
-            started_at=started_at,
-            ended_at=ended_at,
-            out_dir=str(out_dir.relative_to(loop_dir)),
-            inputs={
-                "runs_path": str(target_runs),
-                "task_queue_path": str(task_queue_path),
-                "run_count": len(run_paths),
-            },
-            outputs=outputs,
-            hashes={"stage_output_hash": stage_hash},
-            error=None,
-        )
+        stage_inputs = {
+            "runs_path": str(target_runs),
+            "task_queue_path": str(task_queue_path),
+            "run_count": len(run_paths),
+        }
+        return _ok_stage(started_at, timestamp_mode, "spec_feedback", stage_inputs, outputs, stage_hash)
 
     except Exception as e:
-        ended_at = _get_timestamp(timestamp_mode)
-        return StageResult(
-            enabled=True,
-            status="failed",
-            started_at=started_at,
-            ended_at=ended_at,
-            out_dir=str(out_dir.relative_to(loop_dir)) if out_dir else None,
-            inputs={"runs_path": str(runs_path) if runs_path else None},
-            outputs=outputs,
-            hashes={},
-            error=str(e),
-        )
+        failed_inputs = {"runs_path": str(runs_path) if runs_path else None}
+        return _failed_stage(started_at, timestamp_mode, "spec_feedback", failed_inputs, outputs, e)
+
+
+def _collect_output_files(out_dir: Path, loop_dir: Path) -> list[str]:
+    """List files under out_dir relative to loop_dir, in Path sort order.
+
+    Path ordering compares component-wise, so a depth-first walk that visits
+    each directory's entries in name order yields it directly; no key sort of
+    the whole list is needed afterwards.
+    """
+    # Walked paths extend out_dir, so slicing off the loop_dir prefix gives
+    # the same string relpath would without re-normalizing both paths
+    top = os.fspath(out_dir)
+    loop_prefix = os.path.join(loop_dir, "")
+    if top.startswith(loop_prefix):
+        rel_top = top[len(loop_prefix):]
+    else:
+        rel_top = os.path.relpath(top, loop_dir)
+
+    found: list[str] = []
+    _walk_sorted(top, os.path.join(rel_top, ""), found)
+    return found
+
+
+def _walk_sorted(dirpath: str, rel_prefix: str, found: list[str]) -> None:
+    """Append files below dirpath in name order, classifying entries like os.walk."""
+    try:
+        with os.scandir(dirpath) as it:
+            entries = sorted(it, key=lambda entry: entry.name)
+    except OSError:
+        return
+
+    for entry in entries:
+        try:
+            is_dir = entry.is_dir()
+        except OSError:
+            is_dir = False
+        if not is_dir:
+            found.append(rel_prefix + entry.name)
+        elif not entry.is_symlink():
+            _walk_sorted(entry.path, rel_prefix + entry.name + os.sep, found)
 
 
 def _skipped_stage() -> StageResult:
@@ -519,12 +551,119 @@ def _skipped_stage() -> StageResult:
     )
 
 
+def _ok_stage_hash(result: StageResult) -> str | None:
+    """Return a successful stage's output hash, or None."""
+    return result.hashes.get("stage_output_hash") if result.status == "ok" else None
+
+
+# Serializers whose output bytes (and therefore hashes) every cached stage stores
+_SHARED_STAGE_MODULES = ("taskx.artifacts.canonical_json", "taskx.utils.json_output")
+
+
+@cache
+def _source_digest(name: str) -> str:
+    """Hash the source files of a module or package without importing it.
+
+    Computed once per process.
+    """
+    digest = hashlib.sha256()
+    spec = find_spec(name)
+    if spec is not None and spec.submodule_search_locations:
+        for root in spec.submodule_search_locations:
+            for path in sorted(Path(root).rglob("*.py")):
+                digest.update(path.relative_to(root).as_posix().encode("utf-8") + b"\0")
+                digest.update(path.read_bytes())
+    elif spec is not None and spec.origin:
+        digest.update(Path(spec.origin).read_bytes())
+    return digest.hexdigest()
+
+
+def _implementation_digest(package: str) -> str:
+    """Hash everything a stage's cached bytes depend on, so code edits miss old entries.
+
+    Covers the stage package, the shared JSON serializers and which orjson
+    build (if any) they use.
+    """
+    orjson = canonical_json.orjson
+    orjson_version = getattr(orjson, "__version__", "unknown") if orjson is not None else "absent"
+    parts = [_source_digest(name) for name in (package, *_SHARED_STAGE_MODULES)]
+    parts.append(f"orjson={orjson_version}")
+    return hashlib.sha256("|".join(parts).encode("utf-8")).hexdigest()
+
+
+def _stage_cache_key_for(
+    timestamp_mode: str,
+    stage_name: str,
+    package: str,
+    stage_inputs: dict[str, Any],
+    upstream_hash: str | None,
+) -> str | None:
+    """Return the stage cache key, or None when the stage must not be cached.
+
+    Only deterministic stages with a known upstream hash are cacheable;
+    wallclock outputs embed the time they ran. The key covers the source of
+    ``package`` (the stage's implementation), the shared serializers and the
+    orjson build they use.
+    """
+    if timestamp_mode != "deterministic" or not upstream_hash:
+        return None
+    if not stage_cache_enabled():
+        return None
+    return stage_cache_key(
+        pipeline_version=TASKX_VERSION,
+        stage_name=stage_name,
+        stage_inputs={"inputs": stage_inputs, "implementation": _implementation_digest(package)},
+        upstream_hash=upstream_hash,
+    )
+
+
+def _ok_stage(
+    started_at: str,
+    timestamp_mode: str,
+    out_dir: str | None,
+    stage_inputs: dict,
+    outputs: list[str],
+    stage_hash: str,
+) -> StageResult:
+    """Create a successful stage result, ending it now."""
+    return StageResult(
+        enabled=True,
+        status="ok",
+        started_at=started_at,
+        ended_at=_get_timestamp(timestamp_mode),
+        out_dir=out_dir,
+        inputs=stage_inputs,
+        outputs=outputs,
+        hashes={"stage_output_hash": stage_hash},
+        error=None,
+    )
+
+
+def _failed_stage(
+    started_at: str,
+    timestamp_mode: str,
+    out_dir: str | None,
+    stage_inputs: dict,
+    outputs: list[str],
+    error: Exception | str,
+) -> StageResult:
+    """Create a failed stage result, ending it now."""
+    return StageResult(
+        enabled=True,
+        status="failed",
+        started_at=started_at,
+        ended_at=_get_timestamp(timestamp_mode),
+        out_dir=out_dir,
+        inputs=stage_inputs,
+        outputs=outputs,
+        hashes={},
+        error=str(error),
+    )
+
+
 def _get_timestamp(mode: str) -> str:
     """Get timestamp based on mode."""
-    if mode == "deterministic":
-        return "1970-01-01T00:00:00Z"
-    else:
-        return datetime.now(UTC).isoformat()
+    return _DETERMINISTIC_TIMESTAMP if mode == "deterministic" else datetime.now(UTC).isoformat()
 
 
 def _compute_stage_hash(loop_dir: Path, outputs: list[str]) -> str:
@@ -532,19 +671,36 @@ def _compute_stage_hash(loop_dir: Path, outputs: list[str]) -> str:
     if not outputs:
         return "0" * 64  # Empty hash for no outputs
 
-    # Build canonical string
-    hash_parts = []
+    # stat() doubles as the existence check and sizes the work
+    present: list[tuple[str, int]] = []
     for relpath in sorted(outputs):
-        file_path = loop_dir / relpath
-        if file_path.exists():
-            with open(file_path, "rb") as f:
-                file_hash = hashlib.sha256(f.read()).hexdigest()
-            hash_parts.append(f"{relpath}:{file_hash}")
+        try:
+            present.append((relpath, (loop_dir / relpath).stat().st_size))
+        except (FileNotFoundError, NotADirectoryError):
+            continue
+
+    paths = [loop_dir / relpath for relpath, _ in present]
+    sizes = [size for _, size in present]
+    if len(present) > 1 and sum(sizes) >= _PARALLEL_HASH_MIN_BYTES and (os.cpu_count() or 1) > 1:
+        from concurrent.futures import ThreadPoolExecutor
+
+        # hashlib releases the GIL on large updates; map() keeps sorted order
+        with ThreadPoolExecutor(max_workers=min(8, len(present)), thread_name_prefix="stage-hash") as pool:
+            file_hashes = list(pool.map(_hash_output, paths, sizes))
+    else:
+        file_hashes = [_hash_output(path, size) for path, size in zip(paths, sizes, strict=True)]
 
+    # Build canonical string
+    hash_parts = [f"{relpath}:{file_hash}" for (relpath, _), file_hash in zip(present, file_hashes, strict=True)]
     combined = "\n".join(hash_parts)
     return hashlib.sha256(combined.encode()).hexdigest()
 
 
+def _hash_output(path: Path, size: int) -> str:
+    """Hash one stage output; empty files skip the open()."""
+    return sha256_file(path) if size else _EMPTY_SHA256
+
+
 def _compute_loop_hash(stages: dict[str, StageResult]) -> str:
     """Compute aggregate loop hash from all stage hashes in fixed order."""
     stage_hashes = []
@@ -613,40 +769,35 @@ def _write_stage_log(
     stages: dict[str, StageResult],
 ) -> None:
     """Write human-readable stage log."""
-    lines = ["# Loop Stage Log\n"]
-    lines.append(f"\n**Loop ID:** {loop_id}\n")
-    lines.append("\n## Inputs\n")
-    lines.append(f"- Root: {inputs.root}\n")
-    lines.append(f"- Mode: {inputs.mode}\n")
-    lines.append(f"- Max packets: {inputs.max_packets}\n")
-    lines.append(f"- Seed: {inputs.seed}\n")
-    lines.append(f"- Run task: {inputs.run_task or 'None'}\n")
-    lines.append(f"- Run ID: {inputs.run_id or 'Auto-generated'}\n")
-    lines.append(f"- Collect evidence: {inputs.collect_evidence}\n")
-    lines.append(f"- Feedback: {inputs.feedback}\n")
-
-    lines.append("\n## Stages\n")
-
-    for stage_name in STAGE_ORDER:
-        if stage_name in stages:
-            result = stages[stage_name]
-            status_icon = {
-                "ok": "✓",
-                "failed": "✗",
-                "skipped": "—",
-            }.get(result.status, "?")
-
-            lines.append(f"\n### {stage_name}\n")
-            lines.append(f"**Status:** {status_icon} {result.status}\n")
-
-            if result.out_dir:
-                lines.append(f"**Output:** {result.out_dir}\n")
-
-            if result.outputs:
-                lines.append(f"**Files:** {len(result.outputs)}\n")
-
-            if result.error:
-                lines.append(f"**Error:** {result.error}\n")
+    header = (
+        "# Loop Stage Log\n"
+        f"\n**Loop ID:** {loop_id}\n"
+        "\n## Inputs\n"
+        f"- Root: {inputs.root}\n"
+        f"- Mode: {inputs.mode}\n"
+        f"- Max packets: {inputs.max_packets}\n"
+        f"- Seed: {inputs.seed}\n"
+        f"- Run task: {inputs.run_task or 'None'}\n"
+        f"- Run ID: {inputs.run_id or 'Auto-generated'}\n"
+        f"- Collect evidence: {inputs.collect_evidence}\n"
+        f"- Feedback: {inputs.feedback}\n"
+        "\n## Stages\n"
+    )
+    sections = "".join(
+        _stage_log_section(stage_name, stages[stage_name]) for stage_name in STAGE_ORDER if stage_name in stages
+    )
 
     log_path = loop_dir / "STAGE_LOG.md"
-    log_path.write_text("".join(lines))
+    temp_path = log_path.with_suffix(log_path.suffix + ".tmp")
+    temp_path.write_text(header + sections)
+    temp_path.replace(log_path)
+
+
+def _stage_log_section(stage_name: str, result: StageResult) -> str:
+    """Render one stage's block of the stage log."""
+    return (
+        f"\n### {stage_name}\n**Status:** {_STATUS_ICONS.get(result.status, '?')} {result.status}\n"
+        + (f"**Output:** {result.out_dir}\n" if result.out_dir else "")
+        + (f"**Files:** {len(result.outputs)}\n" if result.outputs else "")
+        + (f"**Error:** {result.error}\n" if result.error else "")
+    )
@@ -1,15 +1,16 @@
 """Run promotion gate implementation."""
 
 import hashlib
-import json
 from datetime import datetime
 from pathlib import Path
 
+from taskx.artifacts.canonical_json import ascii_canonical_dumps_bytes, json_loads
 from taskx.pipeline.promotion.types import Evidence, PromotionToken
 from taskx.schemas.validator import validate_data
 from taskx.utils.json_output import write_json_strict
 
 CHATX_VERSION = "0.1.0"
+_EVIDENCE_HEADING = "## Command outputs pasted"
 
 
 def promote_run(
@@ -45,15 +46,19 @@ def promote_run(
     run_summary_path = run_dir / "RUN_SUMMARY.json"
     evidence_md_path = run_dir / "EVIDENCE.md"
 
-    if not allowlist_diff_path.exists():
-        raise FileNotFoundError(f"ALLOWLIST_DIFF.json not found in {run_dir}")
+    # Read each input in one call; a failed read doubles as the existence check
+    try:
+        allowlist_diff_bytes = allowlist_diff_path.read_bytes()
+    except FileNotFoundError:
+        raise FileNotFoundError(f"ALLOWLIST_DIFF.json not found in {run_dir}") from None
 
-    if not run_envelope_path.exists():
-        raise FileNotFoundError(f"RUN_ENVELOPE.json not found in {run_dir}")
+    try:
+        run_envelope_bytes = run_envelope_path.read_bytes()
+    except FileNotFoundError:
+        raise FileNotFoundError(f"RUN_ENVELOPE.json not found in {run_dir}") from None
 
     # Load allowlist diff
-    with open(allowlist_diff_path) as f:
-        allowlist_diff = json.load(f)
+    allowlist_diff = json_loads(allowlist_diff_bytes)
 
     # Validate allowlist diff schema
     ok, errors = validate_data(allowlist_diff, "allowlist_diff", strict=True)
@@ -61,8 +66,7 @@ def promote_run(
         raise RuntimeError(f"ALLOWLIST_DIFF.json schema validation failed: {errors}")
 
     # Load run envelope
-    with open(run_envelope_path) as f:
-        run_envelope = json.load(f)
+    run_envelope = json_loads(run_envelope_bytes)
 
     # Validate run envelope schema
     ok, errors = validate_data(run_envelope, "run_envelope", strict=True)
@@ -74,9 +78,13 @@ def promote_run(
     # Load run summary if present
     run_summary = None
     run_summary_path_str = None
-    if run_summary_path.exists():
-        with open(run_summary_path) as f:
-            run_summary = json.load(f)
+    try:
+        run_summary_bytes: bytes | None = run_summary_path.read_bytes()
+    except FileNotFoundError:
+        run_summary_bytes = None
+
+    if run_summary_bytes is not None:
+        run_summary = json_loads(run_summary_bytes)
 
         # Validate run summary schema
         ok, errors = validate_data(run_summary, "run_summary", strict=True)
@@ -157,11 +165,12 @@ def promote_run(
         run_summary_path=run_summary_path_str,
     )
 
-    # 5. Compute token hash
-    token.token_hash = _compute_token_hash(token, timestamp_mode)
+    # 5. Compute token hash over the same document PROMOTION.json records
+    document = _token_document(token, timestamp_mode)
+    token.token_hash = _compute_token_hash(document)
 
     # 6. Write outputs
-    _write_promotion_json(token, out_dir, timestamp_mode)
+    _write_promotion_json(document, token.token_hash, out_dir)
     _write_promotion_md(token, out_dir, run_envelope)
 
     return token
@@ -169,46 +178,42 @@ def promote_run(
 
 def _has_verification_evidence(evidence_path: Path) -> bool:
     """Check if EVIDENCE.md contains verification outputs."""
-    if not evidence_path.exists():
+    try:
+        content = evidence_path.read_text()
+    except FileNotFoundError:
         return False
 
-    content = evidence_path.read_text()
-
-    # Look for command outputs section
-    if "## Command outputs pasted" not in content:
+    # Look for command outputs section; find() skips to it without splitting lines
+    start = content.find(_EVIDENCE_HEADING)
+    if start == -1:
         return False
 
-    # Check for non-empty content after the heading
-    lines = content.split("\n")
-    in_section = False
-    has_content = False
-
-    for line in lines:
-        if "## Command outputs pasted" in line:
-            in_section = True
-            continue
-
-        if in_section:
+    # Check for non-empty content after the heading, one line at a time
+    pos = content.find("\n", start)
+    while pos != -1:
+        end = content.find("\n", pos + 1)
+        line = content[pos + 1 : end] if end != -1 else content[pos + 1 :]
+        # A repeated heading restarts the section
+        if _EVIDENCE_HEADING not in line:
             # If we hit another heading, stop
             if line.startswith("##"):
-                break
+                return False
             # Check for non-empty, non-whitespace line
             if line.strip():
-                has_content = True
-                break
+                return True
+        pos = end
 
-    return has_content
+    return False
 
 
-def _compute_token_hash(token: PromotionToken, timestamp_mode: str) -> str:
-    """Compute deterministic hash of token excluding the hash itself."""
-    # Build canonical data (excluding token_hash)
+def _token_document(token: PromotionToken, timestamp_mode: str) -> dict:
+    """Build the promotion token document, excluding its hashes."""
     timestamp = (
         "1970-01-01T00:00:00Z" if timestamp_mode == "deterministic"
         else datetime.utcnow().strftime("%Y-%m-%dT%H:%M:%SZ")
     )
 
-    canonical = {
+    return {
         "schema_version": "1.0",
         "pipeline_version": CHATX_VERSION,
         "run_id": token.run_id,
@@ -227,41 +232,18 @@ def _compute_token_hash(token: PromotionToken, timestamp_mode: str) -> str:
         },
     }
 
-    # Compute hash
-    canonical_str = json.dumps(canonical, sort_keys=True, separators=(',', ':'))
-    return hashlib.sha256(canonical_str.encode()).hexdigest()
 
+def _compute_token_hash(document: dict) -> str:
+    """Compute deterministic hash of the token document (which excludes the hash itself)."""
+    return hashlib.sha256(ascii_canonical_dumps_bytes(document)).hexdigest()
 
-def _write_promotion_json(
-    token: PromotionToken,
-    out_dir: Path,
-    timestamp_mode: str
-) -> None:
-    """Write PROMOTION.json."""
-    timestamp = (
-        "1970-01-01T00:00:00Z" if timestamp_mode == "deterministic"
-        else datetime.utcnow().strftime("%Y-%m-%dT%H:%M:%SZ")
-    )
 
+def _write_promotion_json(document: dict, token_hash: str, out_dir: Path) -> None:
+    """Write PROMOTION.json."""
     data = {
-        "schema_version": "1.0",
-        "pipeline_version": CHATX_VERSION,
-        "run_id": token.run_id,
-        "generated_at": timestamp,
-        "timestamp_mode": timestamp_mode,
-        "status": token.status,
-        "inputs": {
-            "run_dir": token.run_dir,
-            "allowlist_diff_path": token.allowlist_diff_path,
-            "run_envelope_path": token.run_envelope_path,
-            "run_summary_path": token.run_summary_path,
-        },
-        "decision": {
-            "reasons": token.reasons,
-            "evidence": [{"kind": e.kind, "path": e.path} for e in token.evidence],
-        },
+        **document,
         "hashes": {
-            "token_hash": token.token_hash,
+            "token_hash": token_hash,
         }
     }
 
@@ -3,7 +3,7 @@
 from dataclasses import dataclass
 
 
-@dataclass
+@dataclass(slots=True)
 class Evidence:
     """Evidence file used in promotion decision."""
 
@@ -11,7 +11,7 @@ class Evidence:
     path: str
 
 
-@dataclass
+@dataclass(slots=True)
 class PromotionToken:
     """Result of promotion gate check."""
 
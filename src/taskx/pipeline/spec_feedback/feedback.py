@@ -1,16 +1,20 @@
 """Spec feedback loop implementation - deterministic, no-LLM."""
 
 import hashlib
-import json
+from collections import defaultdict
 from datetime import UTC, datetime
+from operator import attrgetter, itemgetter
 from pathlib import Path
 from typing import Any
 
+from taskx.artifacts.canonical_json import json_loads
 from taskx.pipeline.spec_feedback.types import Evidence, Patch
 from taskx.schemas.validator import validate_data
 from taskx.utils.json_output import write_json_strict
 
 CHATX_VERSION = "0.1.0"
+_RISK_ORDER = {"low": 0, "med": 1, "high": 2}
+_MERGED_OPS = frozenset({"set_risk", "set_priority", "set_status"})
 
 
 def generate_feedback(
@@ -34,8 +38,8 @@ def generate_feedback(
     output_dir.mkdir(parents=True, exist_ok=True)
 
     # Load and validate task queue
-    with open(task_queue_path) as f:
-        task_queue = json.load(f)
+    task_queue_bytes = task_queue_path.read_bytes()
+    task_queue = json_loads(task_queue_bytes)
     ok, errors = validate_data(task_queue, "task_queue", strict=True)
     if not ok:
         raise ValueError(f"Invalid task queue: {errors}")
@@ -43,11 +47,14 @@ def generate_feedback(
     # Load and validate run summaries
     run_summaries = _load_run_summaries(run_paths, max_runs)
 
+    # Index packets once; patch generation and the delta report both use it
+    task_lookup = {pkt["id"]: pkt for pkt in task_queue["packets"]}
+
     # Generate patches
-    patches = _generate_patches(run_summaries, task_queue)
+    patches = _generate_patches(run_summaries, task_lookup)
 
     # Compute input hash
-    input_hash = _compute_input_hash(task_queue_path, run_summaries)
+    input_hash = _compute_input_hash(task_queue_bytes, run_summaries)
 
     # Generate timestamp
     generated_at = (
@@ -78,7 +85,7 @@ def generate_feedback(
         schema_name="task_queue_patch",
     )
 
-    _write_priority_delta(patches, task_queue, output_dir, run_summaries)
+    _write_priority_delta(patches, task_lookup, output_dir, run_summaries)
     _write_conflict_ledger_updates(
         patches, run_summaries, output_dir, conflict_ledger_path
     )
@@ -90,12 +97,11 @@ def _load_run_summaries(run_paths: list[Path], max_runs: int) -> list[dict[str,
 
     for run_path in run_paths[:max_runs]:
         summary_path = run_path / "RUN_SUMMARY.json"
-        if not summary_path.exists():
+        try:
+            summary = json_loads(summary_path.read_bytes())
+        except FileNotFoundError:
             continue
 
-        with open(summary_path) as f:
-            summary = json.load(f)
-
         ok, errors = validate_data(summary, "run_summary", strict=True)
         if not ok:
             raise ValueError(f"Invalid run summary {summary_path}: {errors}")
@@ -103,19 +109,16 @@ def _load_run_summaries(run_paths: list[Path], max_runs: int) -> list[dict[str,
         summaries.append(summary)
 
     # Sort by run_id for determinism
-    summaries.sort(key=lambda s: s["run_id"])
+    summaries.sort(key=itemgetter("run_id"))
 
     return summaries
 
 
 def _generate_patches(
-    run_summaries: list[dict[str, Any]], task_queue: dict[str, Any]
+    run_summaries: list[dict[str, Any]], task_lookup: dict[str, dict[str, Any]]
 ) -> list[Patch]:
     """Generate patches from run summaries using deterministic rules."""
-    patches_by_task: dict[str, list[Patch]] = {}
-
-    # Build task lookup
-    task_lookup = {pkt["id"]: pkt for pkt in task_queue["packets"]}
+    patches_by_task: defaultdict[str, list[Patch]] = defaultdict(list)
 
     for summary in run_summaries:
         task_id = summary["task_packet"]["id"]
@@ -130,8 +133,20 @@ def _generate_patches(
         # Apply deterministic rules
         task_patches = []
 
+        # Bucket the claims the rules look at in one pass
+        failed_claims = []
+        passed_claims = []
+        constraint_claims = []
+        for c in claims:
+            claim_type = c["claim_type"]
+            if claim_type == "test_failed":
+                failed_claims.append(c)
+            elif claim_type == "test_passed":
+                passed_claims.append(c)
+            elif claim_type == "constraint_respected":
+                constraint_claims.append(c)
+
         # Rule 1: Any test_failed → set risk=high, priority=1
-        failed_claims = [c for c in claims if c["claim_type"] == "test_failed"]
         if failed_claims:
             evidence = [Evidence(run_id, c["claim_id"]) for c in failed_claims]
             task_patches.append(
@@ -154,7 +169,6 @@ def _generate_patches(
             )
 
         # Rule 2: test_passed + checklist_completed → status=done, priority=5
-        passed_claims = [c for c in claims if c["claim_type"] == "test_passed"]
         if passed_claims and status["checklist_completed"]:
             evidence = [Evidence(run_id, c["claim_id"]) for c in passed_claims]
             task_patches.append(
@@ -177,15 +191,7 @@ def _generate_patches(
             )
 
         # Rule 3: Only constraint_respected → append note
-        constraint_claims = [
-            c for c in claims if c["claim_type"] == "constraint_respected"
-        ]
-        test_claims = [
-            c
-            for c in claims
-            if c["claim_type"] in ["test_passed", "test_failed"]
-        ]
-        if constraint_claims and not test_claims:
+        if constraint_claims and not (passed_claims or failed_claims):
             evidence = [Evidence(run_id, c["claim_id"]) for c in constraint_claims]
             task_patches.append(
                 Patch(
@@ -212,15 +218,13 @@ def _generate_patches(
             )
 
         # Collect patches for this task
-        if task_id not in patches_by_task:
-            patches_by_task[task_id] = []
         patches_by_task[task_id].extend(task_patches)
 
     # Merge patches from multiple runs
     merged_patches = _merge_patches(patches_by_task)
 
     # Sort for determinism: by (task_id, op)
-    merged_patches.sort(key=lambda p: (p.task_id, p.op))
+    merged_patches.sort(key=attrgetter("task_id", "op"))
 
     return merged_patches
 
@@ -231,90 +235,44 @@ def _merge_patches(patches_by_task: dict[str, list[Patch]]) -> list[Patch]:
 
     for task_id, patches in sorted(patches_by_task.items()):
         # Group by operation
-        by_op: dict[str, list[Patch]] = {}
+        by_op: defaultdict[str, list[Patch]] = defaultdict(list)
         for patch in patches:
-            if patch.op not in by_op:
-                by_op[patch.op] = []
             by_op[patch.op].append(patch)
 
         for op, op_patches in by_op.items():
-            if op == "set_risk":
-                # Take max severity
-                risk_order = {"low": 0, "med": 1, "high": 2}
-                max_patch = max(op_patches, key=lambda p: risk_order.get(p.value, 0))
-                # Combine evidence from all runs
-                all_evidence = []
-                for p in op_patches:
-                    all_evidence.extend(p.evidence)
-                merged.append(
-                    Patch(
-                        task_id=task_id,
-                        op=op,
-                        value=max_patch.value,
-                        reason=max_patch.reason,
-                        evidence=all_evidence,
-                    )
-                )
-
-            elif op == "set_priority":
-                # Take min numeric if any failures, else if done priority=5
-                has_failure = any(
-                    p.value == 1 for p in op_patches
-                )
-                if has_failure:
-                    min_patch = min(op_patches, key=lambda p: p.value)
-                    all_evidence = []
-                    for p in op_patches:
-                        all_evidence.extend(p.evidence)
-                    merged.append(
-                        Patch(
-                            task_id=task_id,
-                            op=op,
-                            value=min_patch.value,
-                            reason=min_patch.reason,
-                            evidence=all_evidence,
-                        )
-                    )
-                else:
-                    # All done (priority=5)
-                    all_evidence = []
-                    for p in op_patches:
-                        all_evidence.extend(p.evidence)
-                    merged.append(
-                        Patch(
-                            task_id=task_id,
-                            op=op,
-                            value=5,
-                            reason="Task completed successfully",
-                            evidence=all_evidence,
-                        )
-                    )
-
-            elif op == "set_status":
-                # Take latest status (deterministic by run_id sort)
-                latest_patch = op_patches[-1]
-                all_evidence = []
-                for p in op_patches:
-                    all_evidence.extend(p.evidence)
-                merged.append(
-                    Patch(
-                        task_id=task_id,
-                        op=op,
-                        value=latest_patch.value,
-                        reason=latest_patch.reason,
-                        evidence=all_evidence,
-                    )
-                )
-
-            elif op == "append_note":
+            if op == "append_note":
                 # Append notes in stable order by run_id
                 # Sort patches by run_id from evidence
-                sorted_patches = sorted(
-                    op_patches,
-                    key=lambda p: p.evidence[0].run_id if p.evidence else "",
+                merged.extend(
+                    sorted(op_patches, key=lambda p: p.evidence[0].run_id if p.evidence else "")
                 )
-                for patch in sorted_patches:
-                    merged.append(patch)
+                continue
+            if op not in _MERGED_OPS:
+                continue
+
+            # One pass combines evidence from all runs and picks the winning patch:
+            # max risk severity, min priority, or the latest status (by run_id sort)
+            all_evidence: list[Evidence] = []
+            chosen = op_patches[0]
+            has_failure = False
+            for p in op_patches:
+                all_evidence.extend(p.evidence)
+                if op == "set_risk":
+                    if _RISK_ORDER.get(p.value, 0) > _RISK_ORDER.get(chosen.value, 0):
+                        chosen = p
+                elif op == "set_priority":
+                    has_failure = has_failure or p.value == 1
+                    if p.value < chosen.value:
+                        chosen = p
+                else:
+                    chosen = p
+
+            if op == "set_priority" and not has_failure:
+                # All done (priority=5)
+                value, reason = 5, "Task completed successfully"
+            else:
+                value, reason = chosen.value, chosen.reason
+            merged.append(Patch(task_id=task_id, op=op, value=value, reason=reason, evidence=all_evidence))
 
     return merged
 
@@ -333,11 +291,14 @@ def _patches_to_dicts(patches: list[Patch]) -> list[dict[str, Any]]:
     ]
 
 
-def _compute_input_hash(task_queue_path: Path, run_summaries: list[dict[str, Any]]) -> str:
-    """Compute deterministic hash of inputs."""
+def _compute_input_hash(task_queue_bytes: bytes, run_summaries: list[dict[str, Any]]) -> str:
+    """Compute deterministic hash of inputs.
+
+    Takes the task queue bytes generate_feedback already read, so the file is
+    hashed exactly as parsed without a second read.
+    """
     # Hash task queue file
-    with open(task_queue_path, "rb") as f:
-        tq_hash = hashlib.sha256(f.read()).hexdigest()
+    tq_hash = hashlib.sha256(task_queue_bytes).hexdigest()
 
     # Hash concatenated run summary hashes
     summary_hashes = [rs["hashes"]["summary_hash"] for rs in run_summaries]
@@ -348,18 +309,14 @@ def _compute_input_hash(task_queue_path: Path, run_summaries: list[dict[str, Any
 
 def _write_priority_delta(
     patches: list[Patch],
-    task_queue: dict[str, Any],
+    task_lookup: dict[str, dict[str, Any]],
     output_dir: Path,
     run_summaries: list[dict[str, Any]],
 ) -> None:
     """Write PRIORITY_DELTA.md report."""
-    task_lookup = {pkt["id"]: pkt for pkt in task_queue["packets"]}
-
-    # Group patches by task
-    patches_by_task: dict[str, list[Patch]] = {}
+    # Group merged patches by task
+    patches_by_task: defaultdict[str, list[Patch]] = defaultdict(list)
     for patch in patches:
-        if patch.task_id not in patches_by_task:
-            patches_by_task[patch.task_id] = []
         patches_by_task[patch.task_id].append(patch)
 
     lines = ["# Priority Delta Report\n"]
@@ -4,7 +4,7 @@ from dataclasses import dataclass
 from typing import Any
 
 
-@dataclass
+@dataclass(slots=True)
 class Evidence:
     """Evidence linking a patch to a claim."""
 
@@ -12,7 +12,7 @@ class Evidence:
     claim_id: str
 
 
-@dataclass
+@dataclass(slots=True)
 class Patch:
     """A patch operation for the task queue."""
 
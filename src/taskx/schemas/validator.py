@@ -1,14 +1,26 @@
 """Schema validation utilities for TaskX using package-data-only registry."""
 
-from typing import Any
+from functools import cache
+from importlib.util import find_spec
+from typing import TYPE_CHECKING, Any
 
-try:
+from taskx.utils.schema_registry import get_registry
+
+if TYPE_CHECKING:
     from jsonschema.validators import Draft202012Validator
-    JSONSCHEMA_AVAILABLE = True
-except ImportError:
-    JSONSCHEMA_AVAILABLE = False
 
-from taskx.utils.schema_registry import get_registry
+# jsonschema is imported on first validation, not here: it costs ~60 ms and
+# modules that only import validate_data (CLI commands, writers) never need it
+JSONSCHEMA_AVAILABLE = find_spec("jsonschema") is not None
+
+
+@cache
+def _get_validator(schema_name: str) -> "Draft202012Validator":
+    """Build the validator for a schema once; package-data schemas never change."""
+    from jsonschema.validators import Draft202012Validator
+
+    schema = get_registry().get_json(schema_name)
+    return Draft202012Validator(schema)
 
 
 def validate_data(
@@ -37,12 +49,8 @@ def validate_data(
             "Install with: pip install jsonschema"
         )
 
-    # Load schema from package data (no CWD fallback)
-    registry = get_registry()
-    schema = registry.get_json(schema_name)
-
-    # Validate
-    validator = Draft202012Validator(schema)
+    # Load schema from package data (no CWD fallback), compiled once per name
+    validator = _get_validator(schema_name)
     errors = list(validator.iter_errors(data))
 
     if errors:
@@ -7,10 +7,16 @@ from datetime import UTC, datetime
 from pathlib import Path
 from typing import Any
 
+try:
+    import orjson
+except ImportError:  # orjson is an optional accelerator (the ``fast`` extra)
+    orjson = None  # type: ignore[assignment]
+
 try:
     from taskx.schemas.message import CanonicalMessage  # type: ignore[import-untyped]
 except ImportError:
     CanonicalMessage = None  # type: ignore[assignment, misc]
+from taskx.artifacts.canonical_json import contains_float
 from taskx.schemas.validator import validate_data
 
 
@@ -201,6 +207,23 @@ def quarantine_invalid_json(
     return quarantine_path
 
 
+def _dumps_pretty(data: dict) -> bytes:
+    """Serialize data exactly as ``json.dumps(data, indent=2, ensure_ascii=False)``.
+
+    orjson's indented output is byte-identical for float-free payloads, so it
+    is used for those when installed. orjson would write NaN/Infinity as
+    ``null`` and spell exponent floats differently (``0.00001``, ``1e20``), so
+    payloads holding floats, and objects orjson rejects (non-str keys,
+    oversized ints), use the stdlib encoder.
+    """
+    if orjson is not None and not contains_float(data):
+        try:
+            return orjson.dumps(data, option=orjson.OPT_INDENT_2)
+        except TypeError:
+            pass
+    return json.dumps(data, indent=2, ensure_ascii=False).encode("utf-8")
+
+
 def write_json_strict(
     *,
     data: dict,
@@ -209,9 +232,14 @@ def write_json_strict(
     run_id: str | None = None,
     quarantine_dir: Path | None = None,
     allow_raw_in_quarantine: bool = False,
+    skip_validation: bool = False,
 ) -> None:
     """Write JSON with strict schema validation and quarantine on failure.
 
+    Callers that build ``data`` entirely from their own typed structures may
+    pass ``skip_validation=True``; the check would only re-confirm the shape
+    the caller's code already guarantees.
+
     Args:
         data: Dictionary to write as JSON
         output_path: Path to output file
@@ -219,37 +247,40 @@ def write_json_strict(
         run_id: Optional run ID for quarantine filename
         quarantine_dir: Directory for quarantine files (default: output_path.parent / "quarantine")
         allow_raw_in_quarantine: If True, allow raw data in quarantine; if False, redact long strings
+        skip_validation: If True, write without validating against the schema
 
     Raises:
         RuntimeError: If validation fails (after quarantining)
     """
     # Validate against schema
-    try:
-        ok, errors = validate_data(data, schema_name, strict=True)
-        if not ok:
-            raise ValueError(f"Validation failed: {errors}")
-    except Exception as e:
-        # Quarantine invalid data
-        qdir = quarantine_dir if quarantine_dir else (output_path.parent / "quarantine")
-        quarantine_path = quarantine_invalid_json(
-            data=data,
-            schema_name=schema_name,
-            error=e,
-            quarantine_dir=qdir,
-            run_id=run_id,
-            intended_path=output_path,
-            allow_raw=allow_raw_in_quarantine,
-        )
-
-        raise RuntimeError(
-            f"Schema validation failed for {schema_name} at {output_path}. "
-            f"Invalid data quarantined to {quarantine_path}"
-        ) from e
-
-    # Write valid data
+    if not skip_validation:
+        try:
+            ok, errors = validate_data(data, schema_name, strict=True)
+            if not ok:
+                raise ValueError(f"Validation failed: {errors}")
+        except Exception as e:
+            # Quarantine invalid data
+            qdir = quarantine_dir if quarantine_dir else (output_path.parent / "quarantine")
+            quarantine_path = quarantine_invalid_json(
+                data=data,
+                schema_name=schema_name,
+                error=e,
+                quarantine_dir=qdir,
+                run_id=run_id,
+                intended_path=output_path,
+                allow_raw=allow_raw_in_quarantine,
+            )
+
+            raise RuntimeError(
+                f"Schema validation failed for {schema_name} at {output_path}. "
+                f"Invalid data quarantined to {quarantine_path}"
+            ) from e
+
+    # Write valid data; replace atomically so readers never see a partial file
     output_path.parent.mkdir(parents=True, exist_ok=True)
-    with open(output_path, "w", encoding="utf-8") as f:
-        json.dump(data, f, indent=2, ensure_ascii=False)
+    temp_path = output_path.with_suffix(output_path.suffix + ".tmp")
+    temp_path.write_bytes(_dumps_pretty(data))
+    temp_path.replace(output_path)
 
 
 def write_json_with_validation(data: dict, output_path: Path, schema_name: str) -> None:
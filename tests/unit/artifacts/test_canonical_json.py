@@ -0,0 +1,93 @@
+"""Unit tests for canonical JSON helpers."""
+
+from __future__ import annotations
+
+import json
+
+import pytest
+
+from taskx.artifacts import canonical_json
+
+_PAYLOAD = {"b": [1, True, None], "a": {"z": "ünïcode", "y": 2}}
+
+
+@pytest.mark.parametrize("use_orjson", [True, False])
+def test_canonical_dumps_is_sorted_compact_utf8(monkeypatch: pytest.MonkeyPatch, use_orjson: bool) -> None:
+    if not use_orjson:
+        monkeypatch.setattr(canonical_json, "orjson", None)
+
+    assert canonical_json.canonical_dumps(_PAYLOAD) == '{"a":{"y":2,"z":"ünïcode"},"b":[1,true,null]}'
+    assert canonical_json.canonical_dumps_bytes({1: "x"}) == b'{"1":"x"}'
+
+
+@pytest.mark.parametrize("use_orjson", [True, False])
+def test_json_loads_accepts_bytes_and_raises_json_errors(monkeypatch: pytest.MonkeyPatch, use_orjson: bool) -> None:
+    if not use_orjson:
+        monkeypatch.setattr(canonical_json, "orjson", None)
+
+    assert canonical_json.json_loads(canonical_json.canonical_dumps_bytes(_PAYLOAD)) == _PAYLOAD
+    with pytest.raises(json.JSONDecodeError):
+        canonical_json.json_loads(b"{not json")
+
+
+@pytest.mark.parametrize("use_orjson", [True, False])
+@pytest.mark.parametrize(
+    "payload",
+    [
+        _PAYLOAD,
+        {"b": "plain", "a": [1, 0.5, False]},
+        {2: "x"},
+        {"a": [1e-05, 1e20, float("nan"), float("inf")]},
+        {"a": "x\x7fy"},
+    ],
+)
+def test_ascii_canonical_dumps_matches_stdlib_sorted_form(
+    monkeypatch: pytest.MonkeyPatch, use_orjson: bool, payload: dict
+) -> None:
+    if not use_orjson:
+        monkeypatch.setattr(canonical_json, "orjson", None)
+
+    expected = json.dumps(payload, sort_keys=True, separators=(",", ":")).encode()
+
+    assert canonical_json.ascii_canonical_dumps_bytes(payload) == expected
+
+
+@pytest.mark.parametrize("use_orjson", [True, False])
+@pytest.mark.parametrize(
+    "payload",
+    [{"z": "plain", "a": [1, {}, []]}, {"a": "caf\u00e9"}, {"a": "x\x7fy"}, {"a": 1e-05}, {2: "x"}],
+)
+def test_ascii_indented_dumps_matches_stdlib(monkeypatch: pytest.MonkeyPatch, use_orjson: bool, payload: dict) -> None:
+    if not use_orjson:
+        monkeypatch.setattr(canonical_json, "orjson", None)
+
+    assert canonical_json.ascii_indented_dumps_bytes(payload) == json.dumps(payload, indent=2).encode()
+
+
+_FLOAT_PAYLOADS = [
+    {"a": 1e-05},
+    {"a": [1e20, {"b": 1.5e300}]},
+    {"a": float("nan"), "b": float("-inf")},
+    {"a": 2**64, "b": -(2**63) - 1},
+]
+
+
+@pytest.mark.parametrize("payload", _FLOAT_PAYLOADS)
+def test_canonical_dumps_bytes_do_not_depend_on_orjson(monkeypatch: pytest.MonkeyPatch, payload: dict) -> None:
+    with_orjson = canonical_json.canonical_dumps_bytes(payload)
+    monkeypatch.setattr(canonical_json, "orjson", None)
+
+    assert with_orjson == canonical_json.canonical_dumps_bytes(payload)
+
+
+@pytest.mark.parametrize(
+    "text",
+    [
+        b'{"big":18446744073709551616,"neg":-9223372036854775809}',
+        b'{"n":NaN,"i":[Infinity,-Infinity]}',
+        '{"id":"1234567890123456789012","x":1.5}',
+    ],
+)
+def test_json_loads_matches_stdlib(text: str | bytes) -> None:
+    # repr() rather than ==, so NaN compares equal and int/float types must agree
+    assert repr(canonical_json.json_loads(text)) == repr(json.loads(text))
@@ -85,3 +85,234 @@ class TestBundleExporter:
             names = zf.namelist()
             assert "repo/REPO_SNAPSHOT.json" in names
             assert "case/CASE_MANIFEST.json" in names
+
+    def test_export_manifest_hashes_match_zip_contents(self, repo_root):
+        """Manifest digests should describe the bytes streamed into the zip."""
+        import hashlib
+
+        run_dir = repo_root / "out" / "runs" / "RUN_1"
+        run_dir.mkdir()
+        (run_dir / "RUN_ENVELOPE.json").write_text('{"ok": true}')
+
+        exporter = BundleExporter(repo_root)
+        zip_path = exporter.export(last_n=1, out_dir=repo_root / "dest", case_id="CASE_HASH")
+
+        with zipfile.ZipFile(zip_path) as zf:
+            manifest = json.loads(zf.read("case/CASE_MANIFEST.json"))
+            files = {entry["path"]: entry for entry in manifest["files"]}
+            assert "taskx/runs/RUN_1/RUN_ENVELOPE.json" in files
+            assert "repo/LOG_INDEX.json" in files
+            for path, entry in files.items():
+                data = zf.read(path)
+                assert entry["sha256"] == hashlib.sha256(data).hexdigest()
+                assert entry["size_bytes"] == len(data)
+
+    def test_collect_taskx_artifacts_copies_nested_runs(self, repo_root):
+        """Should copy run trees in one pass and keep source mtimes."""
+        import os
+
+        run_dir = repo_root / "out" / "runs" / "RUN_1"
+        (run_dir / "nested").mkdir(parents=True)
+        (run_dir / "nested" / "trace.txt").write_text("trace")
+        os.utime(run_dir / "nested" / "trace.txt", (1_000_000, 1_000_000))
+
+        exporter = BundleExporter(repo_root)
+        temp_dir = repo_root / "temp_artifacts"
+        entries = exporter.collect_taskx_artifacts(1, temp_dir)
+
+        assert sorted(entries) == ["taskx/runs/RUN_1/nested/trace.txt", "taskx/task_queue.json"]
+        copied = temp_dir / "taskx" / "runs" / "RUN_1" / "nested" / "trace.txt"
+        assert copied.read_text() == "trace"
+        assert copied.stat().st_mtime == 1_000_000
+
+    def test_collect_repo_logs_matches_excludes_as_globs(self, repo_root):
+        """Excludes should prune whole directories without substring false positives."""
+        (repo_root / "node_modules" / "pkg").mkdir(parents=True)
+        (repo_root / "node_modules" / "pkg" / "install.log").write_text("skip")
+        (repo_root / "docs").mkdir()
+        (repo_root / "docs" / "node_modules_notes.log").write_text("keep")
+
+        exporter = BundleExporter(repo_root)
+        sources, log_index = exporter._select_repo_logs()
+
+        included = [entry["path"] for entry in log_index["included"]]
+        assert included == ["app.log", "docs/node_modules_notes.log"]
+        assert [arcname for arcname, _, _ in sources] == [
+            "repo/logs/app.log",
+            "repo/logs/docs/node_modules_notes.log",
+        ]
+
+    def test_export_stores_already_compressed_payloads(self, repo_root):
+        """Compressed inputs should be stored, text should be deflated."""
+        import gzip
+
+        run_dir = repo_root / "out" / "runs" / "RUN_1"
+        run_dir.mkdir()
+        (run_dir / "trace.gz").write_bytes(gzip.compress(b"trace " * 1000))
+        (run_dir / "stdout.txt").write_text("line\n" * 1000)
+
+        exporter = BundleExporter(repo_root)
+        zip_path = exporter.export(last_n=1, out_dir=repo_root / "dest", case_id="CASE_STORE")
+
+        with zipfile.ZipFile(zip_path) as zf:
+            assert zf.getinfo("taskx/runs/RUN_1/trace.gz").compress_type == zipfile.ZIP_STORED
+            assert zf.getinfo("taskx/runs/RUN_1/stdout.txt").compress_type == zipfile.ZIP_DEFLATED
+            assert zf.read("taskx/runs/RUN_1/stdout.txt") == b"line\n" * 1000
+            assert zf.testzip() is None
+
+    def test_repo_snapshot_reads_head_without_git(self, repo_root):
+        """Should resolve HEAD from loose and packed refs without spawning git."""
+        git_dir = repo_root / ".git"
+        (git_dir / "refs" / "heads").mkdir(parents=True)
+        (git_dir / "HEAD").write_text("ref: refs/heads/main\n")
+        (git_dir / "packed-refs").write_text(
+            "# pack-refs with: peeled fully-peeled sorted\n" + "a" * 40 + " refs/heads/main\n"
+        )
+
+        exporter = BundleExporter(repo_root)
+        with patch("subprocess.check_output") as check_output:
+            snapshot = exporter._repo_snapshot()
+            assert (snapshot["head_sha"], snapshot["branch"]) == ("a" * 40, "main")
+
+            (git_dir / "refs" / "heads" / "main").write_text("b" * 40 + "\n")
+            snapshot = exporter._repo_snapshot()
+            assert (snapshot["head_sha"], snapshot["branch"]) == ("b" * 40, "main")
+        check_output.assert_not_called()
+        assert snapshot["git_available"] is True
+
+    def test_taskx_sources_take_newest_run_dirs_only(self, repo_root):
+        """Stray files under out/runs should not consume last_n slots."""
+        import os
+
+        runs_dir = repo_root / "out" / "runs"
+        for name, mtime in (("RUN_OLD", 1_000_000_000), ("RUN_NEW", 1_000_000_100)):
+            (runs_dir / name).mkdir()
+            (runs_dir / name / "report.json").write_text("{}")
+            os.utime(runs_dir / name, (mtime, mtime))
+        (runs_dir / "notes.txt").write_text("newest, but not a run")
+
+        exporter = BundleExporter(repo_root)
+        arcnames = [arcname for arcname, _, _ in exporter._taskx_artifact_sources(1)]
+
+        assert arcnames == ["taskx/task_queue.json", "taskx/runs/RUN_NEW/report.json"]
+
+    def test_zip_sources_pipeline_handles_multi_chunk_and_errors(self, repo_root, tmp_path):
+        """The read/hash/write pipeline should hash large files and surface reader errors."""
+        import hashlib
+        import os
+
+        big = repo_root / "big.bin"
+        big.write_bytes(os.urandom(2 * 1024 * 1024 + 123))
+        empty = repo_root / "empty.txt"
+        empty.write_bytes(b"")
+        sources = [("big.bin", big, big.stat()), ("empty.txt", empty, empty.stat())]
+
+        exporter = BundleExporter(repo_root)
+        with zipfile.ZipFile(tmp_path / "out.zip", "w") as zf:
+            files = exporter._zip_sources(zf, sources)
+        assert [entry["path"] for entry in files] == ["big.bin", "empty.txt"]
+        assert files[0]["sha256"] == hashlib.sha256(big.read_bytes()).hexdigest()
+        assert files[1]["size_bytes"] == 0
+        with zipfile.ZipFile(tmp_path / "out.zip") as zf:
+            assert zf.read("big.bin") == big.read_bytes()
+
+        missing = [("gone.txt", repo_root / "gone.txt", empty.stat())]
+        with zipfile.ZipFile(tmp_path / "err.zip", "w") as zf, pytest.raises(FileNotFoundError):
+            exporter._zip_sources(zf, missing)
+
+    def test_zip_sources_sniffs_only_bytes_read(self, repo_root, tmp_path, monkeypatch):
+        """A short file must not be classified by stale bytes left in a recycled buffer."""
+        from taskx.pipeline.bundle import exporter as exporter_mod
+
+        monkeypatch.setattr(exporter_mod, "_STREAM_CHUNK", 16)
+        gz_like = repo_root / "gz_like.bin"
+        gz_like.write_bytes(b"\x1f\x8b" * 200)
+        tiny = repo_root / "tiny.txt"
+        tiny.write_bytes(b"\x1f")
+        sources = [("gz_like.bin", gz_like, gz_like.stat()), ("tiny.txt", tiny, tiny.stat())]
+
+        exporter = BundleExporter(repo_root)
+        with zipfile.ZipFile(tmp_path / "out.zip", "w") as zf:
+            exporter._zip_sources(zf, sources)
+        with zipfile.ZipFile(tmp_path / "out.zip") as zf:
+            assert zf.getinfo("gz_like.bin").compress_type == zipfile.ZIP_STORED
+            assert zf.getinfo("tiny.txt").compress_type == zipfile.ZIP_DEFLATED
+
+    def test_export_failure_leaves_no_partial_zip(self, repo_root):
+        """A failed export should remove its temporary archive and not create the bundle."""
+        dest = repo_root / "dest"
+        exporter = BundleExporter(repo_root)
+
+        with patch.object(exporter, "_repo_snapshot", side_effect=RuntimeError("boom")), pytest.raises(
+            RuntimeError, match="boom"
+        ):
+            exporter.export(last_n=1, out_dir=dest, case_id="CASE_FAIL")
+
+        assert list(dest.iterdir()) == []
+
+    @pytest.mark.parametrize(
+        "payload",
+        [
+            {"branch": "main", "files": [{"path": "a.log", "size_bytes": 3}]},
+            {"path": "logs/ünïcode.log", "author": "Zoë"},
+            {"huge": 2**70, "ratio": 1e-05},
+            {"path": "logs/x\x7fy.log"},
+        ],
+    )
+    def test_dumps_indented_matches_stdlib(self, payload):
+        """Bundle JSON bytes must not depend on whether orjson is installed."""
+        from taskx.pipeline.bundle.exporter import _dumps_indented
+
+        assert _dumps_indented(payload) == json.dumps(payload, indent=2).encode("ascii")
+
+    def test_load_config_parses_once_per_file_version(self, repo_root):
+        """Config should be parsed once per file version and not shared between exporters."""
+        from taskx.pipeline.bundle import exporter as exporter_mod
+
+        config = repo_root / "taskx_bundle.yaml"
+        config.write_text("logs:\n  globs: ['**/*.log']\n  excludes: []\n  caps: {per_file_max_mb: 1, total_logs_max_mb: 2, max_files: 3}\n")
+        exporter_mod._parse_config_cached.cache_clear()
+
+        first = BundleExporter(repo_root)
+        first.config["logs"]["caps"]["per_file_max_mb"] = 99
+        second = BundleExporter(repo_root)
+
+        assert second.config["logs"]["caps"]["per_file_max_mb"] == 1
+        assert exporter_mod._parse_config_cached.cache_info().hits == 1
+
+    def test_load_config_deep_merges_partial_overrides(self, repo_root):
+        """Overriding one nested key should keep the other defaults."""
+        (repo_root / "taskx_bundle.yaml").write_text("logs:\n  caps:\n    max_files: 1\n")
+        (repo_root / "second.log").write_text("more")
+
+        exporter = BundleExporter(repo_root)
+
+        assert exporter.config["logs"]["caps"]["max_files"] == 1
+        assert exporter.config["logs"]["caps"]["per_file_max_mb"] == 25
+        assert "**/*.log" in exporter.config["logs"]["globs"]
+
+        _, log_index = exporter._select_repo_logs()
+        assert [entry["path"] for entry in log_index["included"]] == ["app.log"]
+        assert log_index["skipped"] == [{"path": "second.log", "reason": "file_cap_hit"}]
+
+    def test_log_walk_prunes_excluded_directories(self, repo_root):
+        """Excluded directories should not be listed at all."""
+        import os
+
+        (repo_root / "build" / "deep").mkdir(parents=True)
+        (repo_root / "build" / "deep" / "x.log").write_text("x")
+        (repo_root / "taskx_bundle.yaml").write_text("logs:\n  excludes: ['build', '**/.git/**']\n")
+
+        exporter = BundleExporter(repo_root)
+        scanned = []
+        real_scandir = os.scandir
+
+        def _tracking_scandir(path):
+            scanned.append(os.path.relpath(path, repo_root))
+            return real_scandir(path)
+
+        with patch("taskx.pipeline.bundle.exporter.os.scandir", _tracking_scandir):
+            rels = [rel for rel, _ in exporter._iter_log_candidates()]
+
+        assert "app.log" in rels
+        assert not any(path.startswith("build") for path in scanned)
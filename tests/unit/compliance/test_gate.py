@@ -0,0 +1,184 @@
+"""Unit tests for the allowlist compliance gate helpers."""
+
+from __future__ import annotations
+
+from fnmatch import fnmatch
+from pathlib import Path
+
+from taskx.pipeline.compliance import gate
+from taskx.pipeline.compliance.types import AllowlistDiff, Violation
+
+_ALLOWLIST = ["`src/app.py`", " docs/*.md ", "tests/test_[ab].py", "literal[x].txt"]
+
+
+def test_classify_files_matches_exact_and_glob_patterns() -> None:
+    changed = {"src/app.py", "docs/guide.md", "tests/test_a.py", "tests/test_c.py", "literal[x].txt", "setup.py"}
+
+    allowed, disallowed = gate._classify_files(changed, gate._compile_allowlist(_ALLOWLIST), Path("/repo"))
+
+    assert sorted(allowed) == ["docs/guide.md", "literal[x].txt", "src/app.py", "tests/test_a.py"]
+    assert sorted(disallowed) == ["setup.py", "tests/test_c.py"]
+
+
+def test_compiled_allowlist_agrees_with_fnmatch() -> None:
+    literals, regex = gate._compile_allowlist(_ALLOWLIST)
+    assert regex is not None
+    cleaned = [pattern.strip().strip("`") for pattern in _ALLOWLIST]
+
+    for path in ["docs/a/b.md", "docs/.md", "tests/test_b.py", "src/app.pyc", "literalx.txt"]:
+        expected = any(path == p or fnmatch(path, p) for p in cleaned)
+        assert (path in literals or bool(regex.match(path))) is expected
+
+
+def test_detect_changed_files_fs_uses_mtime_and_skips_hidden(tmp_path: Path) -> None:
+    import os
+
+    hidden_or_skipped = [".git/objects/ab", "src/.cache/new.bin", ".env", "src/__pycache__/new.pyc", "node_modules/x.js"]
+    for rel in ["src/new.py", "src/old.py", *hidden_or_skipped]:
+        path = tmp_path / rel
+        path.parent.mkdir(parents=True, exist_ok=True)
+        path.write_text("x")
+        os.utime(path, (2_000_000_000, 2_000_000_000))
+    os.utime(tmp_path / "src/old.py", (1_000_000_000, 1_000_000_000))
+
+    envelope = {"generated_at": "2020-01-01T00:00:00Z"}
+    assert gate._detect_changed_files_fs(tmp_path, envelope) == {"src/new.py"}
+
+
+def test_detect_changed_files_git_lists_tracked_and_untracked(tmp_path: Path) -> None:
+    import subprocess
+
+    def git(*args: str) -> None:
+        subprocess.run(
+            ["git", "-c", "user.name=t", "-c", "user.email=t@example.invalid", *args],
+            cwd=tmp_path,
+            check=True,
+            capture_output=True,
+        )
+
+    git("init", "-q")
+    (tmp_path / "keep.py").write_text("a")
+    (tmp_path / "old name.py").write_text("rename me\n" * 20)
+    (tmp_path / "gone.py").write_text("b")
+    git("add", ".")
+    assert gate._detect_changed_files_git(tmp_path) == {"keep.py", "old name.py", "gone.py"}
+    git("commit", "-q", "-m", "init")
+
+    (tmp_path / "keep.py").write_text("changed")
+    git("mv", "old name.py", "new name.py")
+    (tmp_path / "gone.py").unlink()
+    (tmp_path / "pkg").mkdir()
+    (tmp_path / "pkg" / "fresh.py").write_text("c")
+
+    assert gate._detect_changed_files_git(tmp_path) == {"keep.py", "new name.py", "gone.py", "pkg/fresh.py"}
+
+
+def test_write_violations_md_lists_files_and_violations(tmp_path: Path) -> None:
+    result = AllowlistDiff(
+        run_id="RUN_1",
+        task_id="T1",
+        task_title="Demo",
+        allowlist=["src/app.py"],
+        diff_mode_used="fs",
+        allowed_files=["src/app.py"],
+        disallowed_files=[],
+        violations=[Violation(type="allowlist_violation", message="bad", files=["x.py"])],
+        diff_hash="h",
+    )
+
+    gate._write_violations_md(result, tmp_path, "fs")
+
+    text = (tmp_path / "VIOLATIONS.md").read_text()
+    assert text.startswith("# Allowlist Compliance Report\n\n**Status:** FAIL ✗ (1 violations)\n")
+    assert "- ✓ `src/app.py`\n\n## Disallowed Changed Files\n\n*(none)*\n" in text
+    assert text.endswith("### 1. allowlist_violation\n**Message:** bad\n**Files:**\n- `x.py`\n")
+
+
+def test_has_verification_evidence_requires_content_under_heading(tmp_path: Path) -> None:
+    evidence = tmp_path / "EVIDENCE.md"
+    assert not gate._has_verification_evidence(evidence)
+
+    evidence.write_text("# Evidence\n## Command outputs pasted\n\n   \n## Next\nlater\n", encoding="utf-8")
+    assert not gate._has_verification_evidence(evidence)
+
+    evidence.write_text("## Command outputs pasted\n\n$ pytest -q\n", encoding="utf-8")
+    assert gate._has_verification_evidence(evidence)
+
+
+def test_detect_changed_files_fs_compares_exact_nanoseconds(tmp_path: Path) -> None:
+    import os
+
+    envelope_ns = 1_704_067_200_000_001_000  # 2024-01-01T00:00:00.000001Z
+    for name, mtime_ns in (("same.py", envelope_ns), ("later.py", envelope_ns + 1)):
+        path = tmp_path / name
+        path.write_text("x")
+        os.utime(path, ns=(mtime_ns, mtime_ns))
+
+    envelope = {"generated_at": "2024-01-01T00:00:00.000001Z"}
+    assert gate._detect_changed_files_fs(tmp_path, envelope) == {"later.py"}
+
+
+def test_run_allowlist_gate_clean_tree_uses_empty_diff_hash(tmp_path: Path) -> None:
+    import json
+
+    run_dir = tmp_path / "run"
+    run_dir.mkdir()
+    envelope = {
+        "run_id": "RUN_1",
+        "generated_at": "1970-01-01T00:00:00Z",
+        "task_packet": {"id": "T1", "title": "Demo", "allowlist": ["src/app.py"]},
+    }
+    (run_dir / "RUN_ENVELOPE.json").write_text(json.dumps(envelope), encoding="utf-8")
+
+    result = gate.run_allowlist_gate(run_dir, tmp_path, require_verification_evidence=False, diff_mode="fs")
+
+    assert (result.allowed_files, result.disallowed_files, result.violations) == ([], [], [])
+    assert gate._compute_diff_hash([], []) == result.diff_hash
+
+
+def test_compute_diff_hash_joins_sorted_lists_around_separator() -> None:
+    import hashlib
+
+    expected = hashlib.sha256(b"a.py\nb.py\n---\nz.py").hexdigest()
+    assert gate._compute_diff_hash(["a.py", "b.py"], ["z.py"]) == expected
+
+
+def test_run_allowlist_gate_sorts_once_for_result_violation_and_hash(tmp_path: Path) -> None:
+    import json
+    import os
+
+    run_dir = tmp_path / "run"
+    run_dir.mkdir()
+    for rel in ("src/b.py", "src/a.py", "zz.txt", "setup.py"):
+        path = tmp_path / "repo" / rel
+        path.parent.mkdir(parents=True, exist_ok=True)
+        path.write_text("x")
+        os.utime(path, (2_000_000_000, 2_000_000_000))
+    envelope = {
+        "run_id": "RUN_1",
+        "generated_at": "2020-01-01T00:00:00Z",
+        "task_packet": {"id": "T1", "title": "Demo", "allowlist": ["src/*.py"]},
+    }
+    (run_dir / "RUN_ENVELOPE.json").write_text(json.dumps(envelope), encoding="utf-8")
+
+    result = gate.run_allowlist_gate(run_dir, tmp_path / "repo", require_verification_evidence=False, diff_mode="fs")
+
+    assert result.allowed_files == ["src/a.py", "src/b.py"]
+    assert result.disallowed_files == ["setup.py", "zz.txt"]
+    assert result.violations[0].files == ["setup.py", "zz.txt"]
+    assert result.violations[0].files is not result.disallowed_files
+    assert gate._compute_diff_hash(["src/a.py", "src/b.py"], ["setup.py", "zz.txt"]) == result.diff_hash
+
+
+def test_run_allowlist_gate_requires_envelope(tmp_path: Path) -> None:
+    import pytest
+
+    with pytest.raises(FileNotFoundError, match=r"RUN_ENVELOPE\.json not found"):
+        gate.run_allowlist_gate(tmp_path, tmp_path, diff_mode="fs")
+
+
+def test_detect_changed_files_fs_ignores_unparseable_generated_at(tmp_path: Path) -> None:
+    (tmp_path / "new.py").write_text("x")
+
+    assert gate._detect_changed_files_fs(tmp_path, {"generated_at": "not-a-time"}) == set()
+    assert gate._detect_changed_files_fs(tmp_path, {"generated_at": 1_700_000_000}) == set()
@@ -0,0 +1,161 @@
+"""Unit tests for evidence collector hashing."""
+
+from __future__ import annotations
+
+import hashlib
+import json
+from typing import TYPE_CHECKING
+
+import pytest
+
+from taskx.pipeline.evidence import collector
+from taskx.pipeline.evidence.types import Claim
+
+if TYPE_CHECKING:
+    from pathlib import Path
+
+
+def _summary() -> dict:
+    return {
+        "run_id": "RUN_1",
+        "claims": {"count": 1, "items": [{"claim_id": "T_C001", "text": "ünïcode", "confidence": 0.9}]},
+        "hashes": {"run_folder_hash": "abc", "summary_hash": "stale"},
+    }
+
+
+def test_summary_hash_ignores_and_preserves_existing_summary_hash() -> None:
+    summary = _summary()
+    blank = _summary()
+    blank["hashes"]["summary_hash"] = ""
+    expected = hashlib.sha256(json.dumps(blank, sort_keys=True, separators=(",", ":")).encode()).hexdigest()
+
+    assert collector._compute_summary_hash(summary) == expected
+    assert summary["hashes"]["summary_hash"] == "stale"
+
+
+def test_summary_hash_bytes_match_stdlib_for_ascii_payloads() -> None:
+    summary = _summary()
+    summary["claims"]["items"][0]["text"] = "plain ascii"
+
+    expected = json.dumps(summary, sort_keys=True, separators=(",", ":")).encode()
+
+    assert collector._summary_hash_bytes(summary) == expected
+
+
+def test_evidence_bundle_truncates_evidence_to_budget(tmp_path: Path) -> None:
+    path = tmp_path / "EVIDENCE_BUNDLE.md"
+    claims = [Claim("T_C001", "checked_item", "done", "CHECKLIST", 0.9)]
+
+    collector._write_evidence_bundle(path, {"run_id": "RUN_1"}, {"EVIDENCE": "e" * 5000}, claims, 1000)
+
+    text = path.read_text(encoding="utf-8")
+    assert text.startswith('# Evidence Bundle\n\n## Run Envelope\n\n```json\n\n{\n  "run_id": "RUN_1"\n}\n\n```\n')
+    assert "[... Evidence section truncated due to length ...]" in text
+    assert text.count("e" * 400) == 1 and "e" * 500 not in text
+    assert text.endswith("## Claims Extracted\n\n- **T_C001** (checked_item, confidence=0.9): done\n")
+
+
+def test_extract_claims_numbers_across_sources_and_caps() -> None:
+    contents = {
+        "CHECKLIST": "- [x] first\n* [x]\n  * [x] second",
+        "EVIDENCE": "noise\nPASSED: unit\nFAILED: lint\n",
+        "RUNLOG": "DONE: never reached",
+    }
+
+    claims = collector._extract_claims(file_contents=contents, task_id="T", max_claims=3)
+
+    assert [(c.claim_id, c.claim_type, c.text) for c in claims] == [
+        ("T_C001", "constraint_respected", "first"),
+        ("T_C002", "constraint_respected", "second"),
+        ("T_C003", "test_passed", "unit"),
+    ]
+
+
+def test_run_folder_hash_streams_present_files_and_skips_missing(tmp_path: Path) -> None:
+    (tmp_path / "EVIDENCE.md").write_bytes(b"e" * (3 * 1024 * 1024 + 7))
+    (tmp_path / "RUN_ENVELOPE.json").write_bytes(b"{}")
+    present = {"EVIDENCE": True, "RUN_ENVELOPE": True, "PLAN": True, "RUNLOG": False}
+
+    expected = "\n".join(
+        f"{name}:{hashlib.sha256((tmp_path / name).read_bytes()).hexdigest()}"
+        for name in ("EVIDENCE.md", "RUN_ENVELOPE.json")
+    )
+
+    assert collector._compute_run_folder_hash(tmp_path, present) == hashlib.sha256(expected.encode()).hexdigest()
+
+
+def test_check_files_present_reports_every_known_file_in_order(tmp_path: Path) -> None:
+    (tmp_path / "COMMANDS.sh").write_text("#!/bin/sh\n", encoding="utf-8")
+    (tmp_path / "RUN_ENVELOPE.json").write_text("{}", encoding="utf-8")
+
+    present = collector._check_files_present(tmp_path)
+
+    assert list(present) == ["RUNLOG", "EVIDENCE", "CHECKLIST", "PLAN", "COMMANDS", "RUN_ENVELOPE", "TASK_PACKET"]
+    assert [key for key, found in present.items() if found] == ["COMMANDS", "RUN_ENVELOPE"]
+    assert collector._load_file_contents(tmp_path, present)["COMMANDS"] == "#!/bin/sh\n"
+
+
+def test_run_folder_hash_is_identical_on_the_thread_pool_path(tmp_path: Path, monkeypatch: pytest.MonkeyPatch) -> None:
+    for name in ("RUNLOG.md", "EVIDENCE.md", "PLAN.md"):
+        (tmp_path / name).write_text(name * 1000, encoding="utf-8")
+    present = {"RUNLOG": True, "EVIDENCE": True, "PLAN": True, "CHECKLIST": True}
+    serial = collector._compute_run_folder_hash(tmp_path, present)
+
+    monkeypatch.setattr(collector, "_PARALLEL_HASH_MIN_BYTES", 1)
+    monkeypatch.setattr(collector.os, "cpu_count", lambda: 4)
+    assert collector._hash_in_parallel([tmp_path / "RUNLOG.md", tmp_path / "PLAN.md"])
+
+    assert collector._compute_run_folder_hash(tmp_path, present) == serial
+
+
+def test_claims_ledger_matches_csv_writer_output(tmp_path: Path) -> None:
+    import csv
+    import io
+
+    texts = ["plain", "comma, here", 'say "hi"', "multi\nline", "cr\rhere", " padded ", ""]
+    claims = [Claim(f"T_C{i:03d}", "test_passed", text, "EVIDENCE", 0.9) for i, text in enumerate(texts, 1)]
+    path = tmp_path / "CLAIMS_LEDGER.csv"
+
+    collector._write_claims_ledger(path, claims, "RUN,1", "T1")
+
+    expected = io.StringIO()
+    writer = csv.writer(expected)
+    writer.writerow(["run_id", "task_id", "claim_id", "claim_type", "text", "evidence_source", "confidence"])
+    for claim in claims:
+        writer.writerow(["RUN,1", "T1", claim.claim_id, claim.claim_type, claim.text, claim.evidence_source, 0.9])
+    assert path.read_bytes().decode("utf-8") == expected.getvalue()
+
+
+def test_claims_ledger_accepts_non_str_ids_like_csv_writer(tmp_path: Path) -> None:
+    import csv
+    import io
+
+    claim = Claim("T_C001", "test_passed", "ok", "EVIDENCE", 0.9)
+    path = tmp_path / "CLAIMS_LEDGER.csv"
+
+    collector._write_claims_ledger(path, [claim], 42, None)  # type: ignore[arg-type]
+
+    expected = io.StringIO()
+    writer = csv.writer(expected)
+    writer.writerow(["run_id", "task_id", "claim_id", "claim_type", "text", "evidence_source", "confidence"])
+    writer.writerow([42, None, "T_C001", "test_passed", "ok", "EVIDENCE", 0.9])
+    assert path.read_bytes().decode("utf-8") == expected.getvalue()
+
+
+def test_extract_claims_ignores_prefixes_that_do_not_start_a_line() -> None:
+    contents = {"EVIDENCE": "noise\nsee PASSED: inline\n  PASSED: real\n", "RUNLOG": "no markers here\n"}
+
+    claims = collector._extract_claims(file_contents=contents, task_id="T", max_claims=10)
+
+    assert [(c.claim_type, c.text) for c in claims] == [("test_passed", "real")]
+
+
+@pytest.mark.parametrize("use_orjson", [True, False])
+def test_dumps_envelope_matches_stdlib_indent(monkeypatch: pytest.MonkeyPatch, use_orjson: bool) -> None:
+    from taskx.artifacts import canonical_json
+
+    if not use_orjson:
+        monkeypatch.setattr(canonical_json, "orjson", None)
+    envelope = {"task": "café", "path": "x\x7fy", "score": 1e-05, "ok": True, "items": []}
+
+    assert collector._dumps_envelope(envelope) == json.dumps(envelope, indent=2)
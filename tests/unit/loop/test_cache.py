@@ -0,0 +1,200 @@
+"""Unit tests for the loop stage output cache."""
+
+from __future__ import annotations
+
+import shutil
+from typing import TYPE_CHECKING, Any
+
+from taskx.pipeline.loop import cache, orchestrator
+from taskx.pipeline.loop.types import LoopInputs, StageResult
+
+if TYPE_CHECKING:
+    from pathlib import Path
+
+    import pytest
+
+
+def _key(**overrides: Any) -> str:
+    params: dict[str, Any] = {
+        "pipeline_version": "0.1.0",
+        "stage_name": "compile_tasks",
+        "stage_inputs": {"mode": "mvp", "seed": 1},
+        "upstream_hash": "abc",
+    }
+    params.update(overrides)
+    return cache.stage_cache_key(**params)
+
+
+def test_stage_cache_key_tracks_every_causal_input() -> None:
+    base = _key()
+    assert base == _key(stage_inputs={"seed": 1, "mode": "mvp"})
+    assert base != _key(upstream_hash="abd")
+    assert base != _key(stage_inputs={"mode": "mvp", "seed": 2})
+    assert base != _key(pipeline_version="0.2.0")
+    assert base != _key(stage_name="run_task")
+
+
+def test_stage_cache_key_tracks_taskx_version_and_format(monkeypatch: pytest.MonkeyPatch) -> None:
+    base = _key()
+
+    monkeypatch.setattr(cache, "__version__", "99.0.0")
+    assert _key() != base
+    monkeypatch.undo()
+
+    monkeypatch.setattr(cache, "CACHE_FORMAT_VERSION", "next")
+    assert _key() != base
+
+
+def test_stage_cache_key_tracks_stage_implementation(monkeypatch: pytest.MonkeyPatch) -> None:
+    base = orchestrator._stage_cache_key_for("deterministic", "compile_tasks", "taskx.pipeline.task_compiler", {}, "mined")
+
+    monkeypatch.setattr(orchestrator, "_implementation_digest", lambda package: "edited")
+    edited = orchestrator._stage_cache_key_for(
+        "deterministic", "compile_tasks", "taskx.pipeline.task_compiler", {}, "mined"
+    )
+
+    assert base is not None
+    assert edited != base
+
+
+def test_stage_cache_key_tracks_serializers_and_orjson(monkeypatch: pytest.MonkeyPatch) -> None:
+    from taskx.artifacts import canonical_json
+
+    def _compile_key() -> str | None:
+        return orchestrator._stage_cache_key_for(
+            "deterministic", "compile_tasks", "taskx.pipeline.task_compiler", {}, "mined"
+        )
+
+    base = _compile_key()
+    digest = orchestrator._source_digest
+
+    monkeypatch.setattr(
+        orchestrator,
+        "_source_digest",
+        lambda name: "edited" if name == "taskx.utils.json_output" else digest(name),
+    )
+    assert _compile_key() != base
+    monkeypatch.undo()
+
+    monkeypatch.setattr(canonical_json, "orjson", None)
+    assert _compile_key() != base
+
+
+def test_source_digest_reads_single_modules() -> None:
+    assert orchestrator._source_digest("taskx.artifacts.canonical_json") != orchestrator._source_digest(
+        "taskx.utils.json_output"
+    )
+
+
+def test_stage_cache_opt_out_disables_keys(monkeypatch: pytest.MonkeyPatch) -> None:
+    monkeypatch.setenv(cache.TASKX_NO_STAGE_CACHE_ENV, "1")
+
+    assert orchestrator._stage_cache_key_for("deterministic", "compile_tasks", "taskx.pipeline.task_compiler", {}, "mined") is None
+
+
+def test_store_then_restore_copies_outputs_back(tmp_path: Path) -> None:
+    loop_dir = tmp_path / "loop"
+    (loop_dir / "task_queue").mkdir(parents=True)
+    (loop_dir / "task_queue" / "TASK_QUEUE.json").write_text("{}", encoding="utf-8")
+    root = cache.stage_cache_root(loop_dir)
+
+    assert cache.restore_stage(root, "compile_tasks", "k", loop_dir) is None
+    cache.store_stage(root, "compile_tasks", "k", loop_dir, ["task_queue/TASK_QUEUE.json"], "a" * 64)
+    cache.store_stage(root, "compile_tasks", "bad", loop_dir, ["task_queue/TASK_QUEUE.json"], "not-a-hash")
+    shutil.rmtree(loop_dir)
+
+    assert cache.restore_stage(root, "compile_tasks", "bad", loop_dir) is None
+    assert cache.restore_stage(root, "compile_tasks", "k", loop_dir) == (["task_queue/TASK_QUEUE.json"], "a" * 64)
+    restored = loop_dir / "task_queue" / "TASK_QUEUE.json"
+    assert restored.read_text(encoding="utf-8") == "{}"
+    assert not restored.is_symlink()
+
+
+def _mined(loop_dir: Path) -> StageResult:
+    spec_mine = loop_dir / "spec_mine"
+    spec_mine.mkdir(parents=True)
+    (spec_mine / "MASTER_DESIGN_SPEC_V3.md").write_text("# Spec\n", encoding="utf-8")
+    (spec_mine / "SOURCE_INDEX.json").write_text("{}", encoding="utf-8")
+    return StageResult(True, "ok", None, None, "spec_mine", {}, [], {"stage_output_hash": "mined"}, None)
+
+
+def test_compile_stage_replays_cached_outputs(tmp_path: Path, monkeypatch: pytest.MonkeyPatch) -> None:
+    calls: list[str] = []
+
+    def _compile(*, output_dir: Path, timestamp_mode: str, **_: Any) -> dict[str, Any]:
+        calls.append(timestamp_mode)
+        (output_dir / "TASK_PACKETS").mkdir(parents=True, exist_ok=True)
+        (output_dir / "TASK_QUEUE.json").write_text('{"packets": 1}', encoding="utf-8")
+        (output_dir / "TASK_PACKETS" / "T1_demo.md").write_text("# T1\n", encoding="utf-8")
+        return {}
+
+    monkeypatch.setattr(orchestrator, "compile_task_queue", _compile)
+    loop_dir = tmp_path / "loop"
+    mined = _mined(loop_dir)
+    inputs = LoopInputs(tmp_path, "mvp", 5, 1, None, None, False, False)
+
+    first = orchestrator._run_compile_tasks(loop_dir, inputs, "deterministic", False, mined)
+    shutil.rmtree(loop_dir / "task_queue")
+    second = orchestrator._run_compile_tasks(loop_dir, inputs, "deterministic", False, mined)
+
+    assert calls == ["deterministic"]
+    assert second == first
+    assert (loop_dir / "task_queue" / "TASK_PACKETS" / "T1_demo.md").read_text(encoding="utf-8") == "# T1\n"
+
+    orchestrator._run_compile_tasks(loop_dir, inputs, "wallclock", False, mined)
+    orchestrator._run_compile_tasks(loop_dir, inputs, "wallclock", False, mined)
+    assert calls == ["deterministic", "wallclock", "wallclock"]
+
+
+def test_evidence_stage_replays_into_a_fresh_loop(tmp_path: Path, monkeypatch: pytest.MonkeyPatch) -> None:
+    from taskx.pipeline.evidence import collector
+
+    calls: list[Path] = []
+
+    def _collect(*, run_dir: Path, **_: Any) -> dict[str, str]:
+        calls.append(run_dir)
+        (run_dir / "RUN_SUMMARY.json").write_text('{"status": "ok"}', encoding="utf-8")
+        return {"summary": str(run_dir / "RUN_SUMMARY.json")}
+
+    monkeypatch.setattr(collector, "collect_evidence", _collect)
+    inputs = LoopInputs(tmp_path, "mvp", 5, 1, "T1", None, True, False)
+    ran = StageResult(True, "ok", None, None, "runs/RUN_T1", {}, [], {"stage_output_hash": "ran"}, None)
+
+    results = []
+    for loop_name in ("loop_a", "loop_b"):
+        loop_dir = tmp_path / loop_name
+        (loop_dir / "runs" / "RUN_T1").mkdir(parents=True)
+        results.append(orchestrator._run_collect_evidence(loop_dir, inputs, "deterministic", False, ran))
+
+    assert calls == [tmp_path / "loop_a" / "runs" / "RUN_T1"]
+    assert results[1].outputs == results[0].outputs == ["runs/RUN_T1/RUN_SUMMARY.json"]
+    assert results[1].hashes == results[0].hashes
+    assert (tmp_path / "loop_b" / "runs" / "RUN_T1" / "RUN_SUMMARY.json").read_text(encoding="utf-8") == '{"status": "ok"}'
+
+
+def test_evidence_stage_key_ignores_its_own_outputs(tmp_path: Path, monkeypatch: pytest.MonkeyPatch) -> None:
+    from taskx.pipeline.evidence import collector
+
+    calls: list[str] = []
+
+    def _collect(*, run_dir: Path, **_: Any) -> dict[str, str]:
+        calls.append((run_dir / "EVIDENCE.md").read_text(encoding="utf-8"))
+        (run_dir / "RUN_SUMMARY.json").write_text(f'{{"run": {len(calls)}}}', encoding="utf-8")
+        return {"summary": str(run_dir / "RUN_SUMMARY.json")}
+
+    monkeypatch.setattr(collector, "collect_evidence", _collect)
+    inputs = LoopInputs(tmp_path, "mvp", 5, 1, "T1", None, True, False)
+    loop_dir = tmp_path / "loop"
+    run_dir = loop_dir / "runs" / "RUN_T1"
+    run_dir.mkdir(parents=True)
+    (run_dir / "EVIDENCE.md").write_text("v1", encoding="utf-8")
+
+    # A7's hash changes once A8 has written into the run folder; A8 must still replay
+    for upstream_hash in ("before", "after"):
+        ran = StageResult(True, "ok", None, None, "runs/RUN_T1", {}, [], {"stage_output_hash": upstream_hash}, None)
+        orchestrator._run_collect_evidence(loop_dir, inputs, "deterministic", False, ran)
+    assert calls == ["v1"]
+
+    (run_dir / "EVIDENCE.md").write_text("v2", encoding="utf-8")
+    orchestrator._run_collect_evidence(loop_dir, inputs, "deterministic", False, ran)
+    assert calls == ["v1", "v2"]
@@ -0,0 +1,98 @@
+"""Unit tests for loop orchestrator hashing."""
+
+from __future__ import annotations
+
+import hashlib
+from typing import TYPE_CHECKING
+
+from taskx.pipeline.loop import orchestrator
+
+if TYPE_CHECKING:
+    from pathlib import Path
+
+    import pytest
+
+
+def test_stage_hash_streams_files_and_skips_missing(tmp_path: Path) -> None:
+    (tmp_path / "a.md").write_bytes(b"a" * 200_000)
+    (tmp_path / "empty.md").write_bytes(b"")
+    expected = "\n".join(
+        f"{name}:{hashlib.sha256((tmp_path / name).read_bytes()).hexdigest()}" for name in ("a.md", "empty.md")
+    )
+
+    stage_hash = orchestrator._compute_stage_hash(tmp_path, ["empty.md", "missing.md", "a.md"])
+
+    assert stage_hash == hashlib.sha256(expected.encode()).hexdigest()
+
+
+def test_stage_hash_is_identical_on_the_thread_pool_path(tmp_path: Path, monkeypatch: pytest.MonkeyPatch) -> None:
+    outputs = [f"task_queue/TASK_PACKETS/T{i}_demo.md" for i in range(12)]
+    for i, relpath in enumerate(outputs):
+        path = tmp_path / relpath
+        path.parent.mkdir(parents=True, exist_ok=True)
+        path.write_text(f"# T{i}\n" * (i + 1), encoding="utf-8")
+    serial = orchestrator._compute_stage_hash(tmp_path, outputs)
+
+    monkeypatch.setattr(orchestrator, "_PARALLEL_HASH_MIN_BYTES", 1)
+    monkeypatch.setattr(orchestrator.os, "cpu_count", lambda: 4)
+
+    assert orchestrator._compute_stage_hash(tmp_path, outputs) == serial
+
+
+def test_collect_output_files_matches_rglob_order(tmp_path: Path) -> None:
+    out_dir = tmp_path / "task_queue"
+    for relpath in ("TASK_QUEUE.json", "a/b.md", "a-c.md", "a/z/deep.md", "A.md", ".hidden"):
+        path = out_dir / relpath
+        path.parent.mkdir(parents=True, exist_ok=True)
+        path.write_text("x", encoding="utf-8")
+    (out_dir / "empty_dir").mkdir()
+
+    expected = [str(f.relative_to(tmp_path)) for f in sorted(out_dir.rglob("*")) if f.is_file()]
+
+    assert orchestrator._collect_output_files(out_dir, tmp_path) == expected
+    assert orchestrator._collect_output_files(tmp_path / "missing", tmp_path) == []
+
+
+def test_evidence_and_feedback_overlap_only_for_external_runs(tmp_path: Path) -> None:
+    from taskx.pipeline.loop.types import LoopInputs, StageResult
+
+    loop_dir = tmp_path / "loop"
+    inputs = LoopInputs(tmp_path, "mvp", 5, 1, "T1", None, True, True)
+    ran = StageResult(True, "ok", None, None, "runs/RUN_T1", {}, [], {}, None)
+    independent = orchestrator._evidence_and_feedback_independent
+
+    assert independent(loop_dir, inputs, ran, tmp_path / "external_runs")
+    assert not independent(loop_dir, inputs, ran, None)
+    assert not independent(loop_dir, inputs, ran, loop_dir / "runs")
+    assert not independent(loop_dir, inputs, orchestrator._skipped_stage(), tmp_path / "external_runs")
+
+
+def test_trusted_envelope_inputs_always_validate(tmp_path: Path) -> None:
+    from taskx.pipeline.loop.types import LoopInputs
+    from taskx.schemas.validator import validate_data
+
+    inputs = LoopInputs(tmp_path, "hardening", 1, 7, None, None, False, False)
+    stages = {name: orchestrator._skipped_stage() for name in orchestrator.STAGE_ORDER}
+    envelope = orchestrator._build_envelope(
+        loop_id="LOOP_1",
+        inputs=inputs,
+        stages=stages,
+        loop_hash=orchestrator._compute_loop_hash(stages),
+        timestamp_mode="wallclock",
+    )
+
+    assert orchestrator._envelope_is_trusted("LOOP_1", inputs, "wallclock")
+    assert validate_data(envelope, "loop_envelope", strict=False) == (True, [])
+
+    untrusted = [
+        ("LOOP_1", LoopInputs(tmp_path, "turbo", 1, 7, None, None, False, False), "wallclock"),
+        ("LOOP_1", LoopInputs(tmp_path, "mvp", 0, 7, None, None, False, False), "wallclock"),
+        ("LOOP_1", inputs, "frozen"),
+        ("LOOP_1", LoopInputs(tmp_path, "mvp", 1, 7, None, None, 1, False), "wallclock"),  # type: ignore[arg-type]
+        ("LOOP_1", LoopInputs(tmp_path, "mvp", 1, 7, None, None, False, None), "wallclock"),  # type: ignore[arg-type]
+        ("LOOP_1", LoopInputs(tmp_path, "mvp", 1, 7, 3, None, False, False), "wallclock"),  # type: ignore[arg-type]
+        ("LOOP_1", LoopInputs(tmp_path, "mvp", 1, 7, None, tmp_path, False, False), "wallclock"),  # type: ignore[arg-type]
+        (None, inputs, "wallclock"),
+    ]
+    for loop_id, candidate, timestamp_mode in untrusted:
+        assert not orchestrator._envelope_is_trusted(loop_id, candidate, timestamp_mode)  # type: ignore[arg-type]
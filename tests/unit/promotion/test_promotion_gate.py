@@ -0,0 +1,62 @@
+"""Unit tests for the run promotion gate."""
+
+from __future__ import annotations
+
+from typing import TYPE_CHECKING
+
+import pytest
+
+from taskx.pipeline.promotion.gate import promote_run
+
+if TYPE_CHECKING:
+    from pathlib import Path
+
+
+def test_promote_run_reports_missing_inputs_in_order(tmp_path: Path) -> None:
+    with pytest.raises(FileNotFoundError, match="ALLOWLIST_DIFF.json not found"):
+        promote_run(tmp_path)
+
+    (tmp_path / "ALLOWLIST_DIFF.json").write_text("not json", encoding="utf-8")
+    with pytest.raises(FileNotFoundError, match="RUN_ENVELOPE.json not found"):
+        promote_run(tmp_path)
+
+
+def test_verification_evidence_needs_content_before_next_heading(tmp_path: Path) -> None:
+    from taskx.pipeline.promotion.gate import _has_verification_evidence
+
+    path = tmp_path / "EVIDENCE.md"
+    assert not _has_verification_evidence(path)
+
+    cases = {
+        "# Evidence\n## Command outputs pasted\n\n$ pytest\nok\n": True,
+        "## Command outputs pasted\n\n   \n## Next\nlate output\n": False,
+        "## Command outputs pasted\n## Command outputs pasted\noutput": True,
+        "## Command outputs pasted": False,
+        "no heading here\n": False,
+    }
+    for text, expected in cases.items():
+        path.write_text(text, encoding="utf-8")
+        assert _has_verification_evidence(path) is expected, text
+
+
+@pytest.mark.parametrize("use_orjson", [True, False])
+def test_token_hash_matches_stdlib_encoding_for_escaped_text(
+    monkeypatch: pytest.MonkeyPatch, use_orjson: bool
+) -> None:
+    import hashlib
+    import json
+
+    from taskx.artifacts import canonical_json
+    from taskx.pipeline.promotion.gate import _compute_token_hash
+
+    if not use_orjson:
+        monkeypatch.setattr(canonical_json, "orjson", None)
+    document = {
+        "status": "refused",
+        "reasons": ["bad\x7fpath", "café"],
+        "run_dir": "runs/x\x7fy",
+        "evidence_path": "runs/x\x7fy/EVIDENCE.md",
+    }
+
+    expected = hashlib.sha256(json.dumps(document, sort_keys=True, separators=(",", ":")).encode()).hexdigest()
+    assert _compute_token_hash(document) == expected
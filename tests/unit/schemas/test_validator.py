@@ -0,0 +1,50 @@
+"""Tests for package-data schema validation."""
+
+import os
+import subprocess
+import sys
+from pathlib import Path
+
+import pytest
+
+from taskx.schemas import validator
+from taskx.schemas.validator import validate_data
+
+REPO_ROOT = Path(__file__).resolve().parents[3]
+
+
+def test_validator_is_compiled_once_per_schema() -> None:
+    validator._get_validator.cache_clear()
+
+    validate_data({}, "loop_envelope", strict=False)
+    validate_data({}, "loop_envelope", strict=False)
+
+    info = validator._get_validator.cache_info()
+    assert info.misses == 1
+    assert info.hits == 1
+
+
+def test_cached_validator_reports_errors() -> None:
+    ok, errors = validate_data({}, "loop_envelope", strict=False)
+    assert not ok
+    assert errors
+
+    with pytest.raises(ValueError, match="Schema validation failed for 'loop_envelope'"):
+        validate_data({}, "loop_envelope", strict=True)
+
+
+def test_importing_validator_defers_jsonschema() -> None:
+    code = (
+        "import sys\n"
+        "import taskx.pipeline.promotion.gate\n"
+        "import taskx.pipeline.spec_feedback.feedback\n"
+        "assert 'jsonschema' not in sys.modules\n"
+        "from taskx.schemas.validator import validate_data\n"
+        "validate_data({}, 'loop_envelope', strict=False)\n"
+        "assert 'jsonschema' in sys.modules\n"
+    )
+    env = dict(os.environ)
+    src_path = str(REPO_ROOT / "src")
+    existing_pythonpath = env.get("PYTHONPATH")
+    env["PYTHONPATH"] = f"{src_path}:{existing_pythonpath}" if existing_pythonpath else src_path
+    subprocess.run([sys.executable, "-c", code], env=env, check=True)
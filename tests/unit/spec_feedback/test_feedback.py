@@ -0,0 +1,70 @@
+"""Unit tests for spec feedback input loading."""
+
+from __future__ import annotations
+
+from typing import TYPE_CHECKING
+
+from taskx.pipeline.spec_feedback import feedback
+
+if TYPE_CHECKING:
+    from pathlib import Path
+
+    import pytest
+
+
+def test_load_run_summaries_skips_missing_and_sorts(tmp_path: Path, monkeypatch: pytest.MonkeyPatch) -> None:
+    validated: list[str] = []
+
+    def _validate(data: dict, schema_name: str, strict: bool = True) -> tuple[bool, list[str]]:
+        validated.append(schema_name)
+        return True, []
+
+    monkeypatch.setattr(feedback, "validate_data", _validate)
+    run_paths = []
+    for run_id in ("RUN_B", "RUN_MISSING", "RUN_A"):
+        run_path = tmp_path / run_id
+        run_path.mkdir()
+        if run_id != "RUN_MISSING":
+            (run_path / "RUN_SUMMARY.json").write_text(f'{{"run_id": "{run_id}", "note": "ü"}}', encoding="utf-8")
+        run_paths.append(run_path)
+
+    summaries = feedback._load_run_summaries(run_paths, max_runs=200)
+
+    assert summaries == [{"run_id": "RUN_A", "note": "ü"}, {"run_id": "RUN_B", "note": "ü"}]
+    assert validated == ["run_summary", "run_summary"]
+
+
+def test_input_hash_covers_task_queue_bytes_and_sorted_summaries() -> None:
+    import hashlib
+
+    summaries = [{"hashes": {"summary_hash": "b" * 64}}, {"hashes": {"summary_hash": "a" * 64}}]
+    tq_hash = hashlib.sha256(b'{"packets": []}').hexdigest()
+    expected = hashlib.sha256((tq_hash + "a" * 64 + "b" * 64).encode()).hexdigest()
+
+    assert feedback._compute_input_hash(b'{"packets": []}', summaries) == expected
+
+
+def test_merge_patches_folds_each_op_and_keeps_all_evidence() -> None:
+    from taskx.pipeline.spec_feedback.types import Evidence, Patch
+
+    def _patch(op: str, value: object, run_id: str) -> Patch:
+        return Patch("T1", op, value, f"{op} from {run_id}", [Evidence(run_id, "C1")])
+
+    patches = [
+        _patch("set_risk", "med", "RUN_A"),
+        _patch("set_priority", 5, "RUN_A"),
+        _patch("append_note", "later", "RUN_B"),
+        _patch("set_risk", "high", "RUN_B"),
+        _patch("set_priority", 5, "RUN_B"),
+        _patch("append_note", "earlier", "RUN_A"),
+    ]
+
+    merged = feedback._merge_patches({"T1": patches})
+
+    assert [(p.op, p.value, p.reason) for p in merged] == [
+        ("set_risk", "high", "set_risk from RUN_B"),
+        ("set_priority", 5, "Task completed successfully"),
+        ("append_note", "earlier", "append_note from RUN_A"),
+        ("append_note", "later", "append_note from RUN_B"),
+    ]
+    assert [e.run_id for e in merged[0].evidence] == ["RUN_A", "RUN_B"]
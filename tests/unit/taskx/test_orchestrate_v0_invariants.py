@@ -295,3 +295,79 @@ def test_manual_handoff_chunks_do_not_include_timestamps(tmp_path: Path) -> None
     )
     for chunk in route_plan["handoff_chunks"]:
         assert not timestamp_pattern.search(chunk["instructions_block"])
+
+
+def test_orchestrate_reuses_repo_root_lookup_for_same_packet_dir(monkeypatch, tmp_path: Path) -> None:
+    repo = create_taskx_repo(tmp_path / "repo")
+    first = _write_packet(repo, {"task_id": "batch-one", "steps": ["alpha"]}, name="one.json")
+    second = _write_packet(repo, {"task_id": "batch-two", "steps": ["alpha"]}, name="two.json")
+
+    calls: list[Path] = []
+    real_find = kernel.find_taskx_repo_root
+
+    def _counting_find(start: Path) -> Path | None:
+        calls.append(start)
+        return real_find(start)
+
+    kernel._cached_repo_root.cache_clear()
+    monkeypatch.setattr(kernel, "find_taskx_repo_root", _counting_find)
+    try:
+        assert Path(orchestrate(str(first))["run_dir"]).is_relative_to(repo.resolve())
+        assert Path(orchestrate(str(second))["run_dir"]).is_relative_to(repo.resolve())
+    finally:
+        kernel._cached_repo_root.cache_clear()
+
+    assert calls == [repo.resolve()]
+
+
+def test_orchestrate_keys_run_dir_on_raw_packet_bytes(tmp_path: Path) -> None:
+    import hashlib
+
+    repo = create_taskx_repo(tmp_path / "repo")
+    packet = repo / "binary.json"
+    packet.write_bytes(b"\xff\xfe not utf-8")
+
+    outcome = orchestrate(str(packet))
+
+    assert outcome["status"] == "refused"
+    assert outcome["reason"] == "INVALID_PACKET_JSON"
+    assert Path(outcome["run_dir"]).name == hashlib.sha256(packet.read_bytes()).hexdigest()[:16]
+
+
+def test_orchestrate_keys_parsed_packet_run_dir_on_canonical_json(tmp_path: Path) -> None:
+    import hashlib
+
+    repo = create_taskx_repo(tmp_path / "repo")
+    payload = _manual_packet()
+    compact = _write_packet(repo, payload, name="compact.json")
+    pretty = repo / "pretty.json"
+    pretty.write_text(json.dumps(dict(reversed(payload.items())), indent=4) + "\n", encoding="utf-8")
+
+    compact_run_dir = Path(orchestrate(str(compact))["run_dir"])
+    pretty_run_dir = Path(orchestrate(str(pretty))["run_dir"])
+
+    expected = hashlib.sha256(canonical_dumps(payload).encode("utf-8")).hexdigest()[:16]
+    assert compact_run_dir.name == expected
+    assert pretty_run_dir == compact_run_dir
+
+
+def test_packet_refusal_route_plans_do_not_share_policy_state(tmp_path: Path) -> None:
+    first = kernel._packet_refusal_route_plan(repo_root=tmp_path, packet_path=tmp_path / "a.json", reason="x")
+    first["policy"]["escalation_ladder"].append("mutated")
+
+    second = kernel._packet_refusal_route_plan(repo_root=tmp_path, packet_path=tmp_path / "b.json", reason="y")
+
+    assert "mutated" not in second["policy"]["escalation_ladder"]
+
+
+def test_first_incomplete_step_reads_sentinels_from_run_dir(tmp_path: Path) -> None:
+    steps = kernel._route_steps({"steps": [{"step": "alpha"}, "ignored", {"step": "beta-two"}]})
+    assert len(steps) == 2
+
+    assert kernel._first_incomplete_step(steps, tmp_path / "missing") == "alpha"
+
+    (tmp_path / "STEP_ALPHA.DONE").write_text("", encoding="utf-8")
+    assert kernel._first_incomplete_step(steps, tmp_path) == "beta-two"
+
+    (tmp_path / "STEP_BETA_TWO.DONE").write_text("", encoding="utf-8")
+    assert kernel._first_incomplete_step(steps, tmp_path) is None
@@ -0,0 +1,170 @@
+"""Unit tests for taskx tp git GitHub helpers."""
+
+from __future__ import annotations
+
+import json
+from pathlib import Path
+
+import pytest
+
+from taskx.ops.tp_git import github
+from taskx.ops.tp_git.exec import ExecResult
+
+
+def _result(argv: list[str], stdout: str = "", stderr: str = "", code: int = 0) -> ExecResult:
+    return ExecResult(argv=tuple(argv), cwd=Path("/repo"), returncode=code, stdout=stdout, stderr=stderr)
+
+
+class _CommandStub:
+    def __init__(self, outputs: dict[tuple[str, ...], ExecResult]):
+        self.outputs = outputs
+        self.calls: list[tuple[tuple[str, ...], float | None]] = []
+
+    def __call__(
+        self,
+        argv: list[str],
+        *,
+        cwd: Path,
+        check: bool = True,
+        timeout: float | None = None,
+    ) -> ExecResult:
+        _ = (cwd, check)
+        key = tuple(argv)
+        self.calls.append((key, timeout))
+        if key not in self.outputs:
+            raise AssertionError(f"missing stub for argv: {argv}")
+        return self.outputs[key]
+
+
+_AUTH = ("gh", "auth", "status")
+_WATCH = ("gh", "pr", "checks", "--watch", "--fail-fast")
+_VIEW = ("gh", "pr", "view", "--json", "url,state,mergeStateStatus,autoMergeRequest")
+
+
+@pytest.fixture
+def _worktree(monkeypatch: pytest.MonkeyPatch, tmp_path: Path) -> Path:
+    worktree = tmp_path / ".worktrees" / "TP-0001"
+    worktree.mkdir(parents=True)
+    monkeypatch.setattr(github, "resolve_repo_root", lambda repo: tmp_path)
+    return worktree
+
+
+def test_pr_wait_returns_view_after_checks_settle(monkeypatch: pytest.MonkeyPatch, _worktree: Path) -> None:
+    stub = _CommandStub(
+        {
+            _AUTH: _result(list(_AUTH)),
+            _WATCH: _result(list(_WATCH), stdout="All checks were successful\n"),
+            _VIEW: _result(list(_VIEW), stdout='{"state": "MERGED", "url": "https://example.invalid/pr/1"}'),
+        }
+    )
+    monkeypatch.setattr(github, "run_command", stub)
+
+    payload = github.pr_wait(tp_id="TP-0001", repo=Path("/repo"), timeout_sec=30)
+
+    assert payload["state"] == "MERGED"
+    assert (_WATCH, 30) in stub.calls
+
+
+def test_pr_wait_raises_when_watch_unavailable(monkeypatch: pytest.MonkeyPatch, _worktree: Path) -> None:
+    stub = _CommandStub(
+        {
+            _AUTH: _result(list(_AUTH)),
+            _WATCH: _result(list(_WATCH), stderr="no checks reported on the 'tp/0001' branch\n", code=1),
+        }
+    )
+    monkeypatch.setattr(github, "run_command", stub)
+
+    with pytest.raises(RuntimeError, match="gh pr checks --watch failed"):
+        _ = github.pr_wait(tp_id="TP-0001", repo=Path("/repo"), timeout_sec=30)
+
+
+def test_pr_create_and_auto_merge_reports_merge_error(monkeypatch: pytest.MonkeyPatch, _worktree: Path) -> None:
+    create = ("gh", "pr", "create", "--title", "TP-0001: demo", "--body", "body")
+    merge = ("gh", "pr", "merge", "--auto", "--delete-branch", "--squash")
+    stub = _CommandStub(
+        {
+            _AUTH: _result(list(_AUTH)),
+            create: _result(list(create), stdout="https://example.invalid/pr/1\n"),
+            merge: _result(list(merge), stderr="auto-merge is not allowed\n", code=1),
+            _VIEW: _result(list(_VIEW), stdout='{"state": "OPEN", "url": "https://example.invalid/pr/1"}'),
+        }
+    )
+    monkeypatch.setattr(github, "run_command", stub)
+
+    def _git(args: list[str], *, repo_root: Path, check: bool = True) -> ExecResult:
+        _ = (repo_root, check)
+        return _result(["git", *args], stdout="tp/0001-demo\n" if "rev-parse" in args else "")
+
+    monkeypatch.setattr(github, "run_git", _git)
+
+    payload = github.pr_create_and_auto_merge(tp_id="TP-0001", title="TP-0001: demo", body="body")
+
+    assert payload["pr"]["state"] == "OPEN"
+    assert payload["pr"]["branch"] == "tp/0001-demo"
+    assert "merge" not in payload
+    assert "auto-merge is not allowed" in payload["merge_error"]
+    assert [call for call, _ in stub.calls].count(_AUTH) == 1
+    assert [call for call, _ in stub.calls].count(_VIEW) == 1
+
+
+def test_pr_poll_uses_etag_and_handles_not_modified(monkeypatch: pytest.MonkeyPatch) -> None:
+    endpoint = ("gh", "api", "--include", "repos/octo/demo/pulls/7")
+    conditional = (*endpoint, "-H", 'If-None-Match: W/"abc"')
+    stub = _CommandStub(
+        {
+            endpoint: _result(
+                list(endpoint),
+                stdout=(
+                    "HTTP/2.0 200 OK\r\nEtag: W/\"abc\"\r\n\r\n"
+                    '{"html_url": "https://github.com/octo/demo/pull/7", "state": "closed", "merged": true}'
+                ),
+            ),
+            conditional: _result(list(conditional), stdout='HTTP/2.0 304 Not Modified\r\nEtag: W/"abc"\r\n\r\n', code=1),
+        }
+    )
+    monkeypatch.setattr(github, "run_command", stub)
+
+    payload, etag = github.pr_poll(pr_url="https://github.com/octo/demo/pull/7", repo_root=Path("/repo"))
+    assert payload is not None
+    assert payload["state"] == "MERGED"
+    assert etag == 'W/"abc"'
+
+    payload, etag = github.pr_poll(pr_url="https://github.com/octo/demo/pull/7", repo_root=Path("/repo"), etag=etag)
+    assert payload is None
+    assert etag == 'W/"abc"'
+
+
+def test_pr_poll_maps_auto_merge_to_gh_pr_view_names(monkeypatch: pytest.MonkeyPatch) -> None:
+    endpoint = ("gh", "api", "--include", "repos/octo/demo/pulls/7")
+    raw = {
+        "html_url": "https://github.com/octo/demo/pull/7",
+        "state": "open",
+        "merged": False,
+        "mergeable_state": "blocked",
+        "auto_merge": {
+            "enabled_by": {"login": "octocat", "id": 1},
+            "merge_method": "squash",
+            "commit_title": "TP-0001: demo (#7)",
+            "commit_message": "body",
+        },
+    }
+    stub = _CommandStub(
+        {endpoint: _result(list(endpoint), stdout=f"HTTP/2.0 200 OK\r\n\r\n{json.dumps(raw)}")}
+    )
+    monkeypatch.setattr(github, "run_command", stub)
+
+    payload, _ = github.pr_poll(pr_url="https://github.com/octo/demo/pull/7", repo_root=Path("/repo"))
+
+    assert payload == {
+        "url": "https://github.com/octo/demo/pull/7",
+        "state": "OPEN",
+        "mergeStateStatus": "BLOCKED",
+        "autoMergeRequest": {
+            "authorEmail": None,
+            "commitBody": "body",
+            "commitHeadline": "TP-0001: demo (#7)",
+            "enabledAt": None,
+            "enabledBy": {"login": "octocat"},
+            "mergeMethod": "SQUASH",
+        },
+    }
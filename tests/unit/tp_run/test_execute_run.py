@@ -0,0 +1,109 @@
+"""Unit tests for the taskx tp run stage machine."""
+
+from __future__ import annotations
+
+import asyncio
+import dataclasses
+import json
+import shlex
+import sys
+from types import SimpleNamespace
+from typing import TYPE_CHECKING
+
+from taskx.ops.tp_git.exec import ExecResult
+from taskx.ops.tp_run import plan
+from taskx.ops.tp_run.proof import ProofWriter, resolve_paths
+
+if TYPE_CHECKING:
+    from pathlib import Path
+
+    import pytest
+
+_HEAD = "0123456789abcdef0123456789abcdef01234567"
+
+
+def _stub_stages(monkeypatch: pytest.MonkeyPatch, worktree: Path) -> None:
+    def _run_git(args: list[str], *, repo_root: Path, check: bool = True) -> ExecResult:
+        _ = check
+        stdout = f"{_HEAD}\n" if args[-2:] == ["rev-parse", "HEAD"] else ""
+        return ExecResult(argv=("git", *args), cwd=repo_root, returncode=0, stdout=stdout, stderr="")
+
+    monkeypatch.setattr(plan, "_capture_precheck", lambda repo_root: "precheck\n")
+    monkeypatch.setattr(plan, "run_doctor", lambda *, repo: SimpleNamespace(branch="main"))
+    monkeypatch.setattr(
+        plan,
+        "start_tp",
+        lambda **_: SimpleNamespace(worktree_path=worktree, branch="tp/TP-0001-demo"),
+    )
+    monkeypatch.setattr(plan, "run_git", _run_git)
+
+
+def _options(tmp_path: Path, worktree: Path) -> plan.RunOptions:
+    worktree.mkdir()
+    test_cmd = f"{shlex.quote(sys.executable)} -c \"print('tests ok')\""
+    return plan.RunOptions(
+        repo_root=tmp_path,
+        tp_id="TP-0001",
+        slug="demo",
+        run_id="run-1",
+        stop_after="test",
+        test_cmd=test_cmd,
+    )
+
+
+def _assert_stopped_after_test(result: plan.RunResult, writer: ProofWriter, worktree: Path) -> None:
+    assert result.exit_code == 0
+    assert result.message == "stopped after test"
+    assert result.worktree_path == worktree
+    run_dir = writer.paths.run_dir
+    assert (run_dir / "PRECHECK.txt").read_text(encoding="utf-8") == "precheck\n"
+    assert "tests ok" in (run_dir / "TESTS.txt").read_text(encoding="utf-8")
+    assert json.loads((run_dir / "EXIT.json").read_text(encoding="utf-8"))["reason"] == "stopped after test"
+    run = json.loads((run_dir / "RUN.json").read_text(encoding="utf-8"))
+    assert run["git_shas"] == {"main_before": _HEAD, "worktree_head": _HEAD}
+
+
+def test_execute_run_runs_doctor_start_and_test(monkeypatch: pytest.MonkeyPatch, tmp_path: Path) -> None:
+    worktree = tmp_path / "wt"
+    _stub_stages(monkeypatch, worktree)
+    options = _options(tmp_path, worktree)
+    writer = ProofWriter(resolve_paths(repo_root=tmp_path, tp_id="TP-0001", run_id="run-1"))
+
+    result = plan.execute_run(options, writer)
+
+    _assert_stopped_after_test(result, writer, worktree)
+
+
+def test_execute_run_works_inside_running_loop(monkeypatch: pytest.MonkeyPatch, tmp_path: Path) -> None:
+    worktree = tmp_path / "wt"
+    _stub_stages(monkeypatch, worktree)
+    options = _options(tmp_path, worktree)
+    writer = ProofWriter(resolve_paths(repo_root=tmp_path, tp_id="TP-0001", run_id="run-1"))
+
+    async def _drive() -> plan.RunResult:
+        return plan.execute_run(options, writer)
+
+    result = asyncio.run(_drive())
+
+    _assert_stopped_after_test(result, writer, worktree)
+
+
+def test_wait_merge_skips_watch_when_merge_reports_merged(monkeypatch: pytest.MonkeyPatch, tmp_path: Path) -> None:
+    worktree = tmp_path / "wt"
+    _stub_stages(monkeypatch, worktree)
+    merged = {"url": "https://github.com/octo/demo/pull/7", "state": "MERGED"}
+    monkeypatch.setattr(plan, "pr_create_and_auto_merge", lambda **_: {"pr": merged, "merge": merged})
+
+    def _pr_wait(**_: object) -> dict[str, object]:
+        raise AssertionError("pr_wait must not block on an already merged PR")
+
+    monkeypatch.setattr(plan, "pr_wait", _pr_wait)
+    monkeypatch.setattr(plan, "sync_main", lambda **_: {"repo_root": str(tmp_path), "fetch": "ok", "pull": "ok"})
+    options = dataclasses.replace(_options(tmp_path, worktree), stop_after="sync", wait_merge=True)
+    writer = ProofWriter(resolve_paths(repo_root=tmp_path, tp_id="TP-0001", run_id="run-1"))
+
+    result = plan.execute_run(options, writer)
+
+    assert result.exit_code == 0
+    assert result.message == "stopped after sync"
+    assert result.merged_confirmed
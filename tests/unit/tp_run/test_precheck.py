@@ -0,0 +1,88 @@
+"""Unit tests for taskx tp run precheck capture."""
+
+from __future__ import annotations
+
+from pathlib import Path
+from typing import TYPE_CHECKING
+
+from taskx.ops.tp_git.exec import ExecResult
+from taskx.ops.tp_run import plan
+
+if TYPE_CHECKING:
+    import pytest
+
+
+class _GitStub:
+    def __init__(self, outputs: dict[tuple[str, ...], ExecResult]):
+        self.outputs = outputs
+        self.calls: list[tuple[str, ...]] = []
+
+    def __call__(self, args: list[str], *, repo_root: Path, check: bool = True) -> ExecResult:
+        _ = (repo_root, check)
+        key = tuple(args)
+        self.calls.append(key)
+        if key not in self.outputs:
+            raise AssertionError(f"missing stub for args: {args}")
+        return self.outputs[key]
+
+
+def _result(args: list[str], stdout: str = "", code: int = 0) -> ExecResult:
+    return ExecResult(argv=("git", *args), cwd=Path("/repo"), returncode=code, stdout=stdout, stderr="")
+
+
+_REMOTE_CONFIG = ("config", "--get-regexp", r"^remote\.")
+
+
+def _local_outputs(remote_config: str) -> dict[tuple[str, ...], ExecResult]:
+    return {
+        _REMOTE_CONFIG: _result(list(_REMOTE_CONFIG), stdout=remote_config, code=0 if remote_config else 1),
+        ("rev-parse", "--abbrev-ref", "HEAD"): _result(["rev-parse", "--abbrev-ref", "HEAD"], stdout="main\n"),
+        ("status", "--porcelain"): _result(["status", "--porcelain"]),
+        ("stash", "list"): _result(["stash", "list"]),
+    }
+
+
+def test_precheck_skips_fetch_and_pull_without_remote(monkeypatch: pytest.MonkeyPatch, tmp_path: Path) -> None:
+    stub = _GitStub(_local_outputs(remote_config=""))
+    monkeypatch.setattr(plan, "run_git", stub)
+
+    text = plan._capture_precheck(tmp_path)
+
+    assert ("fetch", "--all", "--prune") not in stub.calls
+    assert ("pull", "--ff-only") not in stub.calls
+    assert text.count("[skipped: no remote]") == 2
+
+
+def test_precheck_skips_fetch_when_stamp_is_fresh(monkeypatch: pytest.MonkeyPatch, tmp_path: Path) -> None:
+    outputs = _local_outputs(remote_config="remote.origin.url git@example.invalid:demo.git\n")
+    outputs[("fetch", "--all", "--prune")] = _result(["fetch", "--all", "--prune"])
+    outputs[("pull", "--ff-only")] = _result(["pull", "--ff-only"], stdout="Already up to date.\n")
+    stub = _GitStub(outputs)
+    monkeypatch.setattr(plan, "run_git", stub)
+    (tmp_path / ".git").mkdir()
+
+    _ = plan._capture_precheck(tmp_path)
+    assert ("fetch", "--all", "--prune") in stub.calls
+    assert (tmp_path / ".git" / "taskx_fetch_stamp").exists()
+
+    stub.calls.clear()
+    text = plan._capture_precheck(tmp_path)
+    assert ("fetch", "--all", "--prune") not in stub.calls
+    assert ("pull", "--ff-only") in stub.calls
+    assert "[skipped: fetched <60s ago]" in text
+
+
+def test_precheck_uses_blobless_fetch_for_promisor_origin(monkeypatch: pytest.MonkeyPatch, tmp_path: Path) -> None:
+    fetch = ("-c", "protocol.version=2", "fetch", "--all", "--prune", "--filter=blob:none")
+    outputs = _local_outputs(
+        remote_config="remote.origin.url git@example.invalid:demo.git\nremote.origin.promisor true\n"
+    )
+    outputs[fetch] = _result(list(fetch))
+    outputs[("pull", "--ff-only")] = _result(["pull", "--ff-only"])
+    stub = _GitStub(outputs)
+    monkeypatch.setattr(plan, "run_git", stub)
+
+    text = plan._capture_precheck(tmp_path)
+
+    assert fetch in stub.calls
+    assert "$ git -c protocol.version=2 fetch --all --prune --filter=blob:none" in text
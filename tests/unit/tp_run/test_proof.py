@@ -0,0 +1,24 @@
+"""Unit tests for the taskx tp run proof writer."""
+
+from __future__ import annotations
+
+import json
+from typing import TYPE_CHECKING
+
+from taskx.ops.tp_run.proof import ProofWriter, resolve_paths
+
+if TYPE_CHECKING:
+    from pathlib import Path
+
+
+def test_write_batch_writes_text_and_canonical_json(tmp_path: Path) -> None:
+    writer = ProofWriter(resolve_paths(repo_root=tmp_path, tp_id="TP-0001", run_id="run-1"))
+    (writer.paths.run_dir / "BANNER.txt").write_text("stale content that is longer\n", encoding="utf-8")
+
+    written = writer.write_batch([("BANNER.txt", "banner\n"), ("EXIT.json", {"run_id": "run-1", "exit_code": 0})])
+
+    assert written == [writer.paths.run_dir / "BANNER.txt", writer.paths.run_dir / "EXIT.json"]
+    assert (writer.paths.run_dir / "BANNER.txt").read_text(encoding="utf-8") == "banner\n"
+    exit_text = (writer.paths.run_dir / "EXIT.json").read_text(encoding="utf-8")
+    assert exit_text == '{"exit_code":0,"run_id":"run-1"}'
+    assert json.loads(exit_text)["exit_code"] == 0
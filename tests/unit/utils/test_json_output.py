@@ -0,0 +1,42 @@
+"""Tests for schema-validated JSON writers."""
+
+import json
+from pathlib import Path
+
+from taskx.utils.json_output import _dumps_pretty
+
+
+def test_dumps_pretty_matches_stdlib_layout() -> None:
+    data = {
+        "zeta": "é ✓",
+        "alpha": {"nested": [1, 2, {"x": None}], "empty": {}, "none": []},
+        "flag": True,
+        "confidence": 0.9,
+    }
+
+    assert _dumps_pretty(data) == json.dumps(data, indent=2, ensure_ascii=False).encode("utf-8")
+
+
+def test_dumps_pretty_keeps_stdlib_float_spelling() -> None:
+    data = {"small": 1e-05, "large": [1e20, {"nan": float("nan"), "inf": float("-inf")}]}
+
+    assert _dumps_pretty(data) == json.dumps(data, indent=2, ensure_ascii=False).encode("utf-8")
+
+
+def test_dumps_pretty_falls_back_for_non_str_keys() -> None:
+    data = {"counts": {1: "one"}}
+
+    assert _dumps_pretty(data) == json.dumps(data, indent=2, ensure_ascii=False).encode("utf-8")
+
+
+def test_write_json_strict_replaces_target_without_leaving_temp(tmp_path: Path) -> None:
+    from taskx.utils.json_output import write_json_strict
+
+    output_path = tmp_path / "out" / "LOOP_ENVELOPE.json"
+    output_path.parent.mkdir()
+    output_path.write_text("stale", encoding="utf-8")
+
+    write_json_strict(data={"a": 1}, output_path=output_path, schema_name="loop_envelope", skip_validation=True)
+
+    assert json.loads(output_path.read_text(encoding="utf-8")) == {"a": 1}
+    assert [p.name for p in output_path.parent.iterdir()] == ["LOOP_ENVELOPE.json"]